@@ -20,6 +20,7 @@ from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
 from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.session import ProviderSession
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -183,7 +184,7 @@ class AcceptsAnArrayOfBytesMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -230,7 +231,7 @@ class AcceptsBytesMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -272,7 +273,7 @@ class ComplexInputComplexOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -334,7 +335,7 @@ class EcrecoverFnMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -419,7 +420,7 @@ class EmitSimpleEventMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -462,7 +463,7 @@ class MethodAcceptingArrayOfArrayOfStructsMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -514,7 +515,7 @@ class MethodAcceptingArrayOfStructsMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -564,7 +565,7 @@ class MethodReturningArrayOfStructsMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -603,7 +604,7 @@ class MethodReturningMultipleValuesMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -637,7 +638,7 @@ class MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -670,7 +671,7 @@ class MultiInputMultiOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -752,7 +753,7 @@ class NestedStructInputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -796,7 +797,7 @@ class NestedStructOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -829,7 +830,7 @@ class NoInputNoOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -859,7 +860,7 @@ class NoInputSimpleOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -890,7 +891,7 @@ class NonPureMethodMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -934,7 +935,7 @@ class NonPureMethodThatReturnsNothingMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -977,7 +978,7 @@ class OverloadedMethod2Method(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1019,7 +1020,7 @@ class OverloadedMethod1Method(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1061,7 +1062,7 @@ class PureFunctionWithConstantMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1090,7 +1091,7 @@ class RequireWithConstantMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1118,7 +1119,7 @@ class RevertWithConstantMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1146,7 +1147,7 @@ class SimpleInputNoOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1194,7 +1195,7 @@ class SimpleInputSimpleOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1243,7 +1244,7 @@ class SimplePureFunctionMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1272,7 +1273,7 @@ class SimplePureFunctionWithInputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1317,7 +1318,7 @@ class SimpleRequireMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1345,7 +1346,7 @@ class SimpleRevertMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1373,7 +1374,7 @@ class StructInputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1415,7 +1416,7 @@ class StructOutputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
     ):
@@ -1451,7 +1452,7 @@ class WithAddressInputMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1542,7 +1543,7 @@ class WithdrawMethod(ContractMethod):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
@@ -1770,14 +1771,15 @@ class AbiGenDummy:
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         validator: AbiGenDummyValidator = None,
     ):
         """Get an instance of wrapper for smart contract.
 
-        :param web3_or_provider: Either an instance of `web3.Web3`:code: or
-            `web3.providers.base.BaseProvider`:code:
+        :param web3_or_provider: Either an instance of `web3.Web3`:code:, of
+            `web3.providers.base.BaseProvider`:code:, or of
+            `zero_ex.contract_wrappers.session.ProviderSession`:code:
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
         """
@@ -1791,14 +1793,16 @@ class AbiGenDummy:
             )
 
         web3 = None
-        if isinstance(web3_or_provider, BaseProvider):
+        if isinstance(web3_or_provider, ProviderSession):
+            web3 = web3_or_provider.web3
+        elif isinstance(web3_or_provider, BaseProvider):
             web3 = Web3(web3_or_provider)
         elif isinstance(web3_or_provider, Web3):
             web3 = web3_or_provider
         else:
             raise TypeError(
                 "Expected parameter 'web3_or_provider' to be an instance of either"
-                + " Web3 or BaseProvider"
+                + " Web3, BaseProvider or ProviderSession"
             )
 
         # if any middleware was imported, inject it
@@ -20,6 +20,7 @@ from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
 from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.session import ProviderSession
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -52,14 +53,15 @@ class LibDummy:
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         validator: LibDummyValidator = None,
     ):
         """Get an instance of wrapper for smart contract.
 
-        :param web3_or_provider: Either an instance of `web3.Web3`:code: or
-            `web3.providers.base.BaseProvider`:code:
+        :param web3_or_provider: Either an instance of `web3.Web3`:code:, of
+            `web3.providers.base.BaseProvider`:code:, or of
+            `zero_ex.contract_wrappers.session.ProviderSession`:code:
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
         """
@@ -71,14 +73,16 @@ class LibDummy:
             validator = LibDummyValidator(web3_or_provider, contract_address)
 
         web3 = None
-        if isinstance(web3_or_provider, BaseProvider):
+        if isinstance(web3_or_provider, ProviderSession):
+            web3 = web3_or_provider.web3
+        elif isinstance(web3_or_provider, BaseProvider):
             web3 = Web3(web3_or_provider)
         elif isinstance(web3_or_provider, Web3):
             web3 = web3_or_provider
         else:
             raise TypeError(
                 "Expected parameter 'web3_or_provider' to be an instance of either"
-                + " Web3 or BaseProvider"
+                + " Web3, BaseProvider or ProviderSession"
             )
 
         # if any middleware was imported, inject it
@@ -11,9 +11,8 @@ Install the package with pip::
 
 from enum import Enum
 import json
-from typing import Dict, NamedTuple
-
-from pkg_resources import resource_string
+from pkgutil import get_data
+from typing import cast, Dict, NamedTuple
 
 
 class ContractAddresses(NamedTuple):
@@ -113,8 +112,12 @@ class _AddressCache:
         try:
             return cls._chain_to_addresses[str(chain_id.value)]
         except KeyError:
+            # pkgutil, unlike pkg_resources, costs nothing to import:
             cls._chain_to_addresses = json.loads(
-                resource_string("zero_ex.contract_addresses", "addresses.json")
+                cast(
+                    bytes,
+                    get_data("zero_ex.contract_addresses", "addresses.json"),
+                )
             )
             return cls._chain_to_addresses[str(chain_id.value)]
 
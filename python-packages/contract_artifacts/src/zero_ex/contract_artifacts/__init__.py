@@ -9,8 +9,8 @@ Install the package with pip::
 """
 
 import json
-from typing import Dict
-from pkg_resources import resource_string
+from pkgutil import get_data
+from typing import cast, Dict
 
 
 class _ArtifactCache:
@@ -29,10 +29,14 @@ class _ArtifactCache:
         try:
             return cls._contract_name_to_abi[contract_name]
         except KeyError:
+            # pkgutil, unlike pkg_resources, costs nothing to import:
             cls._contract_name_to_abi[contract_name] = json.loads(
-                resource_string(
-                    "zero_ex.contract_artifacts",
-                    f"artifacts/{contract_name}.json",
+                cast(
+                    bytes,
+                    get_data(
+                        "zero_ex.contract_artifacts",
+                        f"artifacts/{contract_name}.json",
+                    ),
                 )
             )["compilerOutput"]["abi"]
             return cls._contract_name_to_abi[contract_name]
@@ -1,11 +1,13 @@
 """Base wrapper class for accessing ethereum smart contracts."""
 
-from typing import Any, Union
+from typing import Any, Optional, Union
 
-from eth_utils import is_address, to_checksum_address
 from web3 import Web3
 from web3.providers.base import BaseProvider
 
+from zero_ex.dev_utils.address_cache import normalize_address
+
+from .session import ProviderSession, to_web3
 from .tx_params import TxParams
 
 
@@ -14,7 +16,7 @@ class Validator:
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
     ):
         """Initialize the instance."""
@@ -36,44 +38,51 @@ class ContractMethod:
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
         validator: Validator = None,
     ):
         """Instantiate the object.
 
-        :param provider: Instance of :class:`web3.providers.base.BaseProvider`
+        :param web3_or_provider: Either an instance of `web3.Web3`:code:, of
+            `web3.providers.base.BaseProvider`:code:, or of
+            `zero_ex.contract_wrappers.session.ProviderSession`:code:.  With
+            a session, the default account is fetched only once per session.
         :param contract_address: Where the contract has been deployed to.
         :param validator: Used to validate method inputs.
         """
-        web3 = None
-        if isinstance(web3_or_provider, BaseProvider):
-            web3 = Web3(web3_or_provider)
-        elif isinstance(web3_or_provider, Web3):
-            web3 = web3_or_provider
-        if web3 is None:
-            raise TypeError(
-                "Expected parameter 'web3_or_provider' to be an instance of either"
-                + " Web3 or BaseProvider"
-            )
-
-        self._web3_eth = web3.eth  # pylint: disable=no-member
+        self._session: Optional[ProviderSession] = (
+            web3_or_provider
+            if isinstance(web3_or_provider, ProviderSession)
+            else None
+        )
+        self._web3_eth = to_web3(
+            web3_or_provider
+        ).eth  # pylint: disable=no-member
         if validator is None:
             validator = Validator(web3_or_provider, contract_address)
         self.validator = validator
 
     @staticmethod
     def validate_and_checksum_address(address: str):
-        """Validate the given address, and return it's checksum address."""
-        if not is_address(address):
+        """Validate the given address, and return it's checksum address.
+
+        Results are memoized in
+        `zero_ex.dev_utils.address_cache.ADDRESS_CACHE`:code:, shared with
+        `zero_ex.dev_utils.type_assertions.assert_is_address()`:code:.
+        """
+        checksummed = normalize_address(address)
+        if checksummed is None:
             raise TypeError("Invalid address provided: {}".format(address))
-        return to_checksum_address(address)
+        return checksummed
 
     def normalize_tx_params(self, tx_params) -> TxParams:
         """Normalize and return the given transaction parameters."""
         if not tx_params:
             tx_params = TxParams()
-        if not tx_params.from_:
+        if not tx_params.from_ and self._session is not None:
+            tx_params.from_ = self._session.default_account
+        elif not tx_params.from_:
             tx_params.from_ = self._web3_eth.defaultAccount or (
                 self._web3_eth.accounts[0]
                 if len(self._web3_eth.accounts) > 0
@@ -5,10 +5,11 @@ from typing import Any, Union
 from web3 import Web3
 from web3.providers.base import BaseProvider
 
-from zero_ex import json_schemas
 from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
+from zero_ex.json_schemas import get_validation_policy
 
 from ..bases import Validator
+from ..session import ProviderSession, to_web3
 
 
 class ExchangeValidator(Validator):
@@ -16,25 +17,19 @@ class ExchangeValidator(Validator):
 
     def __init__(
         self,
-        web3_or_provider: Union[Web3, BaseProvider],
+        web3_or_provider: Union[Web3, BaseProvider, ProviderSession],
         contract_address: str,
     ):
         """Initialize the class."""
         super().__init__(web3_or_provider, contract_address)
 
-        web3 = None
-        if isinstance(web3_or_provider, BaseProvider):
-            web3 = Web3(web3_or_provider)
-        elif isinstance(web3_or_provider, Web3):
-            web3 = web3_or_provider
-        if web3 is None:
-            raise TypeError(
-                "Expected parameter 'web3_or_provider' to be an instance of either"
-                + " Web3 or BaseProvider"
-            )
-
         self.contract_address = contract_address
-        self.chain_id = web3.eth.chainId
+        if isinstance(web3_or_provider, ProviderSession):
+            self.chain_id = web3_or_provider.chain_id
+        else:
+            self.chain_id = to_web3(
+                web3_or_provider
+            ).eth.chainId  # pylint: disable=no-member
 
     def assert_valid(
         self, method_name: str, parameter_name: str, argument_value: Any
@@ -45,20 +40,42 @@ class ExchangeValidator(Validator):
         :param parameter_name: Name of the parameter whose input is to be
             validated.
         :param argument_value: Value of argument to parameter to be validated.
+
+        Orders are validated by their conversion to JSON, as directed by
+        `zero_ex.json_schemas.get_validation_policy()`:code:.  A
+        `zero_ex.order_utils.SignedOrder`:code: is validated in the JSON form
+        it remembers, against the signed order schema, and must have been
+        signed for this validator's chain and Exchange.
+
+        :raises ValueError: If a `SignedOrder`:code: was signed for another
+            deployment of the Exchange.
         """
         if parameter_name == "order":
-            json_schemas.assert_valid(
-                order_to_jsdict(
-                    argument_value, self.chain_id, self.contract_address
-                ),
-                "/orderSchema",
-            )
+            self._assert_valid_order(argument_value)
 
         if parameter_name == "orders":
             for order in argument_value:
-                json_schemas.assert_valid(
-                    order_to_jsdict(
-                        order, self.chain_id, self.contract_address
-                    ),
-                    "/orderSchema",
-                )
+                self._assert_valid_order(order)
+
+    def _assert_valid_order(self, order: Any) -> None:
+        # order_utils imports from this package, so import it only once both
+        # are loaded:
+        # pylint: disable=import-outside-toplevel
+        from zero_ex.order_utils import SignedOrder
+
+        if not isinstance(order, SignedOrder):
+            order_to_jsdict(order, self.chain_id, self.contract_address)
+            return
+
+        if (order.chain_id, order.exchange_address) != (
+            self.chain_id,
+            self.contract_address.lower(),
+        ):
+            raise ValueError(
+                f"Order was signed for the Exchange at {order.exchange_address}"
+                + f" on chain {order.chain_id}, not the one at"
+                + f" {self.contract_address} on chain {self.chain_id}."
+            )
+        get_validation_policy().assert_valid(
+            order.jsdict, "/signedOrderSchema", subject=order
+        )
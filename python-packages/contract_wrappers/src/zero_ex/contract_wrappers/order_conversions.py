@@ -5,25 +5,94 @@ Converting between the JSON wire format and the types accepted by Web3.py (eg
 converting Exchange structs between JSON and Python objects.
 """
 
-from copy import copy
-from typing import cast, Dict, Union
+from typing import cast, Iterable, Iterator, TYPE_CHECKING, Union
 
-from eth_utils import remove_0x_prefix
+from zero_ex.json_schemas import get_validation_policy
 
-from zero_ex.json_schemas import assert_valid
-from zero_ex.contract_wrappers.exchange.types import Order
+if TYPE_CHECKING:
+    # the generated Exchange wrapper, and web3 with it, are slow to import:
+    from zero_ex.contract_wrappers.exchange.types import Order
+
+
+_NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def _encode_bytes(value: Union[bytes, bytearray, memoryview, str]) -> str:
+    if isinstance(value, str):
+        return value if value[0:2] == "0x" else "0x" + value
+    return "0x" + value.hex()
+
+
+def _decode_bytes(hex_str: str) -> bytes:
+    return bytes.fromhex(
+        hex_str[2:] if hex_str[0:2] in ("0x", "0X") else hex_str
+    )
+
+
+def _order_to_jsdict(
+    order: "Order", chain_id: int, exchange_address: str, signature: str = None
+) -> dict:
+    """Convert an `Order`:code: dict, without validating the result."""
+    jsdict = {
+        **order,
+        "makerAssetData": _encode_bytes(order["makerAssetData"]),
+        "takerAssetData": _encode_bytes(order["takerAssetData"]),
+        "makerFeeAssetData": _encode_bytes(order["makerFeeAssetData"]),
+        "takerFeeAssetData": _encode_bytes(order["takerFeeAssetData"]),
+        "exchangeAddress": exchange_address,
+        "expirationTimeSeconds": str(order["expirationTimeSeconds"]),
+        "makerAssetAmount": str(order["makerAssetAmount"]),
+        "takerAssetAmount": str(order["takerAssetAmount"]),
+        "makerFee": str(order["makerFee"]),
+        "takerFee": str(order["takerFee"]),
+        "salt": str(order["salt"]),
+        "chainId": chain_id,
+    }
+    if signature is not None:
+        jsdict["signature"] = signature
+    return jsdict
+
+
+def _jsdict_to_order(jsdict: dict) -> "Order":
+    """Convert a JSON dict, without validating it."""
+    order = {
+        **jsdict,
+        "makerAssetData": _decode_bytes(jsdict["makerAssetData"]),
+        "makerFeeAssetData": _decode_bytes(jsdict["makerFeeAssetData"]),
+        "takerAssetData": _decode_bytes(jsdict["takerAssetData"]),
+        "takerFeeAssetData": _decode_bytes(jsdict["takerFeeAssetData"]),
+        "makerAssetAmount": int(jsdict["makerAssetAmount"]),
+        "takerAssetAmount": int(jsdict["takerAssetAmount"]),
+        "makerFee": int(jsdict["makerFee"]),
+        "takerFee": int(jsdict["takerFee"]),
+        "expirationTimeSeconds": int(jsdict["expirationTimeSeconds"]),
+        "salt": int(jsdict["salt"]),
+    }
+    order.pop("exchangeAddress", None)
+    return cast("Order", order)
 
 
 def order_to_jsdict(
-    order: Order,
+    order: "Order",
     chain_id: int,
-    exchange_address="0x0000000000000000000000000000000000000000",
+    exchange_address=_NULL_ADDRESS,
     signature: str = None,
 ) -> dict:
     """Convert a Web3-compatible order struct to a JSON-schema-compatible dict.
 
     More specifically, do explicit decoding for the `bytes`:code: fields, and
-    convert numerics to strings.
+    convert numerics to strings.  Those fields may also be given as
+    `bytearray`:code: or `memoryview`:code:, which are hex encoded directly,
+    or as hex strings, which are passed through.
+
+    Besides `Order`:code: dicts, this accepts any object with a
+    `to_jsdict()`:code: method of the same signature, such as a
+    `zero_ex.order_utils.compact_order.CompactOrder`:code:.
+
+    The result is validated against the order schema as directed by
+    `zero_ex.json_schemas.get_validation_policy()`:code:, which tracks the
+    given `order`:code:, rather than the new dict, in mode
+    `ONCE_PER_OBJECT`:code:.
 
     >>> import pprint
     >>> pprint.pprint(order_to_jsdict(
@@ -63,48 +132,23 @@ def order_to_jsdict(
      'takerFee': '0',
      'takerFeeAssetData': '0x0000000000000000000000000000000000000000'}
     """
-    jsdict = cast(Dict, copy(order))
-
-    def encode_bytes(bytes_or_str: Union[bytes, str]) -> bytes:
-        def ensure_hex_prefix(hex_str: str):
-            if hex_str[0:2] != "0x":
-                hex_str = "0x" + hex_str
-            return hex_str
-
-        return ensure_hex_prefix(
-            cast(bytes, bytes_or_str).hex()
-            if isinstance(bytes_or_str, bytes)
-            else bytes_or_str
+    if hasattr(order, "to_jsdict"):
+        jsdict = order.to_jsdict(  # type: ignore
+            chain_id, exchange_address, signature
         )
+        get_validation_policy().assert_valid(
+            jsdict, "/orderSchema", subject=order
+        )
+        return jsdict
 
-    jsdict["makerAssetData"] = encode_bytes(order["makerAssetData"])
-    jsdict["takerAssetData"] = encode_bytes(order["takerAssetData"])
-    jsdict["makerFeeAssetData"] = encode_bytes(order["makerFeeAssetData"])
-    jsdict["takerFeeAssetData"] = encode_bytes(order["takerFeeAssetData"])
-
-    jsdict["exchangeAddress"] = exchange_address
-
-    jsdict["expirationTimeSeconds"] = str(order["expirationTimeSeconds"])
-
-    jsdict["makerAssetAmount"] = str(order["makerAssetAmount"])
-    jsdict["takerAssetAmount"] = str(order["takerAssetAmount"])
-
-    jsdict["makerFee"] = str(order["makerFee"])
-    jsdict["takerFee"] = str(order["takerFee"])
-
-    jsdict["salt"] = str(order["salt"])
-
-    jsdict["chainId"] = chain_id
-
-    if signature is not None:
-        jsdict["signature"] = signature
+    jsdict = _order_to_jsdict(order, chain_id, exchange_address, signature)
 
-    assert_valid(jsdict, "/orderSchema")
+    get_validation_policy().assert_valid(jsdict, "/orderSchema", subject=order)
 
     return jsdict
 
 
-def jsdict_to_order(jsdict: dict) -> Order:
+def jsdict_to_order(jsdict: dict) -> "Order":
     r"""Convert a JSON-schema-compatible dict order to a Web3-compatible struct.
 
     More specifically, do explicit encoding of the `bytes`:code: fields, and
@@ -151,35 +195,112 @@ def jsdict_to_order(jsdict: dict) -> Order:
      'takerFeeAssetData': b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
                           b'\x00\x00\x00\x00\x00\x00\x00\x00'}
     """  # noqa: E501 (line too long)
-    assert_valid(jsdict, "/orderSchema")
+    get_validation_policy().assert_valid(jsdict, "/orderSchema")
 
-    order = cast(Order, copy(jsdict))
-
-    order["makerAssetData"] = bytes.fromhex(
-        remove_0x_prefix(jsdict["makerAssetData"])
-    )
-    order["makerFeeAssetData"] = bytes.fromhex(
-        remove_0x_prefix(jsdict["makerFeeAssetData"])
-    )
-    order["takerAssetData"] = bytes.fromhex(
-        remove_0x_prefix(jsdict["takerAssetData"])
-    )
-    order["takerFeeAssetData"] = bytes.fromhex(
-        remove_0x_prefix(jsdict["takerFeeAssetData"])
-    )
+    return _jsdict_to_order(jsdict)
 
-    order["makerAssetAmount"] = int(jsdict["makerAssetAmount"])
-    order["takerAssetAmount"] = int(jsdict["takerAssetAmount"])
 
-    order["makerFee"] = int(jsdict["makerFee"])
-    order["takerFee"] = int(jsdict["takerFee"])
-
-    order["expirationTimeSeconds"] = int(jsdict["expirationTimeSeconds"])
-
-    order["salt"] = int(jsdict["salt"])
+def orders_to_jsdicts(
+    orders: Iterable["Order"],
+    chain_id: int,
+    exchange_address: str = _NULL_ADDRESS,
+    validate: bool = True,
+) -> Iterator[dict]:
+    """Lazily convert many orders, as by `order_to_jsdict()`:code:.
+
+    :param orders: `Order`:code: dicts, or objects with a
+        `to_jsdict()`:code: method, such as
+        `zero_ex.order_utils.compact_order.CompactOrder`:code:.
+    :param validate: Whether to validate each result, as directed by
+        `zero_ex.json_schemas.get_validation_policy()`:code:.  Pass
+        `False`:code: for orders that have already been validated.
+
+    >>> jsdicts = orders_to_jsdicts(
+    ...     [
+    ...         {
+    ...             'makerAddress': _NULL_ADDRESS,
+    ...             'takerAddress': _NULL_ADDRESS,
+    ...             'feeRecipientAddress': _NULL_ADDRESS,
+    ...             'senderAddress': _NULL_ADDRESS,
+    ...             'makerAssetAmount': 1,
+    ...             'takerAssetAmount': 1,
+    ...             'makerFee': 0,
+    ...             'takerFee': 0,
+    ...             'expirationTimeSeconds': 1,
+    ...             'salt': salt,
+    ...             'makerAssetData': bytes(20),
+    ...             'takerAssetData': bytes(20),
+    ...             'makerFeeAssetData': b"",
+    ...             'takerFeeAssetData': b"",
+    ...         }
+    ...         for salt in range(3)
+    ...     ],
+    ...     chain_id=50,
+    ... )
+    >>> [jsdict["salt"] for jsdict in jsdicts]
+    ['0', '1', '2']
+    """
+    policy = get_validation_policy()
+    for order in orders:
+        if hasattr(order, "to_jsdict"):
+            jsdict = order.to_jsdict(  # type: ignore
+                chain_id, exchange_address
+            )
+        else:
+            jsdict = _order_to_jsdict(order, chain_id, exchange_address)
+        if validate:
+            policy.assert_valid(jsdict, "/orderSchema", subject=order)
+        yield jsdict
+
+
+def jsdicts_to_orders(
+    jsdicts: Iterable[dict], validate: bool = True
+) -> Iterator["Order"]:
+    """Lazily convert many JSON dicts, as by `jsdict_to_order()`:code:.
+
+    :param validate: Whether to validate each JSON dict first, as directed by
+        `zero_ex.json_schemas.get_validation_policy()`:code:.  Pass
+        `False`:code: for dicts that have already been validated.
+    """
+    policy = get_validation_policy()
+    for jsdict in jsdicts:
+        if validate:
+            policy.assert_valid(jsdict, "/orderSchema")
+        yield _jsdict_to_order(jsdict)
+
+
+def _record_order(record: dict) -> dict:
+    order = record.get("order") if isinstance(record, dict) else None
+    if not isinstance(order, dict):
+        raise TypeError(
+            "Expected a JSON record, with the JSON form of a signed order."
+            + "  The zero_ex.sra_client models are generated from version 2"
+            + " of the Standard Relayer API spec, and have no fee asset data,"
+            + f" so they can't be converted; got a {type(record).__name__}."
+        )
+    return order
 
-    del order["exchangeAddress"]  # type: ignore
-    # silence mypy pending release of
-    # https://github.com/python/mypy/issues/3550
 
-    return order
+def sra_records_to_orders(
+    records: Iterable[dict], validate: bool = True
+) -> Iterator["Order"]:
+    """Lazily convert the orders of Standard Relayer API records.
+
+    :param records: JSON records, each a dict with the JSON form of a signed
+        order as its `order`:code:.  With a
+        `zero_ex.sra_client.RelayerApi`:code:, get them by passing
+        `_preload_content=False`:code: to `get_orders()`:code:, and taking
+        the `records`:code: of `json.loads()`:code: of the response's
+        `data`:code:.  The `zero_ex.sra_client.OrderSchema`:code: models
+        that the client deserializes responses into by default are generated
+        from version 2 of the Standard Relayer API spec, and drop the fee
+        asset data of a version 3 order, so they can't be converted.
+    :param validate: As for `jsdicts_to_orders()`:code:.
+    :raises TypeError: If a record, or its `order`:code:, isn't a dict.
+
+    The orders keep their `signature`:code: and `chainId`:code:, as with
+    `jsdict_to_order()`:code:.
+    """
+    return jsdicts_to_orders(
+        (_record_order(record) for record in records), validate
+    )
@@ -0,0 +1,155 @@
+"""Per-provider state, memoized across calls.
+
+Higher level operations often need the same facts about a provider time and
+again: the ID of the chain it's connected to, the addresses of the 0x
+contracts on that chain, the accounts it manages, and wrappers for those
+contracts.  A `ProviderSession`:code: fetches each of these just once, and it
+can be passed anywhere the 0x Python packages accept a `Web3`:code: instance or
+a provider:
+
+>>> from web3 import Web3
+>>> from zero_ex.contract_wrappers.exchange import Exchange
+>>> session = ProviderSession(Web3.HTTPProvider("http://127.0.0.1:8545"))
+>>> session.chain_id
+1337
+>>> exchange = session.wrapper(
+...     Exchange, session.contract_addresses.exchange
+... )
+>>> exchange is session.wrapper(
+...     Exchange, session.contract_addresses.exchange
+... )
+True
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from zero_ex.contract_addresses import (
+    chain_to_addresses,
+    ChainId,
+    ContractAddresses,
+)
+
+
+_Wrapper = TypeVar("_Wrapper")
+
+
+class ProviderSession:
+    """Memoize chain ID, contract addresses, accounts and wrappers.
+
+    The memoized state is never refreshed automatically; call
+    `clear()`:code: if, for example, the node's accounts change.
+
+    :param web3_or_provider: Either an instance of `web3.Web3`:code: or
+        `web3.providers.base.BaseProvider`:code:
+    """
+
+    def __init__(self, web3_or_provider: Union[Web3, BaseProvider]):
+        """Start a session, without yet making any calls to the provider."""
+        if isinstance(web3_or_provider, BaseProvider):
+            self.web3 = Web3(web3_or_provider)
+        elif isinstance(web3_or_provider, Web3):
+            self.web3 = web3_or_provider
+        else:
+            raise TypeError(
+                "Expected parameter 'web3_or_provider' to be an instance of either"
+                + " Web3 or BaseProvider"
+            )
+        self._chain_id: Optional[int] = None
+        self._contract_addresses: Optional[ContractAddresses] = None
+        self._accounts: Optional[List[str]] = None
+        self._wrappers: Dict[Tuple[type, str], Any] = {}
+
+    @property
+    def provider(self) -> BaseProvider:
+        """The provider underlying this session."""
+        return self.web3.provider
+
+    @property
+    def chain_id(self) -> int:
+        """The ID of the chain to which the provider is connected."""
+        if self._chain_id is None:
+            self._chain_id = int(
+                self.web3.eth.chainId  # pylint: disable=no-member
+            )
+        return self._chain_id
+
+    @property
+    def contract_addresses(self) -> ContractAddresses:
+        """The addresses of the 0x contracts on the provider's chain."""
+        if self._contract_addresses is None:
+            self._contract_addresses = chain_to_addresses(
+                ChainId(self.chain_id)
+            )
+        return self._contract_addresses
+
+    @property
+    def accounts(self) -> List[str]:
+        """The accounts managed by the provider."""
+        if self._accounts is None:
+            self._accounts = list(
+                self.web3.eth.accounts  # pylint: disable=no-member
+            )
+        return self._accounts
+
+    @property
+    def default_account(self) -> Optional[str]:
+        """The account from which transactions originate by default.
+
+        That's the Web3 instance's `defaultAccount`:code: if set, or else the
+        first of the provider's accounts, if any.
+        """
+        default_account = (
+            self.web3.eth.defaultAccount  # pylint: disable=no-member
+        )
+        if default_account:
+            return default_account
+        return self.accounts[0] if self.accounts else None
+
+    def wrapper(
+        self, wrapper_class: Type[_Wrapper], contract_address: str
+    ) -> _Wrapper:
+        """Get a contract wrapper bound to this session.
+
+        Repeated calls with the same class and address return the same
+        instance.
+
+        :param wrapper_class: A contract wrapper class, such as
+            `zero_ex.contract_wrappers.exchange.Exchange`:code:.
+        :param contract_address: Where the contract has been deployed to.
+        """
+        key = (wrapper_class, contract_address.lower())
+        if key not in self._wrappers:
+            self._wrappers[key] = wrapper_class(  # type: ignore
+                self, contract_address
+            )
+        return self._wrappers[key]
+
+    def clear(self) -> None:
+        """Forget all memoized state."""
+        self._chain_id = None
+        self._contract_addresses = None
+        self._accounts = None
+        self._wrappers.clear()
+
+
+def to_web3(
+    web3_or_provider: Union[Web3, BaseProvider, ProviderSession]
+) -> Web3:
+    """Get the `Web3`:code: instance behind any of the accepted types.
+
+    :raises TypeError: If the argument is none of a `Web3`:code: instance, a
+        provider or a `ProviderSession`:code:.
+    """
+    if isinstance(web3_or_provider, ProviderSession):
+        return web3_or_provider.web3
+    if isinstance(web3_or_provider, BaseProvider):
+        return Web3(web3_or_provider)
+    if isinstance(web3_or_provider, Web3):
+        return web3_or_provider
+    raise TypeError(
+        "Expected parameter 'web3_or_provider' to be an instance of either"
+        + " Web3, BaseProvider or ProviderSession"
+    )
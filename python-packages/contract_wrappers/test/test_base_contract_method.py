@@ -4,6 +4,7 @@ import pytest
 
 from zero_ex.contract_addresses import chain_to_addresses, ChainId
 from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.dev_utils.address_cache import ADDRESS_CACHE
 
 
 @pytest.fixture(scope="module")
@@ -13,3 +14,20 @@ def contract_wrapper(ganache_provider):
         web3_or_provider=ganache_provider,
         contract_address=chain_to_addresses(ChainId.GANACHE).ether_token,
     )
+
+
+def test_validate_and_checksum_address():
+    """Test checksumming, and that repeated addresses hit the cache."""
+    address = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+    ADDRESS_CACHE.cache_clear()
+
+    for _ in range(3):
+        assert (
+            ContractMethod.validate_and_checksum_address(address)
+            == "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+        )
+    assert (ADDRESS_CACHE.hits, ADDRESS_CACHE.misses) == (2, 1)
+
+    for invalid in (address[:-1], 123):
+        with pytest.raises(TypeError):
+            ContractMethod.validate_and_checksum_address(invalid)
@@ -0,0 +1,145 @@
+"""Tests of zero_ex.contract_wrappers.order_conversions."""
+
+from jsonschema import ValidationError
+import pytest
+
+from zero_ex import json_schemas
+from zero_ex.contract_wrappers.order_conversions import (
+    jsdict_to_order,
+    jsdicts_to_orders,
+    order_to_jsdict,
+    orders_to_jsdicts,
+    sra_records_to_orders,
+)
+from zero_ex.json_schemas import ValidationMode, ValidationPolicy
+
+
+EXCHANGE_ADDRESS = "0x48bacb9266a570d521063ef5dd96e61686dbe788"
+
+
+ORDER = {
+    "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "takerAddress": "0x0000000000000000000000000000000000000000",
+    "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+    "senderAddress": "0x0000000000000000000000000000000000000000",
+    "makerAssetAmount": 10 ** 18,
+    "takerAssetAmount": 5 * 10 ** 17,
+    "makerFee": 0,
+    "takerFee": 10 ** 16,
+    "expirationTimeSeconds": 1577836800,
+    "salt": 0,
+    "makerAssetData": bytes.fromhex("f47261b0" + "00" * 32),
+    "takerAssetData": bytes.fromhex("f47261b0" + "11" * 32),
+    "makerFeeAssetData": b"",
+    "takerFeeAssetData": bytes.fromhex("f47261b0" + "22" * 32),
+}
+
+SIGNATURE = "0x1b" + "00" * 64 + "02"
+
+
+def test_orders_to_jsdicts_matches_order_to_jsdict():
+    """Test that bulk conversion agrees with one-at-a-time conversion."""
+    orders = [dict(ORDER, salt=salt) for salt in range(3)]
+
+    jsdicts = orders_to_jsdicts(orders, 1337, EXCHANGE_ADDRESS)
+
+    assert next(jsdicts) == order_to_jsdict(orders[0], 1337, EXCHANGE_ADDRESS)
+    assert list(jsdicts) == [
+        order_to_jsdict(order, 1337, EXCHANGE_ADDRESS) for order in orders[1:]
+    ]
+    assert list(jsdicts_to_orders(orders_to_jsdicts(orders, 1337))) == [
+        jsdict_to_order(order_to_jsdict(order, 1337)) for order in orders
+    ]
+
+
+def test_bulk_conversions_validation_switch(monkeypatch):
+    """Test that validation may be skipped, and follows the policy if not."""
+    bad_order = dict(ORDER, makerFee=-1)
+    bad_jsdict = order_to_jsdict(ORDER, 1337)
+    bad_jsdict["salt"] = "-1"
+    policy = ValidationPolicy(ValidationMode.ALWAYS)
+    monkeypatch.setattr(json_schemas, "_VALIDATION_POLICY", policy)
+
+    with pytest.raises(ValidationError):
+        list(orders_to_jsdicts([bad_order], 1337))
+    with pytest.raises(ValidationError):
+        list(jsdicts_to_orders([bad_jsdict]))
+    assert policy.validations == 2
+
+    assert [
+        jsdict["makerFee"]
+        for jsdict in orders_to_jsdicts([bad_order], 1337, validate=False)
+    ] == ["-1"]
+    assert [
+        order["salt"] for order in jsdicts_to_orders([bad_jsdict], False)
+    ] == [-1]
+    assert policy.validations == 2
+
+
+def test_sra_records_to_orders():
+    """Test converting the JSON records of an SRA response to orders."""
+    records = [
+        {
+            "order": order_to_jsdict(
+                dict(ORDER, salt=salt), 1337, EXCHANGE_ADDRESS, SIGNATURE
+            ),
+            "metaData": {},
+        }
+        for salt in range(3)
+    ]
+
+    orders = sra_records_to_orders(records)
+
+    assert next(orders) == jsdict_to_order(records[0]["order"])
+    assert list(orders) == [
+        dict(ORDER, salt=salt, chainId=1337, signature=SIGNATURE)
+        for salt in (1, 2)
+    ]
+
+
+def test_sra_records_to_orders__sra_client_models():
+    """Test that the version 2 SRA client models are refused."""
+    sra_client = pytest.importorskip("zero_ex.sra_client")
+    jsdict = order_to_jsdict(ORDER, 1337, EXCHANGE_ADDRESS)
+    record = sra_client.RelayerApiOrderSchema(
+        order=sra_client.OrderSchema(
+            **{
+                attribute: jsdict[key]
+                for attribute, key in (
+                    sra_client.OrderSchema.attribute_map.items()
+                )
+            }
+        ),
+        meta_data={},
+    )
+
+    with pytest.raises(TypeError, match="version 2"):
+        list(sra_records_to_orders([record]))
+    with pytest.raises(TypeError, match="version 2"):
+        list(sra_records_to_orders([{"order": record.order}]))
+    # the JSON the client would send for the model lacks fee asset data:
+    with pytest.raises(ValidationError, match="makerFeeAssetData"):
+        list(
+            sra_records_to_orders(
+                [sra_client.ApiClient().sanitize_for_serialization(record)]
+            )
+        )
+
+
+def test_order_to_jsdict_bytes_like_fields():
+    """Test that views and bytearrays are hex encoded like bytes."""
+    order = ORDER
+    buffer = bytearray(b"\xff" + order["makerAssetData"])
+    buffered_order = dict(
+        order,
+        makerAssetData=memoryview(buffer)[1:],
+        takerAssetData=bytearray(order["takerAssetData"]),
+        takerFeeAssetData="0x" + order["takerFeeAssetData"].hex(),
+    )
+
+    assert order_to_jsdict(buffered_order, 1337) == order_to_jsdict(
+        order, 1337
+    )
+    assert jsdict_to_order(order_to_jsdict(buffered_order, 1337)) == dict(
+        order, chainId=1337
+    )
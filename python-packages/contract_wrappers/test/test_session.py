@@ -0,0 +1,180 @@
+"""Tests for :class:`ProviderSession`."""
+
+from collections import Counter
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from zero_ex import json_schemas
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers.exchange.validator import ExchangeValidator
+from zero_ex.contract_wrappers.session import ProviderSession, to_web3
+from zero_ex.json_schemas import ValidationMode, ValidationPolicy
+from zero_ex.order_utils import SignedOrder
+from zero_ex.order_utils.compact_order import CompactOrder
+
+
+ACCOUNT = "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+
+
+class _CountingProvider(BaseProvider):  # pylint: disable=abstract-method
+    """A node on the Ganache chain which counts the requests made of it."""
+
+    def __init__(self):
+        """Start with no requests counted."""
+        self.requests = Counter()
+
+    def make_request(self, method, params):
+        """Answer eth_chainId and eth_accounts."""
+        self.requests[method] += 1
+        result = {"eth_chainId": hex(1337), "eth_accounts": [ACCOUNT]}[method]
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Always be connected."""
+        return True
+
+
+class _Wrapper:  # pylint: disable=too-few-public-methods
+    """Stand-in for a generated contract wrapper."""
+
+    def __init__(self, web3_or_provider, contract_address):
+        """Remember the constructor arguments."""
+        self.web3_or_provider = web3_or_provider
+        self.contract_address = contract_address
+
+
+def test_session__memoizes_chain_state():
+    """Test that the chain ID, addresses and accounts are fetched once."""
+    provider = _CountingProvider()
+    session = ProviderSession(provider)
+
+    for _ in range(3):
+        assert session.chain_id == 1337
+        assert session.contract_addresses == chain_to_addresses(
+            ChainId.GANACHE
+        )
+        assert session.accounts == [ACCOUNT]
+        assert session.default_account == ACCOUNT
+
+    assert provider.requests == {"eth_chainId": 1, "eth_accounts": 1}
+
+    session.clear()
+    assert session.chain_id == 1337
+    assert provider.requests["eth_chainId"] == 2
+
+
+def test_session__memoizes_wrappers():
+    """Test that wrappers are constructed once per class and address."""
+    session = ProviderSession(Web3(_CountingProvider()))
+    address = chain_to_addresses(ChainId.GANACHE).exchange
+
+    wrapper = session.wrapper(_Wrapper, address)
+
+    assert wrapper.web3_or_provider is session
+    assert session.wrapper(_Wrapper, address.upper().replace("0X", "0x")) is (
+        wrapper
+    )
+    assert session.wrapper(_Wrapper, ACCOUNT) is not wrapper
+
+
+def test_session__rejects_other_types():
+    """Test that only Web3 instances and providers can start a session."""
+    with pytest.raises(TypeError):
+        ProviderSession("http://127.0.0.1:8545")
+    with pytest.raises(TypeError):
+        to_web3(123)
+
+
+def test_contract_method__default_account_from_session():
+    """Test that a session's accounts are fetched once across methods."""
+    provider = _CountingProvider()
+    session = ProviderSession(provider)
+    address = chain_to_addresses(ChainId.GANACHE).ether_token
+
+    for _ in range(3):
+        assert (
+            ContractMethod(session, address).normalize_tx_params(None).from_
+            == ACCOUNT
+        )
+
+    assert provider.requests == {"eth_accounts": 1}
+
+
+def test_exchange_validator__chain_id_from_session():
+    """Test that validators share the session's chain ID."""
+    provider = _CountingProvider()
+    session = ProviderSession(provider)
+    address = chain_to_addresses(ChainId.GANACHE).exchange
+
+    for _ in range(3):
+        assert ExchangeValidator(session, address).chain_id == 1337
+
+    assert provider.requests == {"eth_chainId": 1}
+
+
+def test_exchange_validator__signed_orders_follow_policy(monkeypatch):
+    """Test that a `SignedOrder` is validated as the policy directs."""
+    conversions = []
+    monkeypatch.setattr(
+        "zero_ex.contract_wrappers.exchange.validator.order_to_jsdict",
+        lambda *args: conversions.append(args),
+    )
+    policy = ValidationPolicy(ValidationMode.ONCE_PER_OBJECT)
+    monkeypatch.setattr(json_schemas, "_VALIDATION_POLICY", policy)
+    address = chain_to_addresses(ChainId.GANACHE).exchange
+    validator = ExchangeValidator(
+        ProviderSession(_CountingProvider()), address
+    )
+    signed_order = SignedOrder(
+        CompactOrder(*[bytes(20)] * 4, *[1] * 6, *[b""] * 4),
+        signature="0x" + "00" * 66,
+        exchange_address=address,
+        chain_id=1337,
+    )
+
+    for _ in range(3):
+        validator.assert_valid("fillOrder", "order", signed_order)
+        validator.assert_valid("batchFillOrders", "orders", [signed_order])
+
+    assert (policy.validations, policy.skips) == (1, 5)
+    assert not conversions
+    validator.assert_valid("fillOrder", "order", signed_order.to_order())
+    assert len(conversions) == 1
+
+    policy.mode = ValidationMode.ALWAYS
+    validator.assert_valid("fillOrder", "order", signed_order)
+    validator.assert_valid("fillOrder", "order", signed_order)
+    assert (policy.validations, policy.skips) == (3, 5)
+
+
+def test_exchange_validator__signed_orders_for_other_deployments():
+    """Test that an order signed for another Exchange is refused."""
+    address = chain_to_addresses(ChainId.GANACHE).exchange
+    validator = ExchangeValidator(
+        ProviderSession(_CountingProvider()), address
+    )
+    compact_order = CompactOrder(*[bytes(20)] * 4, *[1] * 6, *[b""] * 4)
+
+    validator.assert_valid(
+        "fillOrder",
+        "order",
+        SignedOrder(compact_order, "0x" + "00" * 66, address.upper(), 1337),
+    )
+    for exchange_address, chain_id in (
+        ("0x" + "11" * 20, 1337),
+        (address, 1),
+    ):
+        with pytest.raises(ValueError, match="signed for the Exchange"):
+            validator.assert_valid(
+                "fillOrder",
+                "order",
+                SignedOrder(
+                    compact_order,
+                    "0x" + "00" * 66,
+                    exchange_address,
+                    chain_id,
+                ),
+            )
@@ -8,9 +8,10 @@
 
 import distutils.command.build_py
 from distutils.command.clean import clean
+import json
 import subprocess  # nosec
 from shutil import copytree, rmtree
-from os import environ, path
+from os import environ, listdir, path
 from sys import argv, exit  # pylint: disable=redefined-builtin
 
 from setuptools import find_packages, setup
@@ -23,19 +24,38 @@ class PreInstallCommand(distutils.command.build_py.build_py):
     description = "Pull in the schemas that live in the TypeScript package."
 
     def run(self):
-        """Copy files from TS area to local src."""
+        """Copy files from TS area to local src, and bundle them."""
         pkgdir = path.dirname(path.realpath(argv[0]))
-        rmtree(
-            path.join(pkgdir, "src", "zero_ex", "json_schemas", "schemas"),
-            ignore_errors=True,
+        schemas_dir = path.join(
+            pkgdir, "src", "zero_ex", "json_schemas", "schemas"
         )
+        rmtree(schemas_dir, ignore_errors=True)
         copytree(
             path.join(
                 pkgdir, "..", "..", "packages", "json-schemas", "schemas"
             ),
-            path.join(pkgdir, "src", "zero_ex", "json_schemas", "schemas"),
+            schemas_dir,
         )
 
+        # Bundle every schema into one file, keyed by the schema's id, and
+        # also by the id implied by its file name, should that differ.
+        schemas = {}
+        for file_name in sorted(listdir(schemas_dir)):
+            with open(path.join(schemas_dir, file_name)) as schema_file:
+                schema = json.load(schema_file)
+            words = path.splitext(file_name)[0].split("_")
+            schemas[
+                "/" + words[0] + "".join(map(str.title, words[1:]))
+            ] = schema
+            schemas[schema["id"]] = schema
+        with open(
+            path.join(
+                pkgdir, "src", "zero_ex", "json_schemas", "schemas.json"
+            ),
+            "w",
+        ) as bundle_file:
+            json.dump(schemas, bundle_file, sort_keys=True)
+
 
 class TestCommandExtension(TestCommand):
     """Run pytest tests."""
@@ -163,7 +183,7 @@ setup(
         "publish": PublishCommand,
         "publish_docs": PublishDocsCommand,
     },
-    install_requires=["jsonschema", "mypy_extensions", "stringcase"],
+    install_requires=["jsonschema", "mypy_extensions"],
     extras_require={
         "dev": [
             "0x-contract-addresses",
@@ -185,7 +205,9 @@ setup(
         ]
     },
     python_requires=">=3.6, <4",
-    package_data={"zero_ex.json_schemas": ["py.typed", "schemas/*"]},
+    package_data={
+        "zero_ex.json_schemas": ["py.typed", "schemas.json", "schemas/*"]
+    },
     package_dir={"": "src"},
     license="Apache 2.0",
     keywords=(
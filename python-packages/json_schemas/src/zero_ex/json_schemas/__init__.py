@@ -7,46 +7,132 @@ Install the package with pip::
 
     pip install 0x-json-schemas
 
+Every schema is read from a single bundle, `schemas.json`:code:, which is
+loaded once, by the first call needing a schema, rather than on import, so
+that importing this package stays cheap.  After that first call, validation
+never reads from disk.
+
 """
 
+from collections import OrderedDict
+from enum import auto, Enum
+from functools import lru_cache
+from itertools import repeat
 from os import path
 import json
-from typing import Mapping
+import random
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TYPE_CHECKING,
+)
 
-from pkg_resources import resource_string
-import jsonschema
-from stringcase import snakecase
+from zero_ex.json_schemas._fast_path import compile_fast_path
 
+if TYPE_CHECKING:
+    # jsonschema is slow to import, and valid data never needs it:
+    from jsonschema import ValidationError
+    from zero_ex.json_schemas._resolver import LocalRefResolver
 
-class _LocalRefResolver(jsonschema.RefResolver):
-    """Resolve package-local JSON schema id's."""
 
-    def __init__(self):
-        """Initialize a new instance."""
-        jsonschema.RefResolver.__init__(self, "", "")
+@lru_cache(maxsize=None)
+def _schemas() -> Dict[str, Dict]:
+    """Load the bundle of all the schemas, keyed by id.
 
-    @staticmethod
-    def resolve_from_url(url: str) -> str:
-        """Resolve the given URL.
+    The bundle, `schemas.json`:code:, is written alongside the individual
+    schema files by `setup.py pre_install`:code:.  It's read by the first
+    call needing a schema, rather than on import, and only once, so that any
+    number of validations after that one never read from disk.
+    """
+    with open(
+        path.join(path.dirname(__file__), "schemas.json"), encoding="utf-8"
+    ) as file:
+        return json.load(file)
 
-        :param url: a string representing the URL of the JSON schema to fetch.
-        :returns: a string representing the deserialized JSON schema
-        :raises jsonschema.ValidationError: when the resource associated with
-                   `url` does not exist.
-        """
-        ref = url.replace("file://", "")
-        return json.loads(
-            resource_string(
-                "zero_ex.json_schemas",
-                f"schemas/{snakecase(ref.lstrip('/'))}.json",
-            )
-        )
+
+def _schema(schema_id: str) -> Dict:
+    """Get the bundled schema with the given id.
+
+    :raises ValueError: when no schema has the id.
+    """
+    ref = schema_id.replace("file://", "")
+    try:
+        return _schemas()[ref]
+    except KeyError:
+        raise ValueError(f"There is no schema with id {ref}.") from None
 
 
-# Instantiate the `_LocalRefResolver()` only once so that `assert_valid()` can
-# perform multiple schema validations without reading from disk the schema
-# every time.
-_LOCAL_RESOLVER = _LocalRefResolver()
+@lru_cache(maxsize=None)
+def _local_resolver() -> "LocalRefResolver":
+    """Get the resolver of schema id's used by every generic validator."""
+    # imported here, so that importing this module doesn't import jsonschema:
+    # pylint: disable=import-outside-toplevel
+    from zero_ex.json_schemas._resolver import LocalRefResolver
+
+    return LocalRefResolver(_schemas())
+
+
+def _resolve_refs(schema: Any) -> None:
+    """Resolve every `$ref` reachable from `schema`, warming the cache."""
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            if key == "$ref" and isinstance(value, str):
+                _resolve_refs(_local_resolver().resolve(value)[1])
+            else:
+                _resolve_refs(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            _resolve_refs(value)
+
+
+@lru_cache(maxsize=None)
+def _compile_validator(url: str) -> Any:
+    """Build a validator for the schema at the given URL.
+
+    Checking a schema against its metaschema, and constructing a validator
+    for it, costs many times more than validating a typical order does, so
+    it's done only once per schema, rather than on every call to
+    `assert_valid()`:code:.  The schemas referred to by the schema are
+    resolved here too, so that validation never reads from disk.
+    """
+    # pylint: disable=import-outside-toplevel
+    from jsonschema.validators import validator_for
+
+    _, schema = _local_resolver().resolve(url)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    _resolve_refs(schema)
+    return validator_class(schema, resolver=_local_resolver())
+
+
+@lru_cache(maxsize=None)
+def _compile_fast_path(schema_id: str) -> Optional[Callable[[Any], bool]]:
+    """Generate a fast, conservative check of the schema with the given id.
+
+    See `zero_ex.json_schemas._fast_path`:code:.  Returns `None`:code: for
+    schemas that use keywords the generator doesn't support.  The schema, and
+    those it refers to, are looked up in the bundle directly, rather than
+    through the `jsonschema.RefResolver`:code: of the generic validators.
+    """
+    return compile_fast_path(
+        _schema(schema_id),
+        _schema,
+        name="is_valid_" + re.sub(r"\W", "_", schema_id.lstrip("/")),
+    )
+
+
+def _validator(schema_id: str) -> Any:
+    """Get the compiled validator for the given schema id."""
+    url, _ = _local_resolver().resolve(schema_id)
+    return _compile_validator(url)
 
 
 def assert_valid(data: Mapping, schema_id: str) -> None:
@@ -93,8 +179,20 @@ def assert_valid(data: Mapping, schema_id: str) -> None:
     ...     "/orderSchema"
     ... )
     """
-    _, schema = _LOCAL_RESOLVER.resolve(schema_id)
-    jsonschema.validate(data, schema, resolver=_LOCAL_RESOLVER)
+    error = _best_error(data, schema_id)
+    if error is not None:
+        raise error
+
+
+def _best_error(data: Any, schema_id: str) -> Optional["ValidationError"]:
+    """Get the error that `jsonschema.validate()` would raise, if any."""
+    fast_path = _compile_fast_path(schema_id)
+    if fast_path is not None and fast_path(data):
+        return None
+    # pylint: disable=import-outside-toplevel
+    from jsonschema.exceptions import best_match
+
+    return best_match(_validator(schema_id).iter_errors(data))
 
 
 def assert_valid_json(data: str, schema_id: str) -> None:
@@ -117,3 +215,283 @@ def assert_valid_json(data: str, schema_id: str) -> None:
     ... )
     """  # noqa: E501 (line too long)
     assert_valid(json.loads(data), schema_id)
+
+
+def is_valid(data: Any, schema_id: str) -> bool:
+    """Check whether the given `data` is valid against the specified schema.
+
+    Takes the same parameters as `assert_valid()`:code:, but never raises,
+    and doesn't go to the trouble of choosing the most relevant error to
+    describe invalid data, so it's the cheaper choice for filtering.
+
+    >>> is_valid("0x5409ed021d9299bf6814279a6a1411a7e866a631", "/addressSchema")
+    True
+    >>> is_valid("0x5409ed021d9299bf6814279a6a1411a7e866a63", "/addressSchema")
+    False
+    """  # noqa: E501 (line too long)
+    fast_path = _compile_fast_path(schema_id)
+    if fast_path is not None and fast_path(data):
+        return True
+    return _validator(schema_id).is_valid(data)
+
+
+class ValidationResults(NamedTuple):
+    """The outcome of validating many items, as by `validate_many()`."""
+
+    valid_indices: List[int]
+    """The positions of the valid items, in ascending order."""
+
+    errors: Dict[int, "ValidationError"]
+    """The error describing each invalid item, keyed by its position."""
+
+
+def _detached(error: "ValidationError") -> "ValidationError":
+    """Copy an error without its reference to the validator's type checker.
+
+    The type checker can't be pickled, so errors must be copied like this
+    before they can be sent back from another process.
+    """
+    # pylint: disable=import-outside-toplevel
+    from jsonschema import ValidationError
+
+    return ValidationError(
+        error.message,
+        validator=error.validator,
+        path=error.relative_path,
+        cause=error.cause,
+        context=[_detached(suberror) for suberror in error.context],
+        validator_value=error.validator_value,
+        instance=error.instance,
+        schema=error.schema,
+        schema_path=error.relative_schema_path,
+    )
+
+
+def _validate_chunk(
+    start: int, items: List[Any], schema_id: str, detach: bool = False
+) -> ValidationResults:
+    results = ValidationResults([], {})
+    for index, item in enumerate(items, start):
+        error = _best_error(item, schema_id)
+        if error is None:
+            results.valid_indices.append(index)
+        else:
+            results.errors[index] = _detached(error) if detach else error
+    return results
+
+
+def validate_many(
+    items: Iterable[Any], schema_id: str, processes: Optional[int] = None
+) -> ValidationResults:
+    """Validate each of the given items against the specified schema.
+
+    Unlike calling `assert_valid()`:code: in a loop, this never raises for an
+    invalid item; instead, the error that would have been raised for it is
+    collected in the results.
+
+    :param items: The items to validate, eg the orders in a page of results
+        from a relayer.
+    :param schema_id: As for `assert_valid()`:code:.
+    :param processes: The number of worker processes among which to divide
+        the items, or `None`:code: to validate them all in this process.
+        Starting workers takes a while, so this only pays off for large
+        inputs.
+
+    >>> results = validate_many(
+    ...     ["0x00", "0x0", "0x", 1, "0xAB"], "/hexSchema"
+    ... )
+    >>> results.valid_indices
+    [0, 2]
+    >>> {index: error.message for index, error in results.errors.items()}
+    {1: "'0x0' does not match '^0x(([0-9a-f][0-9a-f])+)?$'", 3: "1 is not of type 'string'", 4: "'0xAB' does not match '^0x(([0-9a-f][0-9a-f])+)?$'"}
+    """  # noqa: E501 (line too long)
+    items = list(items)
+    if not processes or processes <= 1 or len(items) <= 1:
+        return _validate_chunk(0, items, schema_id)
+
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = -(-len(items) // (processes * 4))
+    starts = range(0, len(items), chunk_size)
+    ends = range(chunk_size, len(items) + chunk_size, chunk_size)
+    results = ValidationResults([], {})
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for chunk_results in executor.map(
+            _validate_chunk,
+            starts,
+            [items[start:end] for start, end in zip(starts, ends)],
+            repeat(schema_id),
+            repeat(True),
+        ):
+            results.valid_indices.extend(chunk_results.valid_indices)
+            results.errors.update(chunk_results.errors)
+    return results
+
+
+class ValidationMode(Enum):
+    """How a `ValidationPolicy`:py:class: decides what to validate."""
+
+    ALWAYS = auto()
+    """Validate everything, every time."""
+
+    ONCE_PER_OBJECT = auto()
+    """Validate each object only the first time it's seen, by identity.
+
+    Objects are assumed not to be mutated after they've been validated.
+    """
+
+    ONCE_PER_VALUE = auto()
+    """Validate each distinct value only the first time it's seen."""
+
+    SAMPLED = auto()
+    """Validate a random sample of what's seen, at the policy's rate."""
+
+    TRUSTED = auto()
+    """Validate nothing."""
+
+
+def _frozen(data: Any) -> Hashable:
+    """Make a hashable key equal only for equal JSON values of equal types.
+
+    :raises TypeError: if `data` contains something unhashable other than
+        dicts and lists.
+    """
+    if isinstance(data, dict):
+        return frozenset((key, _frozen(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return tuple(_frozen(value) for value in data)
+    # Key on the type too, since eg `1 == 1.0 == True`, but the three are not
+    # equally valid against every schema.
+    return (type(data), data)
+
+
+class ValidationPolicy:
+    """Decide whether to validate data, and validate it if so.
+
+    The conversion and hashing functions of `zero_ex.order_utils`:code: and
+    `zero_ex.contract_wrappers`:code: validate orders through the policy
+    returned by `get_validation_policy()`:py:func:, so that an application
+    that sees the same orders many times over, or that trusts their source,
+    can choose to spend less time validating them.
+
+    :param mode: The `ValidationMode`:py:class: to apply.
+    :param sample_rate: The fraction of data to validate, in mode
+        `SAMPLED`:code:.
+    :param maxsize: The number of objects or values to remember as valid, in
+        modes `ONCE_PER_OBJECT`:code: and `ONCE_PER_VALUE`:code:.  When full,
+        the least recently seen is forgotten.
+    :param seed: A seed for the random sampling, for reproducibility.
+
+    The `validations`:code: and `skips`:code: attributes count how often the
+    policy has validated, and declined to validate.
+
+    >>> policy = ValidationPolicy(ValidationMode.ONCE_PER_VALUE)
+    >>> policy.assert_valid("0x00", "/hexSchema")
+    >>> policy.assert_valid("0x00", "/hexSchema")
+    >>> policy.validations, policy.skips
+    (1, 1)
+    """
+
+    def __init__(
+        self,
+        mode: ValidationMode = ValidationMode.ALWAYS,
+        sample_rate: float = 0.01,
+        maxsize: int = 4096,
+        seed: Any = None,
+    ):
+        """Create a policy, with nothing yet validated."""
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.maxsize = maxsize
+        self.validations = 0
+        self.skips = 0
+        self._random = random.Random(seed)
+        self._validated: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _key(
+        self, data: Any, schema_id: str, subject: Any
+    ) -> Optional[Hashable]:
+        if self.mode is ValidationMode.ONCE_PER_OBJECT:
+            return (schema_id, id(subject))
+        try:
+            return (schema_id, _frozen(data))
+        except TypeError:
+            return None
+
+    def assert_valid(
+        self, data: Any, schema_id: str, subject: Any = None
+    ) -> None:
+        """Validate `data` against a schema, if the policy requires it.
+
+        :param data: The data to be validated.
+        :param schema_id: As for `assert_valid()`:py:func:.
+        :param subject: The object that `data`:code: represents, by whose
+            identity to remember it in mode `ONCE_PER_OBJECT`:code:, eg the
+            `Order`:code: from which a JSON dict was made.  Defaults to
+            `data`:code: itself.
+        """
+        if subject is None:
+            subject = data
+        if self.mode is ValidationMode.TRUSTED or (
+            self.mode is ValidationMode.SAMPLED
+            and self._random.random() >= self.sample_rate
+        ):
+            self.skips += 1
+            return
+
+        key = None
+        if self.mode in (
+            ValidationMode.ONCE_PER_OBJECT,
+            ValidationMode.ONCE_PER_VALUE,
+        ):
+            key = self._key(data, schema_id, subject)
+            if key is not None and key in self._validated:
+                self._validated.move_to_end(key)
+                self.skips += 1
+                return
+
+        self.validations += 1
+        assert_valid(data, schema_id)
+
+        if key is not None and self.maxsize > 0:
+            # Retaining the subject keeps its id from being reused while it's
+            # remembered.
+            self._validated[key] = subject
+            while len(self._validated) > self.maxsize:
+                self._validated.popitem(last=False)
+
+    def forget(self) -> None:
+        """Forget everything validated so far, and reset the counters."""
+        self._validated.clear()
+        self.validations = 0
+        self.skips = 0
+
+
+_VALIDATION_POLICY = ValidationPolicy()
+
+
+def get_validation_policy() -> ValidationPolicy:
+    """Get the policy by which 0x packages validate the data given to them.
+
+    Initially, it's a `ValidationPolicy`:py:class: in mode
+    `ALWAYS`:code:.
+    """
+    return _VALIDATION_POLICY
+
+
+def set_validation_policy(policy: ValidationPolicy) -> ValidationPolicy:
+    """Replace the policy returned by `get_validation_policy()`.
+
+    :returns: The policy replaced, so that it may later be restored.
+
+    >>> previous = set_validation_policy(
+    ...     ValidationPolicy(ValidationMode.TRUSTED)
+    ... )
+    >>> get_validation_policy().assert_valid("not hex", "/hexSchema")
+    >>> _ = set_validation_policy(previous)
+    """
+    global _VALIDATION_POLICY  # pylint: disable=global-statement
+    previous = _VALIDATION_POLICY
+    _VALIDATION_POLICY = policy
+    return previous
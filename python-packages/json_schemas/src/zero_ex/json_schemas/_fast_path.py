@@ -0,0 +1,191 @@
+"""Generate straight-line Python checks from simple JSON schemas.
+
+A generic validator walks a schema for every instance it validates, and a
+fixed-shape schema such as `/orderSchema`:code: costs it dozens of keyword
+dispatches, `$ref`:code: resolutions and scope changes per order.  Here, a
+schema is instead translated, once, into the source of a function that checks
+an instance with plain `isinstance()`:code: calls, key lookups and
+precompiled regular expressions, with every `$ref`:code: inlined.
+
+The generated function returns only `True`:code: or `False`:code:, and is
+conservative: it may reject an instance that the schema permits (eg a float
+where an integer is required), but never accepts one that the schema
+forbids.  So an instance it accepts is valid, and one it rejects must be
+passed to a generic validator, both to decide and to describe the error.
+
+Only the keywords used by the fixed-shape schemas are supported, namely
+`type`:code:, `pattern`:code:, `properties`:code:, `required`:code:,
+`anyOf`:code:, `allOf`:code: and `$ref`:code:.  For a schema using any other
+keyword, `compile_fast_path()`:code: returns `None`:code:.
+"""
+
+from itertools import count
+import re
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+_ANNOTATIONS = {"id", "$schema", "title", "description"}
+
+# Conservative checks of each JSON type.  Those for numbers reject floats
+# that happen to be integral, and subclasses of int other than bool, which
+# jsonschema would accept.
+_TYPE_CHECKS = {
+    "array": "isinstance({var}, list)",
+    "boolean": "type({var}) is bool",
+    "integer": "type({var}) is int",
+    "null": "{var} is None",
+    "number": "type({var}) in (int, float)",
+    "object": "isinstance({var}, dict)",
+    "string": "isinstance({var}, str)",
+}
+
+
+class _Unsupported(Exception):
+    """Raised when a schema can't be translated."""
+
+
+class _Generator:
+    """Translate a schema into the source of a checking function."""
+
+    def __init__(self, resolve: Callable[[str], Dict]):
+        self._resolve = resolve
+        self._refs_in_progress: Set[str] = set()
+        self._names = count()
+        self.namespace: Dict[str, Any] = {}
+        self.lines: List[str] = []
+
+    def _name(self, prefix: str) -> str:
+        return f"{prefix}{next(self._names)}"
+
+    def _type_expression(self, schema: Dict, var: str) -> str:
+        types = schema["type"]
+        if isinstance(types, str):
+            types = [types]
+        try:
+            checks = [_TYPE_CHECKS[type_].format(var=var) for type_ in types]
+        except (KeyError, TypeError) as error:
+            raise _Unsupported(f"type {types}") from error
+        return "(" + " or ".join(checks) + ")"
+
+    def _pattern_expression(self, schema: Dict, var: str) -> str:
+        name = self._name("pattern")
+        self.namespace[name] = re.compile(schema["pattern"])
+        if schema.get("type") == "string":
+            # the type check, which comes first, has established this.
+            return f"{name}.search({var}) is not None"
+        return f"(not isinstance({var}, str) or {name}.search({var}))"
+
+    def _ref(self, ref: str) -> Dict:
+        if ref in self._refs_in_progress:
+            raise _Unsupported(f"recursive $ref {ref}")
+        return self._resolve(ref)
+
+    def expression(self, schema: Dict, var: str) -> str:
+        """Translate a schema without object keywords into an expression."""
+        if not isinstance(schema, dict):
+            raise _Unsupported(f"schema {schema!r}")
+        conjuncts: List[str] = []
+        for keyword, value in schema.items():
+            if keyword in _ANNOTATIONS:
+                continue
+            if keyword == "type":
+                conjuncts.insert(0, self._type_expression(schema, var))
+            elif keyword == "pattern":
+                conjuncts.append(self._pattern_expression(schema, var))
+            elif keyword in ("anyOf", "allOf"):
+                operator = " or " if keyword == "anyOf" else " and "
+                conjuncts.append(
+                    "("
+                    + operator.join(
+                        self.expression(subschema, var) for subschema in value
+                    )
+                    + ")"
+                )
+            elif keyword == "$ref":
+                conjuncts.append(self.expression(self._ref(value), var))
+            else:
+                raise _Unsupported(f"keyword {keyword}")
+        return " and ".join(conjuncts) or "True"
+
+    def emit(self, schema: Dict, var: str, indent: str) -> None:
+        """Append statements returning `False` if `var` may not match."""
+        try:
+            self.lines.append(
+                f"{indent}if not ({self.expression(schema, var)}):"
+                + " return False"
+            )
+            return
+        except _Unsupported:
+            if not isinstance(schema, dict):
+                raise
+        is_object = schema.get("type") == "object"
+        # check the type first, so that later checks may rely on it.
+        for keyword in sorted(schema, key=lambda keyword: keyword != "type"):
+            value = schema[keyword]
+            if keyword in _ANNOTATIONS or keyword == "properties":
+                continue
+            if keyword == "required":
+                missing = " or ".join(f"{key!r} not in {var}" for key in value)
+                guard = "" if is_object else f"isinstance({var}, dict) and "
+                self.lines.append(
+                    f"{indent}if {guard}({missing or 'False'}): return False"
+                )
+            elif keyword == "allOf":
+                for subschema in value:
+                    self.emit(subschema, var, indent)
+            elif keyword == "$ref":
+                referent = self._ref(value)
+                self._refs_in_progress.add(value)
+                self.emit(referent, var, indent)
+                self._refs_in_progress.discard(value)
+            else:
+                self.lines.append(
+                    f"{indent}if not ({self.expression({keyword: value}, var)}):"  # noqa: E501 (line too long)
+                    + " return False"
+                )
+        if "properties" in schema:
+            if not is_object:
+                self.lines.append(f"{indent}if isinstance({var}, dict):")
+                indent += "    "
+            self._emit_properties(schema["properties"], var, indent)
+
+    def _emit_properties(
+        self, properties: Dict[str, Dict], var: str, indent: str
+    ) -> None:
+        for key, subschema in properties.items():
+            value_var = self._name("value")
+            self.lines.append(f"{indent}if {key!r} in {var}:")
+            self.lines.append(f"{indent}    {value_var} = {var}[{key!r}]")
+            self.emit(subschema, value_var, indent + "    ")
+        if not properties:
+            self.lines.append(f"{indent}pass")
+
+
+def compile_fast_path(
+    schema: Dict, resolve: Callable[[str], Dict], name: str = "fast_path"
+) -> Optional[Callable[[Any], bool]]:
+    """Generate a function conservatively checking instances of `schema`.
+
+    :param schema: The schema to translate.
+    :param resolve: A function returning the schema referred to by a
+        `$ref`:code:.
+    :param name: A name for the generated function, for tracebacks.
+    :returns: The generated function, or `None`:code: if the schema uses
+        unsupported keywords.
+    """
+    generator = _Generator(resolve)
+    try:
+        generator.emit(schema, "instance", "    ")
+    except _Unsupported:
+        return None
+    source = "\n".join(
+        [f"def {name}(instance):", *generator.lines, "    return True"]
+    )
+    namespace = dict(generator.namespace)
+    # the source is generated from the bundled schemas, which are trusted:
+    exec(  # nosec pylint: disable=exec-used
+        compile(source, f"<fast path for {name}>", "exec"), namespace
+    )
+    generated = namespace[name]
+    generated.source = source  # type: ignore
+    return generated
@@ -0,0 +1,31 @@
+"""A `jsonschema.RefResolver`:code: over the bundled schemas.
+
+Kept apart from `zero_ex.json_schemas`:code: so that `jsonschema`:code:, which
+is slow to import, is imported only once data fails the fast path of a
+schema, or a generic validator is otherwise needed.
+"""
+
+from typing import Dict
+
+import jsonschema
+
+
+class LocalRefResolver(jsonschema.RefResolver):
+    """Resolve package-local JSON schema id's, from the bundled schemas."""
+
+    def __init__(self, schemas: Dict[str, Dict]):
+        """Initialize a new instance, storing the given schemas."""
+        jsonschema.RefResolver.__init__(self, "", "", store=schemas)
+
+    def resolve_from_url(self, url: str) -> Dict:
+        """Resolve the given URL.
+
+        :param url: a string representing the URL of the JSON schema to fetch.
+        :returns: the deserialized JSON schema
+        :raises ValueError: when no schema has the id in `url`.
+        """
+        ref = url.replace("file://", "")
+        try:
+            return self.store[ref]
+        except KeyError:
+            raise ValueError(f"There is no schema with id {ref}.") from None
@@ -1,11 +1,47 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
 
 
 class RefResolver:
+    store: Dict[str, Any]
+
+    def __init__(
+        self,
+        base_uri: str,
+        referrer: Any,
+        store: Any = ...,
+        cache_remote: bool = ...,
+        handlers: Any = ...,
+        urljoin_cache: Any = ...,
+        remote_cache: Any = ...,
+    ) -> None: ...
+
     def resolve(self, url: str) -> Tuple[str, Dict]:
         ...
 
 
-class ValidationError(Exception): pass
+class ValidationError(Exception):
+    message: str
+    validator: Any
+    validator_value: Any
+    instance: Any
+    schema: Any
+    cause: Optional[Exception]
+    context: List["ValidationError"]
+    relative_path: Deque[Union[str, int]]
+    relative_schema_path: Deque[Union[str, int]]
+
+    def __init__(
+        self,
+        message: str,
+        validator: Any = ...,
+        path: Iterable[Union[str, int]] = ...,
+        cause: Optional[Exception] = ...,
+        context: Iterable["ValidationError"] = ...,
+        validator_value: Any = ...,
+        instance: Any = ...,
+        schema: Any = ...,
+        schema_path: Iterable[Union[str, int]] = ...,
+        parent: Optional["ValidationError"] = ...,
+    ) -> None: ...
 
 def validate(instance: Any, schema: Dict, cls=None, *args, **kwargs) -> None: pass
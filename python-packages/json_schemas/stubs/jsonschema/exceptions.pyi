@@ -0,0 +1,6 @@
+from typing import Iterable, Optional
+
+from jsonschema import ValidationError
+
+
+def best_match(errors: Iterable[ValidationError]) -> Optional[ValidationError]: ...
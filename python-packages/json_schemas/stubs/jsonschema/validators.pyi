@@ -0,0 +1,4 @@
+from typing import Any, Dict
+
+
+def validator_for(schema: Dict, default: Any = ...) -> Any: ...
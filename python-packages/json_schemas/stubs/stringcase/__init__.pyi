@@ -1,2 +0,0 @@
-def snakecase(_: str):
-    ...
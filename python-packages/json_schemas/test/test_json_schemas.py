@@ -1,7 +1,24 @@
 """Tests of zero_ex.json_schemas"""
 
+from os import path
 
-from zero_ex.json_schemas import _LOCAL_RESOLVER, assert_valid
+import jsonschema
+import pytest
+
+from zero_ex.json_schemas import (
+    _compile_fast_path,
+    _compile_validator,
+    _local_resolver,
+    _schemas,
+    _validator,
+    assert_valid,
+    get_validation_policy,
+    is_valid,
+    set_validation_policy,
+    validate_many,
+    ValidationMode,
+    ValidationPolicy,
+)
 
 
 NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
@@ -32,13 +49,235 @@ def test_assert_valid_caches_resources():
     In order to test the cache we much access the private class of
     `json_schemas` and reset the LRU cache on `_LocalRefResolver`.
     For this to happen, we need to disable errror `W0212`
-    on _LOCAL_RESOLVER
+    on the resolver returned by `_local_resolver()`.
     """
-    _LOCAL_RESOLVER._remote_cache.cache_clear()  # pylint: disable=W0212
+    _local_resolver()._remote_cache.cache_clear()  # pylint: disable=W0212
 
-    assert_valid(EMPTY_ORDER, "/orderSchema")
+    # An integral float is left by the fast path to the generic validator.
+    assert_valid(dict(EMPTY_ORDER, makerFee=0.0), "/orderSchema")
     cache_info = (
-        _LOCAL_RESOLVER._remote_cache.cache_info()  # pylint: disable=W0212
+        _local_resolver()._remote_cache.cache_info()  # pylint: disable=W0212
     )
     assert cache_info.currsize == 4
     assert cache_info.hits > 0
+
+
+def test_assert_valid_raises_as_jsonschema_validate_does():
+    """Test that `assert_valid()` raises the error `validate()` would."""
+    invalid_order = dict(EMPTY_ORDER, makerFee="-1", salt=None)
+    del invalid_order["chainId"]
+    _, schema = _local_resolver().resolve("/orderSchema")
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(invalid_order, schema, resolver=_local_resolver())
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        assert_valid(invalid_order, "/orderSchema")
+
+    assert str(actual.value) == str(expected.value)
+    assert actual.value.path == expected.value.path
+    assert actual.value.schema_path == expected.value.schema_path
+
+
+def test_assert_valid_compiles_each_schema_once():
+    """Test that a schema's validator is built once and then reused."""
+    assert_valid(EMPTY_ORDER, "/orderSchema")
+    misses = _compile_validator.cache_info().misses
+
+    assert_valid(EMPTY_ORDER, "/orderSchema")
+    assert_valid(dict(EMPTY_ORDER, signature="0x00"), "/signedOrderSchema")
+    assert_valid(dict(EMPTY_ORDER, signature="0x00"), "/signedOrderSchema")
+
+    assert _compile_validator.cache_info().misses <= misses + 1
+    assert _validator("/orderSchema") is _validator("/orderSchema")
+
+
+def test_fast_path_never_accepts_invalid_orders():
+    """Test that the generated order checks agree with the schemas."""
+    odd_values = [
+        None,
+        True,
+        0,
+        -1,
+        1.5,
+        2.0,
+        "",
+        "0x",
+        "0x0",
+        "0x00",
+        "0xAB",
+        "12",
+        "1.2",
+        "0x" + "a" * 40,
+        "0x" + "A" * 40,
+        "0x" + "a" * 40 + "\n",
+        "0x" + "g" * 40,
+        [],
+        {},
+    ]
+    signed_order = dict(EMPTY_ORDER, signature="0x00")
+    for schema_id, valid_instance in (
+        ("/orderSchema", EMPTY_ORDER),
+        ("/signedOrderSchema", signed_order),
+    ):
+        fast_path = _compile_fast_path(schema_id)
+        validator = _validator(schema_id)
+        assert fast_path(valid_instance)
+        instances = [None, [], "0x00", dict(valid_instance, extra=None)]
+        for key in valid_instance:
+            instances.append(
+                {k: v for k, v in valid_instance.items() if k != key}
+            )
+            instances.extend(
+                dict(valid_instance, **{key: value}) for value in odd_values
+            )
+        for instance in instances:
+            if fast_path(instance):
+                assert validator.is_valid(instance), instance
+            elif validator.is_valid(instance):
+                assert_valid(instance, schema_id)
+            else:
+                with pytest.raises(jsonschema.ValidationError):
+                    assert_valid(instance, schema_id)
+
+
+def test_validate_many():
+    """Test that each item's error is the one `assert_valid()` raises."""
+    items = [
+        EMPTY_ORDER,
+        dict(EMPTY_ORDER, makerFee="-1"),
+        dict(EMPTY_ORDER, makerFee=0.0),
+        None,
+        dict(EMPTY_ORDER, salt="1"),
+    ]
+
+    for processes in (None, 2):
+        results = validate_many(items, "/orderSchema", processes=processes)
+
+        assert results.valid_indices == [0, 2, 4]
+        assert sorted(results.errors) == [1, 3]
+        for index, error in results.errors.items():
+            with pytest.raises(jsonschema.ValidationError) as raised:
+                assert_valid(items[index], "/orderSchema")
+            assert str(error) == str(raised.value)
+    assert validate_many([], "/orderSchema", processes=2) == ([], {})
+
+
+def test_is_valid():
+    """Test that `is_valid()` agrees with `assert_valid()`."""
+    assert is_valid(EMPTY_ORDER, "/orderSchema")
+    assert is_valid(dict(EMPTY_ORDER, makerFee=0.0), "/orderSchema")
+    assert not is_valid(dict(EMPTY_ORDER, makerFee="-1"), "/orderSchema")
+    assert not is_valid(EMPTY_ORDER, "/signedOrderSchema")
+
+
+def test_schemas_resolve_without_disk_io(monkeypatch):
+    """Test that every schema is resolved from the bundle, once loaded."""
+    _local_resolver()
+
+    def _no_open(*args, **kwargs):
+        raise AssertionError("unexpected file access")
+
+    monkeypatch.setattr("builtins.open", _no_open)
+    _local_resolver()._remote_cache.cache_clear()  # pylint: disable=W0212
+
+    _, schema = _local_resolver().resolve("/orderCancellationRequestsSchema")
+    # the id implied by the schema's file name resolves too:
+    assert _local_resolver().resolve("/orderCancelSchema")[1] == schema
+    assert_valid(EMPTY_ORDER, "/orderSchema")
+    with pytest.raises(ValueError):
+        _local_resolver().resolve("/noSuchSchema")
+
+
+def test_schema_bundle_is_read_once(monkeypatch):
+    """Test that the bundle is read on first use, and nothing after that."""
+    for cache in (
+        _schemas,
+        _local_resolver,
+        _compile_validator,
+        _compile_fast_path,
+    ):
+        cache.cache_clear()
+    opened_files = []
+
+    def _open(file, *args, **kwargs):
+        opened_files.append(path.basename(file))
+        return open(file, *args, **kwargs)
+
+    monkeypatch.setattr("zero_ex.json_schemas.open", _open, raising=False)
+
+    assert is_valid(EMPTY_ORDER, "/orderSchema")
+    assert opened_files == ["schemas.json"]
+
+    assert_valid(dict(EMPTY_ORDER, makerFee=0.0), "/orderSchema")
+    assert not is_valid(EMPTY_ORDER, "/signedOrderSchema")
+    assert list(
+        validate_many(
+            [EMPTY_ORDER, dict(EMPTY_ORDER, salt="-1")], "/orderSchema"
+        ).errors
+    ) == [1]
+    with pytest.raises(jsonschema.ValidationError):
+        assert_valid({"orders": [EMPTY_ORDER]}, "/orderConfigRequestSchema")
+    assert opened_files == ["schemas.json"]
+
+
+def test_validation_policy_modes():
+    """Test what each mode of `ValidationPolicy` validates, and skips."""
+    order = dict(EMPTY_ORDER)
+    equal_order = dict(EMPTY_ORDER)
+
+    def validations(policy, *instances):
+        for instance in instances:
+            policy.assert_valid(instance, "/orderSchema")
+        return policy.validations, policy.skips
+
+    assert validations(ValidationPolicy(), order, order) == (2, 0)
+    assert validations(
+        ValidationPolicy(ValidationMode.ONCE_PER_OBJECT),
+        order,
+        order,
+        equal_order,
+    ) == (2, 1)
+    assert validations(
+        ValidationPolicy(ValidationMode.ONCE_PER_VALUE),
+        order,
+        order,
+        equal_order,
+        dict(EMPTY_ORDER, chainId=50.0),
+    ) == (2, 2)
+    assert validations(
+        ValidationPolicy(ValidationMode.TRUSTED), order, None
+    ) == (0, 2)
+
+    sampled = ValidationPolicy(
+        ValidationMode.SAMPLED, sample_rate=0.25, seed=0
+    )
+    validations(sampled, *[order] * 1000)
+    assert 200 < sampled.validations < 300
+    assert sampled.validations + sampled.skips == 1000
+
+
+def test_validation_policy_remembers_only_valid_data():
+    """Test that invalid data is validated, and rejected, every time."""
+    policy = ValidationPolicy(ValidationMode.ONCE_PER_VALUE, maxsize=1)
+    invalid_order = dict(EMPTY_ORDER, makerFee=True)
+
+    policy.assert_valid(dict(EMPTY_ORDER, makerFee=1), "/orderSchema")
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError):
+            policy.assert_valid(invalid_order, "/orderSchema")
+
+    policy.assert_valid(EMPTY_ORDER, "/orderSchema")
+    policy.assert_valid(dict(EMPTY_ORDER, makerFee=1), "/orderSchema")
+    assert (policy.validations, policy.skips) == (5, 0)
+
+
+def test_set_validation_policy():
+    """Test replacing, and restoring, the package-wide policy."""
+    policy = ValidationPolicy(ValidationMode.TRUSTED)
+
+    previous = set_validation_policy(policy)
+    try:
+        assert get_validation_policy() is policy
+    finally:
+        assert set_validation_policy(previous) is policy
+    assert get_validation_policy() is previous
@@ -10,11 +10,12 @@ import subprocess  # nosec
 from shutil import rmtree
 from os import environ, path
 from pathlib import Path
-from sys import argv, exit  # pylint: disable=redefined-builtin
+from statistics import median
+from sys import argv, executable, exit  # pylint: disable=redefined-builtin
 
 from distutils.command.clean import clean
 import distutils.command.build_py
-from setuptools import find_packages, setup
+from setuptools import Command, find_packages, setup
 from setuptools.command.test import test as TestCommand
 
 
@@ -150,6 +151,66 @@ class GanacheCommand(distutils.command.build_py.build_py):
         subprocess.call(cmd_line)  # nosec
 
 
+class BenchImportCommand(Command):
+    """Custom command to measure how long importing the package takes."""
+
+    description = (
+        "Time `import zero_ex.order_utils` in fresh interpreters, against"
+        + " also importing what it used to import eagerly."
+    )
+
+    user_options = [("repeat=", "r", "number of interpreters to time")]
+
+    # modules that only the functions talking to a node need:
+    heavy_modules = [
+        "web3",
+        "eth_account",
+        "jsonschema",
+        "zero_ex.contract_addresses",
+        "zero_ex.contract_wrappers.exchange",
+    ]
+
+    def initialize_options(self):
+        """Set the default number of interpreters to time."""
+        self.repeat = 10  # pylint: disable=attribute-defined-outside-init
+
+    def finalize_options(self):
+        """Check the number of interpreters to time."""
+        # pylint: disable=attribute-defined-outside-init
+        self.repeat = int(self.repeat)
+
+    def _time_import(self, modules):
+        """Get the median time to import `modules`, and which heavy ones."""
+        script = (
+            "import sys, time\n"
+            + "start = time.perf_counter()\n"
+            + "".join(f"import {module}\n" for module in modules)
+            + "print(time.perf_counter() - start)\n"
+            + f"print(*[m for m in {self.heavy_modules!r}"
+            + " if m in sys.modules])"
+        )
+        timings = []
+        for _ in range(self.repeat):
+            output = subprocess.check_output(  # nosec
+                [executable, "-c", script], universal_newlines=True
+            ).split("\n")
+            timings.append(float(output[0]))
+        return median(timings), output[1].split()
+
+    def run(self):
+        """Time the lazy import, and the eager one it replaced."""
+        for label, modules in (
+            ("lazy", ["zero_ex.order_utils"]),
+            ("eager", ["zero_ex.order_utils", *self.heavy_modules]),
+        ):
+            seconds, loaded = self._time_import(modules)
+            print(
+                f"{label}: {seconds * 1000:.1f} ms median of {self.repeat},"
+                + f" loading {', '.join(loaded) or 'none'} of the heavy"
+                + " modules"
+            )
+
+
 with open("README.md", "r") as file_handle:
     README_MD = file_handle.read()
 
@@ -174,6 +235,7 @@ setup(
         "publish": PublishCommand,
         "publish_docs": PublishDocsCommand,
         "ganache": GanacheCommand,
+        "bench_import": BenchImportCommand,
     },
     install_requires=[
         "0x-contract-addresses",
@@ -182,11 +244,14 @@ setup(
         "deprecated",
         "web3",
         "eth-abi",
+        "eth-account",
+        "eth-keys",
         "eth_typing",
         "eth_utils",
         "mypy_extensions",
     ],
     extras_require={
+        "batch": ["numpy"],
         "dev": [
             "0x-contract-wrappers",
             "bandit",
@@ -195,6 +260,7 @@ setup(
             "coveralls",
             "mypy",
             "mypy_extensions",
+            "numpy",
             "pycodestyle",
             "pydocstyle",
             "pylint",
@@ -203,10 +269,13 @@ setup(
             "sphinx-autodoc-typehints",
             "tox",
             "twine",
-        ]
+        ],
     },
     python_requires=">=3.6, <4",
-    package_data={"zero_ex.order_utils": ["py.typed"]},
+    package_data={
+        "zero_ex.order_utils": ["py.typed"],
+        "zero_ex.dev_utils": ["py.typed"],
+    },
     package_dir={"": "src"},
     license="Apache 2.0",
     keywords=(
@@ -6,13 +6,15 @@ pushed upstream into eth-abi.
 """
 
 import re
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from mypy_extensions import TypedDict
 
-from eth_abi import encode_abi
-from web3 import Web3
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+from eth_utils import keccak
 
+from .memoize import BoundedMemo
 from .type_assertions import assert_is_string, assert_is_list
 
 
@@ -68,7 +70,7 @@ def event_id(name: str, types: List[str]) -> str:
     assert_is_list(types, "types")
 
     signature = f"{name}({','.join(list(map(elementary_name, types)))})"
-    return Web3.sha3(text=signature).hex()
+    return "0x" + keccak(text=signature).hex()
 
 
 def method_id(name: str, types: List[str]) -> str:
@@ -83,19 +85,73 @@ def method_id(name: str, types: List[str]) -> str:
     return event_id(name, types)[0:10]
 
 
+class CompiledSignature:
+    """A method signature, prepared for encoding calls to it.
+
+    Holds the method's 4-byte selector and an eth-abi encoder for its
+    argument types, so that encoding a call costs no parsing or hashing.
+    Get one from `compile_signature()`:code:.
+    """
+
+    def __init__(self, signature: str):
+        """Parse the signature, and prepare its selector and encoder."""
+        parsed: MethodSignature = parse_signature(signature)
+        self.signature = signature
+        self.types: Tuple[str, ...] = tuple(parsed["args"])
+        self.selector = bytes.fromhex(
+            method_id(parsed["method"], parsed["args"])[2:]
+        )
+        self._encoder = TupleEncoder(
+            encoders=[
+                registry.get_encoder(type_str) for type_str in self.types
+            ]
+        )
+
+    def __call__(self, *args: Any) -> bytes:
+        """Encode a call with the given arguments, selector first."""
+        return self.selector + self._encoder(args)
+
+    def __repr__(self) -> str:
+        """Show the signature compiled."""
+        return f"compile_signature({self.signature!r})"
+
+
+def compile_signature(signature: str) -> CompiledSignature:
+    r"""Prepare a method signature for encoding many calls to it.
+
+    :param signature: A signature such as `"ERC20Token(address)"`:code:.
+    :raises ValueError: If `signature`:code: isn't a method signature.
+
+    >>> erc20_token = compile_signature("ERC20Token(address)")
+    >>> erc20_token.selector.hex()
+    'f47261b0'
+    >>> erc20_token("0x1dc4c1cefef38a777b15aa20260a54e584b16c48") == (
+    ...     simple_encode(
+    ...         "ERC20Token(address)",
+    ...         "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+    ...     )
+    ... )
+    True
+    """
+    assert_is_string(signature, "signature")
+
+    return CompiledSignature(signature)
+
+
+COMPILED_SIGNATURES = BoundedMemo(compile_signature, maxsize=256)
+"""Signatures recently compiled by `simple_encode()`:code:."""
+
+
 def simple_encode(method: str, *args: Any) -> bytes:
     r"""Encode a method ABI.
 
+    Signatures are compiled with `compile_signature()`:code: and memoized in
+    `COMPILED_SIGNATURES`:code:, so repeated calls with the same
+    `method`:code: skip parsing it and hashing it.
+
     >>> simple_encode("ERC20Token(address)", "0x1dc4c1cefef38a777b15aa20260a54e584b16c48")
     b'\xf4ra\xb0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1d\xc4\xc1\xce\xfe\xf3\x8aw{\x15\xaa &\nT\xe5\x84\xb1lH'
     """  # noqa: E501 (line too long)
     assert_is_string(method, "method")
 
-    signature: MethodSignature = parse_signature(method)
-
-    return bytes.fromhex(
-        (
-            method_id(signature["method"], signature["args"])
-            + encode_abi(signature["args"], args).hex()
-        )[2:]
-    )
+    return COMPILED_SIGNATURES(method)(*args)
@@ -0,0 +1,64 @@
+"""A shared, bounded cache of validated and checksummed addresses.
+
+Validating an Ethereum address with `eth_utils.is_address()`:code: and
+computing its EIP-55 checksum with `eth_utils.to_checksum_address()`:code:
+each hash the address with keccak.  An order book mentions the same few
+thousand maker, taker and token addresses over and over, so those results are
+memoized here, in `ADDRESS_CACHE`:code:, which
+`zero_ex.dev_utils.type_assertions.assert_is_address()`:code: and the contract
+wrappers share.
+
+>>> normalize_address("0x5409ed021d9299bf6814279a6a1411a7e866a631")
+'0x5409ED021D9299bf6814279A6A1411A7e866A631'
+>>> is_valid_address("0x5409ed021d9299bf6814279a6a1411a7e866a631")
+True
+>>> is_valid_address("0x5409ed021d9299bf6814279a6a1411a7e866a63")
+False
+"""
+
+from typing import Any, Optional
+
+from eth_utils import is_address, to_checksum_address
+
+from zero_ex.dev_utils.memoize import BoundedMemo
+
+
+def _normalize_address(address: Any) -> Optional[str]:
+    if not is_address(address):
+        return None
+    return to_checksum_address(address)
+
+
+ADDRESS_CACHE = BoundedMemo(_normalize_address, maxsize=8192)
+"""Checksum forms of recently seen address strings, or `None`:code: for
+strings that aren't valid addresses.
+
+Its `hits`:code:, `misses`:code: and `currsize`:code: attributes report its
+effectiveness, and its capacity can be changed with its `resize()`:code:
+method.  When full, the least recently used address is evicted.
+
+>>> ADDRESS_CACHE.maxsize
+8192
+"""
+
+
+def normalize_address(value: Any) -> Optional[str]:
+    """Get the checksum form of an address, or `None` if it's invalid.
+
+    Address strings are looked up in, or added to, `ADDRESS_CACHE`:code:.
+    Other values accepted by `eth_utils.to_checksum_address()`:code:, such as
+    20-byte addresses, are converted without memoization.
+    """
+    if isinstance(value, str):
+        return ADDRESS_CACHE(value)
+    return _normalize_address(value)
+
+
+def is_valid_address(value: Any) -> bool:
+    """Tell whether `value` is a valid address, as `eth_utils.is_address()`.
+
+    Like `normalize_address()`:code:, only strings are memoized.
+    """
+    if isinstance(value, str):
+        return ADDRESS_CACHE(value) is not None
+    return is_address(value)
@@ -0,0 +1,146 @@
+"""Bounded memoization with hit and miss statistics.
+
+Order books are highly repetitive: a handful of tokens, addresses and asset
+data strings account for nearly every order.  The helpers in this module let
+hot paths trade a small, bounded amount of memory for skipping repeated work.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Callable, Hashable, Tuple
+
+
+class BoundedMemo:
+    """Memoize a single-argument function in a bounded, LRU-evicting cache.
+
+    This is a thin, resizable veneer over :func:`functools.lru_cache`, whose
+    purpose is to expose the cache's statistics as attributes, so that callers
+    can monitor how effective the cache is in their workload.
+
+    :param function: The function to memoize.  It must accept exactly one
+        hashable argument, and must be pure.
+    :param maxsize: The maximum number of results to retain.  When full, the
+        least recently used result is evicted.
+
+    >>> square = BoundedMemo(lambda x: x * x, maxsize=2)
+    >>> square(3), square(3), square(4)
+    (9, 9, 16)
+    >>> square.hits, square.misses, square.currsize
+    (1, 2, 2)
+    >>> square(5)
+    25
+    >>> square.currsize
+    2
+    """
+
+    def __init__(self, function: Callable[[Any], Any], maxsize: int = 1024):
+        """Wrap `function`:code: in a cache holding `maxsize`:code: results."""
+        self._function = function
+        self._cached = lru_cache(maxsize=maxsize)(function)
+
+    def __call__(self, arg: Any) -> Any:
+        """Return the (possibly cached) result of the function for `arg`."""
+        return self._cached(arg)
+
+    @property
+    def hits(self) -> int:
+        """Number of calls answered from the cache."""
+        return self._cached.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        """Number of calls that had to invoke the underlying function."""
+        return self._cached.cache_info().misses
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of results retained."""
+        return self._cached.cache_info().maxsize
+
+    @property
+    def currsize(self) -> int:
+        """Number of results currently retained."""
+        return self._cached.cache_info().currsize
+
+    def cache_info(self):
+        """Return statistics, as from :func:`functools.lru_cache`."""
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Discard all cached results and reset the statistics."""
+        self._cached.cache_clear()
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity of the cache, discarding its contents."""
+        self._cached = lru_cache(maxsize=maxsize)(self._function)
+
+
+class ExpiringCache:
+    """A bounded, LRU-evicting mapping whose entries also expire.
+
+    Suited to caching facts that hold for a while but not forever, such as
+    results of contract calls.  Each entry is stored with its own lifetime,
+    so that one cache can hold both long-lived and short-lived entries.
+
+    :param maxsize: The maximum number of entries to retain.  When full, the
+        least recently used entry is evicted.
+    :param clock: A function returning the current time in seconds.  Defaults
+        to :func:`time.monotonic`.
+
+    >>> now = [0]
+    >>> cache = ExpiringCache(maxsize=2, clock=lambda: now[0])
+    >>> cache.set("a", 1, ttl=10)
+    >>> cache.get("a")
+    1
+    >>> now[0] = 11
+    >>> cache.get("a") is None
+    True
+    >>> cache.hits, cache.misses, cache.currsize
+    (1, 1, 0)
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, clock: Callable[[], float] = monotonic
+    ):
+        """Create an empty cache holding up to `maxsize`:code: entries."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+
+    @property
+    def currsize(self) -> int:
+        """Number of entries currently retained, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for `key`:code:, or `default`:code:."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expiry, value = entry
+            if self._clock() < expiry:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store `value`:code: for `key`:code: for `ttl`:code: seconds."""
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def cache_clear(self) -> None:
+        """Discard all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -2,8 +2,7 @@
 
 from typing import Any
 
-from eth_utils import is_address
-from web3.providers.base import BaseProvider
+from zero_ex.dev_utils.address_cache import is_valid_address
 
 
 def assert_is_string(value: Any, name: str) -> None:
@@ -65,10 +64,11 @@ def assert_is_address(value: Any, name: str) -> None:
     """Assert that `value` is a valid Ethereum address.
 
     If `value` isn't a hex string, raise a TypeError.  If it isn't a valid
-    Ethereum address, raise a ValueError.
+    Ethereum address, raise a ValueError.  Outcomes are memoized in
+    `zero_ex.dev_utils.address_cache.ADDRESS_CACHE`:code:.
     """
     assert_is_hex_string(value, name)
-    if not is_address(value):
+    if not is_valid_address(value):
         raise ValueError(
             f"Expected variable '{name}' to be a valid Ethereum"
             + " address, but it's not."
@@ -80,6 +80,10 @@ def assert_is_provider(value: Any, name: str) -> None:
 
     If `value` isn't a Web3 provider, raise a TypeError.
     """
+    # imported here, so that importing this module doesn't import web3:
+    # pylint: disable=import-outside-toplevel
+    from web3.providers.base import BaseProvider
+
     if not isinstance(value, BaseProvider):
         raise TypeError(
             f"Expected variable '{name}' to be an instance of a Web3 provider,"
@@ -18,30 +18,75 @@ just this purpose.  To start it::
 """
 
 from enum import auto, Enum
+from functools import singledispatch
 import json
-from typing import cast, Tuple, Union
+import sys
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
-from pkg_resources import resource_string
 from mypy_extensions import TypedDict
 
 from eth_typing import HexStr
-from eth_utils import keccak, remove_0x_prefix, to_bytes, to_checksum_address
-from web3 import Web3
-import web3.exceptions
-from web3.providers.base import BaseProvider
-from web3.contract import Contract
-
-from zero_ex.contract_addresses import chain_to_addresses, ChainId
-import zero_ex.contract_artifacts
-from zero_ex.contract_wrappers.exchange import Exchange
-from zero_ex.contract_wrappers.exchange.types import Order
-from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
+from eth_utils import keccak, remove_0x_prefix, to_checksum_address
+from eth_keys.datatypes import PrivateKey, Signature
+from eth_keys.exceptions import BadSignature
+
+from zero_ex.dev_utils.address_cache import normalize_address
+from zero_ex.dev_utils.memoize import BoundedMemo, ExpiringCache
+from zero_ex.order_utils.compact_order import (
+    _address_to_bytes,
+    _ensure_bytes,
+    _hex_to_bytes,
+    CompactOrder,
+)
+from zero_ex.order_utils.eip712 import exchange_domain_separator, ORDER
 from zero_ex.dev_utils.type_assertions import (
     assert_is_address,
     assert_is_hex_string,
     assert_is_provider,
 )
-from zero_ex.json_schemas import assert_valid
+
+# Hashing orders, and checking their signatures locally, need none of web3,
+# the contract wrappers or the contract addresses, which are slow to import,
+# so they're imported only by the functions that talk to a node.
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports
+    from eth_account.signers.local import LocalAccount
+    from web3 import Web3
+    from web3.providers.base import BaseProvider
+    from zero_ex.contract_wrappers.exchange import Exchange
+    from zero_ex.contract_wrappers.exchange.types import Order
+    from zero_ex.contract_wrappers.session import ProviderSession
+    from zero_ex.order_utils.asset_data_utils import DecodedAssetData
+
+
+if sys.version_info < (3, 7):
+    # modules can't import their attributes lazily before PEP 562, so keep
+    # importing `Order`, formerly imported here unconditionally, eagerly:
+    # pylint: disable=ungrouped-imports,wrong-import-position
+    from zero_ex.contract_wrappers.exchange.types import Order
+else:
+
+    def __getattr__(name: str) -> Any:
+        """Import `Order`, formerly imported here eagerly, on first access."""
+        if name == "Order":
+            # pylint: disable=import-outside-toplevel,redefined-outer-name
+            from zero_ex.contract_wrappers.exchange.types import Order
+
+            return Order
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class _Constants:
@@ -51,38 +96,10 @@ class _Constants:
 
     eip191_header = b"\x19\x01"
 
-    eip712_domain_separator_schema_hash = keccak(
-        b"EIP712Domain("
-        + b"string name,"
-        + b"string version,"
-        + b"uint256 chainId,"
-        + b"address verifyingContract"
-        + b")"
-    )
+    eth_sign_header = b"\x19Ethereum Signed Message:\n32"
 
-    eip712_domain_struct_header = (
-        eip712_domain_separator_schema_hash
-        + keccak(b"0x Protocol")
-        + keccak(b"3.0.0")
-    )
-
-    eip712_order_schema_hash = keccak(
-        b"Order("
-        + b"address makerAddress,"
-        + b"address takerAddress,"
-        + b"address feeRecipientAddress,"
-        + b"address senderAddress,"
-        + b"uint256 makerAssetAmount,"
-        + b"uint256 takerAssetAmount,"
-        + b"uint256 makerFee,"
-        + b"uint256 takerFee,"
-        + b"uint256 expirationTimeSeconds,"
-        + b"uint256 salt,"
-        + b"bytes makerAssetData,"
-        + b"bytes takerAssetData,"
-        + b"bytes makerFeeAssetData,"
-        + b"bytes takerFeeAssetData"
-        + b")"
+    secp256k1_n = (
+        0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
     )
 
     class SignatureType(Enum):
@@ -98,11 +115,189 @@ class _Constants:
         N_SIGNATURE_TYPES = auto()
 
 
+def _keccak_asset_data(asset_data: Union[str, bytes]) -> bytes:
+    return keccak(_ensure_bytes(asset_data))
+
+
+ASSET_DATA_DIGEST_CACHE = BoundedMemo(_keccak_asset_data, maxsize=4096)
+"""Keccak digests of recently hashed asset data, shared by order hashers.
+
+A real order book is dominated by a few distinct asset data values (think
+WETH, ZRX and DAI), so most of the asset data digests needed for order hashing
+can be answered from this cache rather than recomputed.  Its `hits`:code: and
+`misses`:code: attributes report its effectiveness, and its capacity can be
+changed with its `resize()`:code: method.
+
+>>> ASSET_DATA_DIGEST_CACHE.maxsize
+4096
+"""
+
+
+_eip712_domain_struct_hash = exchange_domain_separator
+
+
+def _pack_order(
+    order: Union["Order", CompactOrder, "SignedOrder"]
+) -> CompactOrder:
+    """Reduce an order to a `CompactOrder`:code:, cheap to pickle and hash."""
+    if isinstance(order, SignedOrder):
+        return order.compact_order
+    return CompactOrder.from_order(order)
+
+
+def _hash_packed_order(
+    eip712_prefix: bytes, packed_order: CompactOrder, digest: BoundedMemo
+) -> bytes:
+    """Hash an order previously reduced by `_pack_order()`:code:.
+
+    :param eip712_prefix: The EIP-191 header followed by the EIP-712 domain
+        separator of the Exchange deployment.
+    :param digest: Memo of asset data keccak digests.
+    """
+    return keccak(eip712_prefix + ORDER.struct_hash(packed_order, digest))
+
+
+class OrderHasher:
+    """Hash orders destined for a particular Exchange deployment.
+
+    Every order in a relayer's book shares the same chain ID and Exchange
+    address, and thus the same EIP-712 domain separator.  An `OrderHasher`
+    computes that separator once, at construction, and then reuses it for
+    every order it hashes.  Hashes are identical to those produced by
+    `generate_order_hash_hex()`:code:.
+
+    :param exchange_address: The address to which the 0x Exchange smart
+        contract has been deployed.
+    :param chain_id: The ID of the chain on which that contract lives.
+    :param validate: Whether to validate each order against `the 0x order
+        JSON schema
+        <https://github.com/0xProject/0x-monorepo/blob/development/packages/json-schemas/schemas/order_schema.json>`_
+        before hashing it, as directed by
+        `zero_ex.json_schemas.get_validation_policy()`:code:.  Callers that
+        have already validated their orders may disable this to save the
+        cost.
+    :param digest_cache: Where to memoize the keccak digests of asset data.
+        Defaults to the module-wide `ASSET_DATA_DIGEST_CACHE`:code:.
+
+    >>> from zero_ex.contract_wrappers.exchange.types import Order
+    >>> hasher = OrderHasher(
+    ...     exchange_address="0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+    ...     chain_id=1337,
+    ... )
+    >>> order = Order(
+    ...     makerAddress="0x0000000000000000000000000000000000000000",
+    ...     takerAddress="0x0000000000000000000000000000000000000000",
+    ...     feeRecipientAddress="0x0000000000000000000000000000000000000000",
+    ...     senderAddress="0x0000000000000000000000000000000000000000",
+    ...     makerAssetAmount="0",
+    ...     takerAssetAmount="0",
+    ...     makerFee="0",
+    ...     takerFee="0",
+    ...     expirationTimeSeconds="0",
+    ...     salt="0",
+    ...     makerAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...     takerAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...     makerFeeAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...     takerFeeAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ... )
+    >>> hasher.order_hash_hex(order)
+    'cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714'
+    >>> [order_hash.hex() for order_hash in hasher.order_hashes([order])]
+    ['cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714']
+    """  # noqa: E501 (line too long)
+
+    def __init__(
+        self,
+        exchange_address: str,
+        chain_id: int,
+        validate: bool = True,
+        digest_cache: BoundedMemo = None,
+    ):
+        """Compute the domain separator for the given Exchange deployment."""
+        assert_is_address(exchange_address, "exchange_address")
+
+        self.exchange_address = exchange_address
+        self.chain_id = chain_id
+        self.validate = validate
+        self.digest_cache = (
+            ASSET_DATA_DIGEST_CACHE if digest_cache is None else digest_cache
+        )
+
+        self._eip712_prefix = _Constants.eip191_header + (
+            _eip712_domain_struct_hash(int(chain_id), exchange_address)
+        )
+
+    def order_hash(
+        self, order: Union["Order", CompactOrder, "SignedOrder"]
+    ) -> bytes:
+        """Calculate the hash of the given order, as raw bytes.
+
+        A `CompactOrder`:py:class: is hashed straight from its fields.  Its
+        constructors have already checked that it is packable, so it is not
+        validated against the JSON schema, even when `validate`:code: is set.
+        Nor is a `SignedOrder`:py:class:, whose remembered hash is returned if
+        it was made for this hasher's Exchange deployment.
+        """
+        if isinstance(order, SignedOrder):
+            if (
+                order.chain_id == self.chain_id
+                and order.exchange_address == self.exchange_address.lower()
+            ):
+                return order.hash
+            order = order.compact_order
+
+        if isinstance(order, CompactOrder):
+            return _hash_packed_order(
+                self._eip712_prefix, order, self.digest_cache
+            )
+
+        if self.validate:
+            # pylint: disable=import-outside-toplevel
+            from zero_ex.contract_wrappers.order_conversions import (
+                order_to_jsdict,
+            )
+
+            # converting validates, as the validation policy directs.
+            order_to_jsdict(order, self.chain_id, self.exchange_address)
+
+        return keccak(
+            self._eip712_prefix + ORDER.struct_hash(order, self.digest_cache)
+        )
+
+    def order_hash_hex(
+        self, order: Union["Order", CompactOrder, "SignedOrder"]
+    ) -> str:
+        """Calculate the hash of the given order, as a hex string.
+
+        The returned string has no "0x" prefix, matching the output of
+        `generate_order_hash_hex()`:code:.
+        """
+        return self.order_hash(order).hex()
+
+    def order_hashes(
+        self, orders: Iterable[Union["Order", CompactOrder, "SignedOrder"]]
+    ) -> Iterator[bytes]:
+        """Lazily hash each of the given orders, yielding raw bytes."""
+        for order in orders:
+            yield self.order_hash(order)
+
+    def order_hashes_hex(
+        self, orders: Iterable[Union["Order", CompactOrder, "SignedOrder"]]
+    ) -> Iterator[str]:
+        """Lazily hash each of the given orders, yielding hex strings."""
+        for order in orders:
+            yield self.order_hash(order).hex()
+
+
 def generate_order_hash_hex(
-    order: Order, exchange_address: str, chain_id: int
+    order: "Order", exchange_address: str, chain_id: int
 ) -> str:
     """Calculate the hash of the given order as a hexadecimal string.
 
+    To hash many orders for the same Exchange deployment, prefer
+    `OrderHasher`:py:class:, which avoids recomputing the EIP-712 domain for
+    each order.
+
     :param order: The order to be hashed.  Must conform to `the 0x order JSON schema <https://github.com/0xProject/0x-monorepo/blob/development/packages/json-schemas/schemas/order_schema.json>`_.
     :param exchange_address: The address to which the 0x Exchange smart
         contract has been deployed.
@@ -111,6 +306,7 @@ def generate_order_hash_hex(
     Inputs and expected result below were copied from
     @0x/order-utils/test/order_hash_test.ts
 
+    >>> from zero_ex.contract_wrappers.exchange.types import Order
     >>> generate_order_hash_hex(
     ...     Order(
     ...         makerAddress="0x0000000000000000000000000000000000000000",
@@ -133,64 +329,498 @@ def generate_order_hash_hex(
     ... )
     'cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714'
     """  # noqa: E501 (line too long)
-    assert_is_address(exchange_address, "exchange_address")
-    assert_valid(
-        order_to_jsdict(order, chain_id, exchange_address), "/orderSchema"
-    )
+    return OrderHasher(exchange_address, chain_id).order_hash_hex(order)
+
+
+_NOT_YET = object()
+"""Marks a `SignedOrder`:code: fact that hasn't been computed yet."""
 
-    def pad_20_bytes_to_32(twenty_bytes: bytes):
-        return bytes(12) + twenty_bytes
+_ADDRESS_FIELDS = (
+    "makerAddress",
+    "takerAddress",
+    "feeRecipientAddress",
+    "senderAddress",
+)
 
-    def int_to_32_big_endian_bytes(i: int):
-        return i.to_bytes(32, byteorder="big")
 
-    eip712_domain_struct_hash = keccak(
-        _Constants.eip712_domain_struct_header
-        + int_to_32_big_endian_bytes(int(chain_id))
-        + pad_20_bytes_to_32(to_bytes(hexstr=exchange_address))
+class SignedOrder(Mapping[str, Any]):
+    """An immutable signed order, which remembers what's known about it.
+
+    Quoting, signing, posting and filling an order each need facts about it:
+    its hash, whether it conforms to the signed order JSON schema, what its
+    asset data encodes, and its JSON form.  A `SignedOrder` works out each of
+    these the first time it's asked for it, and then remembers it, so that an
+    order passed through every layer has each fact computed once.
+
+    It's a read-only mapping from the field names of the `Order`:code:
+    struct to their values, with checksummed addresses, so it may be passed
+    to the contract wrappers wherever an `Order`:code: is expected.
+    `zero_ex.contract_wrappers.exchange.validator.ExchangeValidator`:code:
+    then validates it only once, and its remembered JSON form, its
+    `jsdict`:code:, may be posted with `zero_ex.sra_client`:code:.
+
+    :param order: An `Order`:code: dict, a JSON dict, or a
+        `zero_ex.order_utils.compact_order.CompactOrder`:code:.
+    :param signature: The signature of the order's hash, hex encoded, as
+        returned by `sign_hash()`:code:, or as bytes.
+    :param exchange_address: The address of the Exchange contract for which
+        the order was made.
+    :param chain_id: The ID of the chain on which that contract lives.
+
+    >>> from zero_ex.order_utils.asset_data_utils import encode_erc20
+    >>> signed_order = SignedOrder(
+    ...     {
+    ...         "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    ...         "takerAddress": "0x0000000000000000000000000000000000000000",
+    ...         "feeRecipientAddress": "0x0000000000000000000000000000000000000000",
+    ...         "senderAddress": "0x0000000000000000000000000000000000000000",
+    ...         "makerAssetAmount": 2,
+    ...         "takerAssetAmount": 1,
+    ...         "makerFee": 0,
+    ...         "takerFee": 0,
+    ...         "expirationTimeSeconds": 1577836800,
+    ...         "salt": 1,
+    ...         "makerAssetData": encode_erc20(
+    ...             "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+    ...         ),
+    ...         "takerAssetData": encode_erc20(
+    ...             "0x0b1ba0af832d7c05fd64161e0db78e85978e8082"
+    ...         ),
+    ...         "makerFeeAssetData": b"",
+    ...         "takerFeeAssetData": b"",
+    ...     },
+    ...     signature="0x1B" + "00" * 64 + "02",
+    ...     exchange_address="0x48bacb9266a570d521063ef5dd96e61686dbe788",
+    ...     chain_id=1337,
+    ... )
+    >>> signed_order.hash_hex
+    'c38ee53a872e082f2bfc2ce81f89be197b0b19cfa1ec17c44e1a8674907a0fac'
+    >>> signed_order.is_valid
+    True
+    >>> signed_order.maker_asset.token_address
+    '0x1dc4c1cefef38a777b15aa20260a54e584b16c48'
+    >>> signed_order["makerAddress"]
+    '0x5409ED021D9299bf6814279A6A1411A7e866A631'
+    >>> signed_order.jsdict["signature"][:6]
+    '0x1b00'
+    """  # noqa: E501 (line too long)
+
+    __slots__ = (
+        "compact_order",
+        "signature_bytes",
+        "signature",
+        "exchange_address",
+        "chain_id",
+        "_order",
+        "_hash",
+        "_validation_error",
+        "_maker_asset",
+        "_taker_asset",
+        "_jsdict",
+        "_json",
     )
 
-    def ensure_bytes(str_or_bytes: Union[str, bytes]) -> bytes:
+    compact_order: CompactOrder
+    """The order, packed."""
+
+    signature_bytes: bytes
+    """The signature, as raw bytes, as the Exchange contract takes it."""
+
+    signature: str
+    """The signature, as a lowercase hex string."""
+
+    exchange_address: str
+    """The address of the Exchange contract, as a lowercase hex string."""
+
+    chain_id: int
+    """The ID of the chain on which the Exchange contract lives."""
+
+    def __init__(
+        self,
+        order: Union["Order", CompactOrder],
+        signature: Union[str, bytes],
+        exchange_address: str,
+        chain_id: int,
+    ):
+        """Pack the order, and check the signature and deployment."""
+        if isinstance(signature, str):
+            assert_is_hex_string(signature, "signature")
+        assert_is_address(exchange_address, "exchange_address")
+
+        set_ = object.__setattr__
+        set_(self, "compact_order", CompactOrder.from_order(order))
+        set_(self, "signature_bytes", _ensure_bytes(signature))
+        set_(self, "signature", "0x" + self.signature_bytes.hex())
+        set_(
+            self,
+            "exchange_address",
+            "0x" + _address_to_bytes(exchange_address).hex(),
+        )
+        set_(self, "chain_id", int(chain_id))
+        # the rest of the slots hold facts, computed when first asked for:
+        for name in self.__slots__[5:]:
+            set_(self, name, _NOT_YET)
+
+    @classmethod
+    def from_jsdict(cls, jsdict: dict) -> "SignedOrder":
+        """Make a `SignedOrder` from the JSON form of `the 0x signed order JSON schema`__.
+
+        That form, as returned by `zero_ex.sra_client`:code:, includes the
+        signature, the Exchange address and the chain ID.
+
+        __ https://github.com/0xProject/0x-monorepo/blob/development/packages/json-schemas/schemas/signed_order_schema.json
+        """  # noqa: E501 (line too long)
+        return cls(
+            cast("Order", jsdict),
+            jsdict["signature"],
+            jsdict["exchangeAddress"],
+            jsdict["chainId"],
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Refuse, since a `SignedOrder` is immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse, since a `SignedOrder` is immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple:
+        """Pickle the order's definition, but none of the facts computed."""
+        return (
+            type(self),
+            (
+                self.compact_order,
+                self.signature_bytes,
+                self.exchange_address,
+                self.chain_id,
+            ),
+        )
+
+    def _remember(self, name: str, compute: Callable[[], Any]) -> Any:
+        value = getattr(self, name)
+        if value is _NOT_YET:
+            value = compute()
+            object.__setattr__(self, name, value)
+        return value
+
+    def _compute_order(self) -> "Order":
+        order = self.compact_order.to_order()
+        for field in _ADDRESS_FIELDS:
+            order[field] = normalize_address(order[field])  # type: ignore
+        return order
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of an `Order`:code: field."""
+        return self._remember("_order", self._compute_order)[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the `Order`:code: field names, in EIP-712 order."""
+        return iter(self._remember("_order", self._compute_order))
+
+    def __len__(self) -> int:
+        """Count the `Order`:code: fields."""
+        return len(CompactOrder._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        """Tell whether `other` is the same order, signature and deployment.
+
+        A `SignedOrder` is never equal to a plain `Order`:code: dict.
+        """
+        if not isinstance(other, SignedOrder):
+            return NotImplemented
+        return self.__reduce__()[1] == other.__reduce__()[1]
+
+    def __hash__(self) -> int:
+        """Hash by the order, signature and deployment."""
+        return hash(self.__reduce__()[1])
+
+    def __repr__(self) -> str:
+        """Show the order's definition."""
         return (
-            to_bytes(hexstr=cast(bytes, str_or_bytes))
-            if isinstance(str_or_bytes, str)
-            else str_or_bytes
+            f"{type(self).__name__}({self.compact_order!r},"
+            + f" signature={self.signature!r},"
+            + f" exchange_address={self.exchange_address!r},"
+            + f" chain_id={self.chain_id!r})"
         )
 
-    eip712_order_struct_hash = keccak(
-        _Constants.eip712_order_schema_hash
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["makerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["takerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["feeRecipientAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["senderAddress"]))
-        + int_to_32_big_endian_bytes(int(order["makerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["takerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["makerFee"]))
-        + int_to_32_big_endian_bytes(int(order["takerFee"]))
-        + int_to_32_big_endian_bytes(int(order["expirationTimeSeconds"]))
-        + int_to_32_big_endian_bytes(int(order["salt"]))
-        + keccak(ensure_bytes(order["makerAssetData"]))
-        + keccak(ensure_bytes(order["takerAssetData"]))
-        + keccak(ensure_bytes(order["makerFeeAssetData"]))
-        + keccak(ensure_bytes(order["takerFeeAssetData"]))
+    def to_order(self) -> "Order":
+        """Get a new `Order`:code: dict, with checksummed addresses."""
+        return cast("Order", dict(self))
+
+    @property
+    def hash(self) -> bytes:
+        """The order's EIP-712 hash, as raw bytes.
+
+        It's the same as that computed by `OrderHasher`:py:class:, which
+        returns it from here when given a `SignedOrder`.
+        """
+        return self._remember(
+            "_hash",
+            lambda: _hash_packed_order(
+                _Constants.eip191_header
+                + _eip712_domain_struct_hash(
+                    self.chain_id, self.exchange_address
+                ),
+                self.compact_order,
+                ASSET_DATA_DIGEST_CACHE,
+            ),
+        )
+
+    @property
+    def hash_hex(self) -> str:
+        """The order's hash, as a hex string without a "0x" prefix."""
+        return self.hash.hex()
+
+    def _validate(self) -> Optional[Exception]:
+        # pylint: disable=import-outside-toplevel
+        from zero_ex.json_schemas import validate_many
+
+        # collects, rather than raises, the error that assert_valid() would:
+        results = validate_many([self._json_dict()], "/signedOrderSchema")
+        return results.errors.get(0)
+
+    @property
+    def validation_error(self) -> Optional[Exception]:
+        """Why the order's `jsdict`:code: violates the signed order schema.
+
+        That is, the `jsonschema.ValidationError`:code: that
+        `zero_ex.json_schemas.assert_valid()`:code: would raise.
+
+        `None`:code: if it conforms.  Packing the order into a
+        `CompactOrder`:code:, on construction, has already checked its
+        addresses and amounts, so a violation is unlikely.
+        """
+        return self._remember("_validation_error", self._validate)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the order conforms to the signed order JSON schema."""
+        return self.validation_error is None
+
+    def assert_valid(self) -> None:
+        """Raise the `validation_error`:code:, if there is one."""
+        error = self.validation_error
+        if error is not None:
+            raise error
+
+    @property
+    def maker_asset(self) -> "DecodedAssetData":
+        """The maker's asset data, decoded.
+
+        Decoded as by
+        `zero_ex.order_utils.asset_data_utils.intern_asset_data()`:code:, and
+        so shared with other orders for the same asset.
+
+        :raises ValueError: if the asset data is malformed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from zero_ex.order_utils.asset_data_utils import intern_asset_data
+
+        return self._remember(
+            "_maker_asset",
+            lambda: intern_asset_data(self.compact_order.maker_asset_data),
+        )
+
+    @property
+    def taker_asset(self) -> "DecodedAssetData":
+        """The taker's asset data, decoded, like `maker_asset`:code:."""
+        # pylint: disable=import-outside-toplevel
+        from zero_ex.order_utils.asset_data_utils import intern_asset_data
+
+        return self._remember(
+            "_taker_asset",
+            lambda: intern_asset_data(self.compact_order.taker_asset_data),
+        )
+
+    def _json_dict(self) -> dict:
+        return self._remember(
+            "_jsdict",
+            lambda: self.compact_order.to_jsdict(
+                self.chain_id, self.exchange_address, self.signature
+            ),
+        )
+
+    @property
+    def jsdict(self) -> dict:
+        """The order in the JSON form of the 0x signed order JSON schema.
+
+        A new dict on every access, so that the one remembered can't be
+        changed, but it's only a shallow copy.
+        """
+        return dict(self._json_dict())
+
+    @property
+    def json(self) -> str:
+        """The order's `jsdict`:code:, serialized as JSON."""
+        return self._remember("_json", lambda: json.dumps(self._json_dict()))
+
+
+def _assert_is_provider_or_session(value: Any, name: str) -> None:
+    """Assert that `value` is a Web3 provider or a `ProviderSession`."""
+    # pylint: disable=import-outside-toplevel
+    from zero_ex.contract_wrappers.session import ProviderSession
+
+    if not isinstance(value, ProviderSession):
+        assert_is_provider(value, name)
+
+
+def _exchange_for(
+    provider: Union["BaseProvider", "ProviderSession"]
+) -> "Exchange":
+    """Get a wrapper of the Exchange deployed on the provider's chain.
+
+    A session remembers both the chain and the wrapper, so that only the
+    first call with it needs to ask the provider for its chain ID.
+    """
+    # pylint: disable=import-outside-toplevel
+    from web3 import Web3
+    from zero_ex.contract_addresses import chain_to_addresses, ChainId
+    from zero_ex.contract_wrappers.exchange import Exchange
+    from zero_ex.contract_wrappers.session import ProviderSession
+
+    if isinstance(provider, ProviderSession):
+        return provider.wrapper(Exchange, provider.contract_addresses.exchange)
+    return Exchange(
+        provider,
+        chain_to_addresses(
+            ChainId(
+                int(Web3(provider).eth.chainId)  # pylint: disable=no-member
+            )
+        ).exchange,
     )
 
-    return keccak(
-        _Constants.eip191_header
-        + eip712_domain_struct_hash
-        + eip712_order_struct_hash
-    ).hex()
+
+def _exchange_deployment(
+    provider: Union["BaseProvider", "ProviderSession"]
+) -> Tuple[int, str]:
+    """Get the chain ID and lowercase Exchange address of a provider.
+
+    A session remembers both, so that only the first call with it needs to
+    ask the provider for its chain ID.
+    """
+    # pylint: disable=import-outside-toplevel
+    from web3 import Web3
+    from zero_ex.contract_addresses import chain_to_addresses, ChainId
+    from zero_ex.contract_wrappers.session import ProviderSession
+
+    if isinstance(provider, ProviderSession):
+        return (
+            provider.chain_id,
+            provider.contract_addresses.exchange.lower(),
+        )
+    chain_id = int(Web3(provider).eth.chainId)  # pylint: disable=no-member
+    return chain_id, chain_to_addresses(ChainId(chain_id)).exchange.lower()
+
+
+def _recover_signature_validity(
+    data: bytes, signature: bytes, signer_address: bytes
+) -> Optional[bool]:
+    """Check a hash signature without consulting the Exchange contract.
+
+    Mirrors the Exchange contract's handling of EIP712 and ETH_SIGN
+    signatures, whose validity depends only on ecrecover.
+
+    :returns: The validity of the signature, or `None`:code: if it can only be
+        judged on-chain, either because of its type (eg WALLET, VALIDATOR or
+        PRE_SIGNED) or because the Exchange contract would revert on it (eg for
+        a malformed signature or a null signer), in which case the caller
+        should defer to the contract to get the same error.
+    """
+    if len(data) != 32 or len(signature) != 66 or signer_address == bytes(20):
+        return None
+
+    signature_type = signature[65]
+    if signature_type == _Constants.SignatureType.EIP712.value:
+        message_hash = data
+    elif signature_type == _Constants.SignatureType.ETH_SIGN.value:
+        message_hash = keccak(_Constants.eth_sign_header + data)
+    else:
+        return None
+
+    v = signature[0]  # pylint: disable=invalid-name
+    r = int.from_bytes(signature[1:33], "big")  # pylint: disable=invalid-name
+    s = int.from_bytes(signature[33:65], "big")  # pylint: disable=invalid-name
+    # ecrecover yields the null address for such parameters, which can't match
+    # the (non-null) signer:
+    if (
+        v not in (27, 28)
+        or not 0 < r < _Constants.secp256k1_n
+        or not 0 < s < _Constants.secp256k1_n
+    ):
+        return False
+
+    try:
+        public_key = Signature(
+            vrs=(v - 27, r, s)
+        ).recover_public_key_from_msg_hash(message_hash)
+    except BadSignature:
+        return False
+    return public_key.to_canonical_address() == signer_address
+
+
+def is_valid_signature_locally(
+    data: str, signature: str, signer_address: str
+) -> bool:
+    """Check the validity of an EIP712 or ETH_SIGN signature, offline.
+
+    Check if the supplied `signature`:code: corresponds to signing `data`:code:
+    with the private key corresponding to `signer_address`:code:, by
+    recovering the signer's public key, without any network access.
+
+    :param data: The hex encoded 32-byte hash signed by the supplied signature.
+    :param signature: The hex encoded signature, of type EIP712 or ETH_SIGN.
+    :param signer_address: The hex encoded address that signed the data to
+        produce the supplied signature.
+    :returns: True if valid, false otherwise.
+    :raises ValueError: If the signature is of a type, such as WALLET,
+        VALIDATOR or PRE_SIGNED, which can only be checked on-chain, or if it
+        is malformed.  Use `is_valid_signature()`:code: for such signatures.
+
+    >>> is_valid_signature_locally(
+    ...     '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...     '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ...     '0x5409ed021d9299bf6814279a6a1411a7e866a631',
+    ... )
+    True
+    """  # noqa: E501 (line too long)
+    assert_is_hex_string(data, "data")
+    assert_is_hex_string(signature, "signature")
+    assert_is_address(signer_address, "signer_address")
+
+    validity = _recover_signature_validity(
+        _hex_to_bytes(data),
+        _hex_to_bytes(signature),
+        _address_to_bytes(signer_address),
+    )
+    if validity is None:
+        raise ValueError(
+            "Signature can only be validated by the Exchange contract."
+        )
+    return validity
 
 
 def is_valid_signature(
-    provider: BaseProvider, data: str, signature: str, signer_address: str
+    provider: Union["BaseProvider", "ProviderSession"],
+    data: str,
+    signature: str,
+    signer_address: str,
 ) -> bool:
     """Check the validity of the supplied signature.
 
     Check if the supplied `signature`:code: corresponds to signing `data`:code:
     with the private key corresponding to `signer_address`:code:.
 
-    :param provider: A Web3 provider able to access the 0x Exchange contract.
+    EIP712 and ETH_SIGN signatures are checked locally, as by
+    `is_valid_signature_locally()`:code:, without calling out to the
+    `provider`:code:.  Other signature types, such as WALLET, VALIDATOR and
+    PRE_SIGNED, are checked by calling the 0x Exchange contract.  To check
+    many signatures at once, use `is_valid_signature_batch()`:code:, from
+    `zero_ex.order_utils.bulk`:code:, which is also importable from here.
+
+    :param provider: A Web3 provider able to access the 0x Exchange contract,
+        or a `zero_ex.contract_wrappers.session.ProviderSession`:code: for
+        one, to avoid repeatedly looking up the Exchange's address.
     :param data: The hex encoded data signed by the supplied signature.
     :param signature: The hex encoded signature.
     :param signer_address: The hex encoded address that signed the data to
@@ -198,6 +828,7 @@ def is_valid_signature(
     :returns: Tuple consisting of a boolean and a string.  Boolean is true if
         valid, false otherwise.  If false, the string describes the reason.
 
+    >>> from web3 import Web3
     >>> is_valid_signature(
     ...     Web3.HTTPProvider("http://127.0.0.1:8545"),
     ...     '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
@@ -206,25 +837,144 @@ def is_valid_signature(
     ... )
     True
     """  # noqa: E501 (line too long)
-    assert_is_provider(provider, "provider")
+    _assert_is_provider_or_session(provider, "provider")
     assert_is_hex_string(data, "data")
     assert_is_hex_string(signature, "signature")
     assert_is_address(signer_address, "signer_address")
 
-    return Exchange(
-        provider,
-        chain_to_addresses(
-            ChainId(
-                int(Web3(provider).eth.chainId)  # pylint: disable=no-member
-            )
-        ).exchange,
-    ).is_valid_hash_signature.call(
-        bytes.fromhex(remove_0x_prefix(HexStr(data))),
-        to_checksum_address(signer_address),
-        bytes.fromhex(remove_0x_prefix(HexStr(signature))),
+    data_bytes = _hex_to_bytes(data)
+    signature_bytes = _hex_to_bytes(signature)
+    validity = _recover_signature_validity(
+        data_bytes, signature_bytes, _address_to_bytes(signer_address)
+    )
+    if validity is not None:
+        return validity
+
+    return _exchange_for(provider).is_valid_hash_signature.call(
+        data_bytes, to_checksum_address(signer_address), signature_bytes
     )
 
 
+_LOCAL_SIGNATURE_TYPES_HEX = (
+    f"{_Constants.SignatureType.EIP712.value:02x}",
+    f"{_Constants.SignatureType.ETH_SIGN.value:02x}",
+)
+"""Trailing bytes, in hex, of the signature types checked without a node."""
+
+
+class SignatureValidityCache:
+    """Memoize outcomes of `is_valid_signature()`:code:.
+
+    A process repeatedly polling a relayer sees the same signed orders over
+    and over, and there is no need to verify each of them every time.  This
+    class remembers verification outcomes, keyed by data, signer address and
+    signature.
+
+    The validity of an EIP712 or ETH_SIGN signature can never change, but
+    that of a signature relying on contract state, such as one of type WALLET,
+    VALIDATOR or PRE_SIGNED, can.  Outcomes for the latter are therefore kept
+    for a shorter, separately configurable, time, and are keyed by the chain
+    and Exchange deployment judging them, too, so that one provider's answer
+    is never given for another's.  The deployment of each of the
+    `max_providers`:code: most recently used providers is looked up just once,
+    so answers from the cache cost no calls to the provider.  Verifying an
+    outcome that isn't cached still asks a plain provider for its chain ID,
+    which a `zero_ex.contract_wrappers.session.ProviderSession`:code: asks
+    only once.  Calls that raise are never cached.
+
+    :param maxsize: The maximum number of outcomes to retain.  When full, the
+        least recently used outcome is evicted.
+    :param ttl: Number of seconds for which to retain outcomes for EIP712
+        and ETH_SIGN signatures.
+    :param on_chain_ttl: Number of seconds for which to retain outcomes for
+        all other signature types.  Set to zero to never cache those.
+    :param clock: A function returning the current time in seconds.
+    :param max_providers: The maximum number of providers whose chain and
+        Exchange deployment to retain.
+
+    >>> from web3 import Web3
+    >>> cache = SignatureValidityCache(maxsize=1000)
+    >>> cache.is_valid_signature(
+    ...     Web3.HTTPProvider("http://127.0.0.1:8545"),
+    ...     '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...     '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ...     '0x5409ed021d9299bf6814279a6a1411a7e866a631',
+    ... )
+    True
+    >>> cache.hits, cache.misses
+    (0, 1)
+    """  # noqa: E501 (line too long)
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        maxsize: int = 65536,
+        ttl: float = 3600,
+        on_chain_ttl: float = 15,
+        clock: Callable[[], float] = monotonic,
+        max_providers: int = 16,
+    ):
+        """Create an empty cache."""
+        self.ttl = ttl
+        self.on_chain_ttl = on_chain_ttl
+        self._outcomes = ExpiringCache(maxsize=maxsize, clock=clock)
+        self._deployments = BoundedMemo(
+            _exchange_deployment, maxsize=max_providers
+        )
+
+    @property
+    def hits(self) -> int:
+        """Number of verifications answered from the cache."""
+        return self._outcomes.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of verifications that had to be performed."""
+        return self._outcomes.misses
+
+    @property
+    def currsize(self) -> int:
+        """Number of outcomes currently retained."""
+        return self._outcomes.currsize
+
+    def cache_clear(self) -> None:
+        """Forget all outcomes and deployments, and reset the statistics."""
+        self._outcomes.cache_clear()
+        self._deployments.cache_clear()
+
+    def is_valid_signature(
+        self,
+        provider: Union["BaseProvider", "ProviderSession"],
+        data: str,
+        signature: str,
+        signer_address: str,
+    ) -> bool:
+        """Check the validity of a signature, consulting the cache first.
+
+        Takes the same parameters as, and returns the same result as,
+        `is_valid_signature()`:code:.
+        """
+        signature_hex = remove_0x_prefix(HexStr(signature)).lower()
+        key: Tuple = (
+            remove_0x_prefix(HexStr(data)).lower(),
+            remove_0x_prefix(HexStr(signer_address)).lower(),
+            signature_hex,
+        )
+        on_chain = signature_hex[-2:] not in _LOCAL_SIGNATURE_TYPES_HEX
+        if on_chain:
+            key += self._deployments(provider)
+        validity = self._outcomes.get(key)
+        if validity is not None:
+            return validity
+
+        validity = is_valid_signature(
+            provider, data, signature, signer_address
+        )
+        self._outcomes.set(
+            key, validity, self.on_chain_ttl if on_chain else self.ttl
+        )
+        return validity
+
+
 class ECSignature(TypedDict):
     """Object representation of an elliptic curve signature's parameters."""
 
@@ -285,20 +1035,42 @@ def _convert_ec_signature_to_vrs_hex(signature: ECSignature) -> str:
     )
 
 
+_ETH_SIGN_LAYOUTS = ExpiringCache(maxsize=256)
+"""Parsers for the signatures returned by eth_sign, by provider endpoint.
+
+Bounded, since endpoints come from callers; a layout is kept until evicted,
+as every use of it is checked anyway.
+"""
+
+
+def _provider_endpoint(provider: "BaseProvider") -> Optional[str]:
+    """Get the URI or IPC path of a provider, if it has one."""
+    return getattr(provider, "endpoint_uri", None) or getattr(
+        provider, "ipc_path", None
+    )
+
+
 def sign_hash(
-    web3_or_provider: Union[Web3, BaseProvider],
+    web3_or_provider: Union["Web3", "BaseProvider", "ProviderSession"],
     signer_address: str,
     hash_hex: str,
 ) -> str:
     """Sign a message with the given hash, and return the signature.
 
-    :param web3_or_provider: Either an instance of `web3.Web3`:code: or
-        `web3.providers.base.BaseProvider`:code:
+    Nodes disagree on the layout of the signatures they return, so the first
+    signature from a node is checked in each possible layout.  The layout
+    found to work is remembered for the provider's endpoint URI (or IPC path),
+    so that later signatures from the same node need no such guessing.
+
+    :param web3_or_provider: Either an instance of `web3.Web3`:code:, of
+        `web3.providers.base.BaseProvider`:code:, or of
+        `zero_ex.contract_wrappers.session.ProviderSession`:code:
     :param signer_address: The address of the signing account.
     :param hash_hex: A hex string representing the hash, like that returned
         from `generate_order_hash_hex()`:code:.
     :returns: A string, of ASCII hex digits, representing the signature.
 
+    >>> from web3 import Web3
     >>> provider = Web3.HTTPProvider("http://127.0.0.1:8545")
     >>> sign_hash(
     ...     provider,
@@ -307,15 +1079,22 @@ def sign_hash(
     ... )
     '0x1b117902c86dfb95fe0d1badd983ee166ad259b27acb220174cbb4460d872871137feabdfe76e05924b484789f79af4ee7fa29ec006cedce1bbf369320d034e10b03'
     """  # noqa: E501 (line too long)
+    # pylint: disable=import-outside-toplevel
+    from web3 import Web3
+    from web3.providers.base import BaseProvider
+    from zero_ex.contract_wrappers.session import ProviderSession
+
     web3_instance = None
-    if isinstance(web3_or_provider, BaseProvider):
+    if isinstance(web3_or_provider, ProviderSession):
+        web3_instance = web3_or_provider.web3
+    elif isinstance(web3_or_provider, BaseProvider):
         web3_instance = Web3(web3_or_provider)
     elif isinstance(web3_or_provider, Web3):
         web3_instance = web3_or_provider
     else:
         raise TypeError(
             "Expected parameter 'web3_or_provider' to be an instance of either"
-            + " Web3 or BaseProvider"
+            + " Web3, BaseProvider or ProviderSession"
         )
 
     assert_is_address(signer_address, "signer_address")
@@ -326,52 +1105,58 @@ def sign_hash(
         signer_address, hexstr=hash_hex.replace("0x", "")
     ).hex()
 
-    valid_v_param_values = [27, 28]
-
-    # HACK: There is no consensus on whether the signatureHex string should be
-    # formatted as v + r + s OR r + s + v, and different clients (even
-    # different versions of the same client) return the signature params in
-    # different orders. In order to support all client implementations, we
-    # parse the signature in both ways, and evaluate if either one is a valid
-    # signature.  r + s + v is the most prevalent format from eth_sign, so we
-    # attempt this first.
+    endpoint = _provider_endpoint(web3_instance.provider)
 
-    ec_signature = _parse_signature_hex_as_rsv(signature)
-    if ec_signature["v"] in valid_v_param_values:
+    # If we've already learned how this provider lays out its signatures,
+    # there's no need to guess.  The result is still checked (locally) in case
+    # the endpoint has since changed hands, in which case we fall back to
+    # guessing.
+    known_parser = _ETH_SIGN_LAYOUTS.get(endpoint) if endpoint else None
+    if known_parser is not None:
         signature_as_vrst_hex = (
-            _convert_ec_signature_to_vrs_hex(ec_signature)
+            _convert_ec_signature_to_vrs_hex(known_parser(signature))
             + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
                 1, byteorder="big"
             ).hex()
         )
+        if _recover_signature_validity(
+            _hex_to_bytes(hash_hex),
+            _hex_to_bytes(signature_as_vrst_hex),
+            _address_to_bytes(signer_address),
+        ):
+            return signature_as_vrst_hex
 
-        valid = is_valid_signature(
-            web3_instance.provider,
-            hash_hex,
-            signature_as_vrst_hex,
-            signer_address,
-        )
+    valid_v_param_values = [27, 28]
 
-        if valid is True:
-            return signature_as_vrst_hex
+    # HACK: There is no consensus on whether the signatureHex string should be
+    # formatted as v + r + s OR r + s + v, and different clients (even
+    # different versions of the same client) return the signature params in
+    # different orders. In order to support all client implementations, we
+    # parse the signature in both ways, and evaluate if either one is a valid
+    # signature.  r + s + v is the most prevalent format from eth_sign, so we
+    # attempt this first.  Whichever works is remembered for the endpoint.
+
+    for parser in (_parse_signature_hex_as_rsv, _parse_signature_hex_as_vrs):
+        ec_signature = parser(signature)
+        if ec_signature["v"] in valid_v_param_values:
+            signature_as_vrst_hex = (
+                _convert_ec_signature_to_vrs_hex(ec_signature)
+                + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
+                    1, byteorder="big"
+                ).hex()
+            )
 
-    ec_signature = _parse_signature_hex_as_vrs(signature)
-    if ec_signature["v"] in valid_v_param_values:
-        signature_as_vrst_hex = (
-            _convert_ec_signature_to_vrs_hex(ec_signature)
-            + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
-                1, byteorder="big"
-            ).hex()
-        )
-        valid = is_valid_signature(
-            web3_instance.provider,
-            hash_hex,
-            signature_as_vrst_hex,
-            signer_address,
-        )
+            valid = is_valid_signature(
+                web3_instance.provider,
+                hash_hex,
+                signature_as_vrst_hex,
+                signer_address,
+            )
 
-        if valid is True:
-            return signature_as_vrst_hex
+            if valid is True:
+                if endpoint:
+                    _ETH_SIGN_LAYOUTS.set(endpoint, parser, ttl=float("inf"))
+                return signature_as_vrst_hex
 
     raise RuntimeError(
         "Signature returned from web3 provider is in an unknown format. "
@@ -380,12 +1165,13 @@ def sign_hash(
 
 
 def sign_hash_to_bytes(
-    web3_or_provider: Union[Web3, BaseProvider],
+    web3_or_provider: Union["Web3", "BaseProvider", "ProviderSession"],
     signer_address: str,
     hash_hex: str,
 ) -> bytes:
     """Sign a message with the given hash, and return the signature.
 
+    >>> from web3 import Web3
     >>> provider = Web3.HTTPProvider("http://127.0.0.1:8545")
     >>> sign_hash_to_bytes(
     ...     provider,
@@ -397,3 +1183,130 @@ def sign_hash_to_bytes(
     return remove_0x_prefix(
         HexStr(sign_hash(web3_or_provider, signer_address, hash_hex))
     ).encode(encoding="utf_8")
+
+
+@singledispatch
+def _to_private_key(private_key_or_account) -> PrivateKey:
+    """Get a `PrivateKey`:code: from a private key or a `LocalAccount`:code:.
+
+    Overloaded based on the type of input.  This implementation is the base
+    case, which handles `LocalAccount`:code: without importing eth_account
+    up front, and otherwise rejects the input.
+    """
+    # pylint: disable=import-outside-toplevel
+    from eth_account.signers.local import LocalAccount
+
+    if isinstance(private_key_or_account, LocalAccount):
+        return PrivateKey(bytes(private_key_or_account.key))
+    raise TypeError(
+        "Expected parameter 'private_key_or_account' to be an instance of"
+        + " eth_account.signers.local.LocalAccount or"
+        + " eth_keys.datatypes.PrivateKey, or a raw private key as a hex"
+        + f" string or byte string, but got {type(private_key_or_account)}"
+    )
+
+
+_to_private_key.register(PrivateKey, lambda private_key: private_key)
+_to_private_key.register(
+    str, lambda private_key: PrivateKey(_hex_to_bytes(private_key))
+)
+_to_private_key.register(bytes, PrivateKey)
+
+
+def _sign_hash_bytes(
+    private_key: PrivateKey,
+    hash_bytes: bytes,
+    signature_type: _Constants.SignatureType,
+) -> bytes:
+    """Sign a 32-byte hash, producing a signature in 0x's v, r, s format."""
+    if signature_type == _Constants.SignatureType.ETH_SIGN:
+        hash_bytes = keccak(_Constants.eth_sign_header + hash_bytes)
+    ec_signature = private_key.sign_msg_hash(hash_bytes)
+    return (
+        (ec_signature.v + 27).to_bytes(1, byteorder="big")
+        + ec_signature.r.to_bytes(32, byteorder="big")
+        + ec_signature.s.to_bytes(32, byteorder="big")
+        + signature_type.value.to_bytes(1, byteorder="big")
+    )
+
+
+def _local_signature_type(signature_type: str) -> _Constants.SignatureType:
+    if signature_type not in ("EIP712", "ETH_SIGN"):
+        raise ValueError(
+            "Expected parameter 'signature_type' to be either 'EIP712' or"
+            + f" 'ETH_SIGN', but got {signature_type!r}"
+        )
+    return _Constants.SignatureType[signature_type]
+
+
+def sign_hash_locally(
+    private_key_or_account: Union["LocalAccount", PrivateKey, str, bytes],
+    hash_hex: str,
+    signature_type: str = "ETH_SIGN",
+) -> str:
+    """Sign a hash with a private key held in this process.
+
+    Unlike `sign_hash()`:code:, this requires no provider, and makes no calls
+    to a node, neither to sign nor to verify the signature.
+
+    :param private_key_or_account: The key to sign with, as any of an
+        `eth_account.signers.local.LocalAccount`:code:, an
+        `eth_keys.datatypes.PrivateKey`:code:, or a raw private key as a hex
+        string or as bytes.
+    :param hash_hex: A hex string representing the hash, like that returned
+        from `generate_order_hash_hex()`:code:.
+    :param signature_type: Either "ETH_SIGN", to produce a signature like
+        those produced by `sign_hash()`:code:, or "EIP712", to sign the hash
+        directly.
+    :returns: A string, of ASCII hex digits, representing the signature.
+
+    >>> sign_hash_locally(
+    ...     'f2f48ee19680706196e2e339e5da3491186e0c4c5030670656b0e0164837257d',
+    ...     '0x34decbedc118904df65f379a175bb39ca18209d6ce41d5ed549d54e6e0a95004',
+    ... )
+    '0x1b117902c86dfb95fe0d1badd983ee166ad259b27acb220174cbb4460d872871137feabdfe76e05924b484789f79af4ee7fa29ec006cedce1bbf369320d034e10b03'
+    """  # noqa: E501 (line too long)
+    return sign_hashes_locally(
+        private_key_or_account, [hash_hex], signature_type
+    )[0]
+
+
+def sign_hashes_locally(
+    private_key_or_account: Union["LocalAccount", PrivateKey, str, bytes],
+    hash_hexes: Iterable[str],
+    signature_type: str = "ETH_SIGN",
+) -> List[str]:
+    """Sign many hashes with a private key held in this process.
+
+    Takes the same parameters as `sign_hash_locally()`:code:, except that
+    `hash_hexes`:code: is an iterable of hashes.  The key is decoded just
+    once, for all of them.
+
+    :returns: A list of signatures, one per hash, in the same order.
+    """
+    private_key = _to_private_key(private_key_or_account)
+    local_signature_type = _local_signature_type(signature_type)
+
+    signatures = []
+    for hash_hex in hash_hexes:
+        assert_is_hex_string(hash_hex, "hash_hex")
+        hash_bytes = _hex_to_bytes(hash_hex)
+        if len(hash_bytes) != 32:
+            raise ValueError(
+                f"Expected a 32-byte hash, but got {len(hash_bytes)} bytes."
+            )
+        signatures.append(
+            "0x"
+            + _sign_hash_bytes(
+                private_key, hash_bytes, local_signature_type
+            ).hex()
+        )
+    return signatures
+
+
+# re-exported beside is_valid_signature(), and imported last, since the bulk
+# module builds on this one:
+# pylint: disable=wrong-import-position,cyclic-import
+from zero_ex.order_utils.bulk import is_valid_signature_batch  # noqa: E402
+
+# pylint: disable=too-many-lines
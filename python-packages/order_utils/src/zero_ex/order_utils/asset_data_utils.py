@@ -1,17 +1,63 @@
 """Asset data encoding and decoding utilities."""
 
-from typing import NamedTuple
+from typing import Any, Callable, Dict, NamedTuple, Sequence, Tuple, Union
 
 import eth_abi
+from eth_abi.exceptions import DecodingError
 from deprecated.sphinx import deprecated
 
 from zero_ex.dev_utils import abi_utils
+from zero_ex.dev_utils.memoize import BoundedMemo
 from zero_ex.dev_utils.type_assertions import assert_is_string, assert_is_int
 
 
+SELECTOR_LENGTH = 10
+"""Length of the selector leading asset data, as a "0x"-prefixed hex string."""
+
+SELECTOR_BYTE_LENGTH = 4
+"""Length of the selector leading asset data, in bytes."""
+
 ERC20_ASSET_DATA_BYTE_LENGTH = 36
+"""Length of ERC20 asset data: a selector and an address word."""
+
 ERC721_ASSET_DATA_MINIMUM_BYTE_LENGTH = 53
-SELECTOR_LENGTH = 10
+"""Minimum length of ERC721 asset data, as checked by earlier releases."""
+
+ERC721_ASSET_DATA_BYTE_LENGTH = 68
+"""Length of ERC721 asset data: a selector, an address word and a token ID."""
+
+_ADDRESS_PADDING = bytes(12)
+
+ERC20_ASSET_PROXY_ID = abi_utils.method_id("ERC20Token", ["address"])
+"""Selector of ERC20 asset data, as a hex string."""
+
+ERC721_ASSET_PROXY_ID = abi_utils.method_id(
+    "ERC721Token", ["address", "uint256"]
+)
+"""Selector of ERC721 asset data, as a hex string."""
+
+ERC1155_ASSET_PROXY_ID = abi_utils.method_id(
+    "ERC1155Assets", ["address", "uint256[]", "uint256[]", "bytes"]
+)
+"""Selector of ERC1155 asset data, as a hex string."""
+
+MULTI_ASSET_PROXY_ID = abi_utils.method_id(
+    "MultiAsset", ["uint256[]", "bytes[]"]
+)
+"""Selector of multi-asset asset data, as a hex string."""
+
+STATIC_CALL_ASSET_PROXY_ID = abi_utils.method_id(
+    "StaticCall", ["address", "bytes", "bytes32"]
+)
+"""Selector of static call asset data, as a hex string."""
+
+ERC20_BRIDGE_ASSET_PROXY_ID = abi_utils.method_id(
+    "ERC20Bridge", ["address", "address", "bytes"]
+)
+"""Selector of ERC20 bridge asset data, as a hex string."""
+
+_ERC20_SELECTOR = bytes.fromhex(ERC20_ASSET_PROXY_ID[2:])
+_ERC721_SELECTOR = bytes.fromhex(ERC721_ASSET_PROXY_ID[2:])
 
 
 class ERC20AssetData(NamedTuple):
@@ -37,6 +83,81 @@ class ERC721AssetData(NamedTuple):
     """Token identifier."""
 
 
+class ERC1155AssetData(NamedTuple):
+    """Object interface to ERC1155 asset data."""
+
+    asset_proxy_id: str
+    """Asset proxy identifier."""
+
+    token_address: str
+    """Token address"""
+
+    token_ids: Tuple[int, ...]
+    """Identifiers of the tokens traded."""
+
+    token_values: Tuple[int, ...]
+    """Amount of each token traded per unit of the asset."""
+
+    callback_data: bytes
+    """Data passed to the receiver's callback."""
+
+
+class MultiAssetData(NamedTuple):
+    """Object interface to multi-asset asset data."""
+
+    asset_proxy_id: str
+    """Asset proxy identifier."""
+
+    amounts: Tuple[int, ...]
+    """Amount of each nested asset traded per unit of the asset."""
+
+    nested_asset_data: Tuple[Any, ...]
+    """The decoded asset data of each nested asset."""
+
+
+class StaticCallAssetData(NamedTuple):
+    """Object interface to static call asset data."""
+
+    asset_proxy_id: str
+    """Asset proxy identifier."""
+
+    callee_address: str
+    """Address of the contract to call."""
+
+    static_call_data: bytes
+    """Call data for the static call."""
+
+    expected_return_data_hash: bytes
+    """Keccak hash of the data that the call must return."""
+
+
+class ERC20BridgeAssetData(NamedTuple):
+    """Object interface to ERC20 bridge asset data."""
+
+    asset_proxy_id: str
+    """Asset proxy identifier."""
+
+    token_address: str
+    """Address of the token delivered by the bridge."""
+
+    bridge_address: str
+    """Address of the bridge contract."""
+
+    bridge_data: bytes
+    """Data passed to the bridge contract."""
+
+
+DecodedAssetData = Union[
+    ERC20AssetData,
+    ERC721AssetData,
+    ERC1155AssetData,
+    MultiAssetData,
+    StaticCallAssetData,
+    ERC20BridgeAssetData,
+]
+"""Any of the decoded forms of asset data."""
+
+
 @deprecated(reason='use `"0x"+encode_erc20().hex()` instead')
 def encode_erc20_asset_data(token_address: str) -> str:
     """Encode an ERC20 token address into an asset data string.
@@ -71,40 +192,28 @@ def encode_erc20(token_address: str) -> bytes:
     return abi_utils.simple_encode("ERC20Token(address)", token_address)
 
 
-def decode_erc20_asset_data(asset_data: str) -> ERC20AssetData:
-    """Decode an ERC20 asset data hex string.
+def decode_erc20_asset_data(
+    asset_data: Union[str, bytes, bytearray, memoryview]
+) -> ERC20AssetData:
+    """Decode ERC20 asset data.
 
-    :param asset_data: String produced by prior call to encode_erc20_asset_data()
+    :param asset_data: Asset data, as a hex string such as that produced by
+        `encode_erc20_asset_data()`:code:, or as raw bytes or a view of them,
+        which are decoded without copying.
 
     >>> decode_erc20_asset_data("0xf47261b00000000000000000000000001dc4c1cefef38a777b15aa20260a54e584b16c48")
     ERC20AssetData(asset_proxy_id='0xf47261b0', token_address='0x1dc4c1cefef38a777b15aa20260a54e584b16c48')
     """  # noqa: E501 (line too long)
-    assert_is_string(asset_data, "asset_data")
+    view = _asset_data_view(asset_data)
 
-    if len(asset_data) < ERC20_ASSET_DATA_BYTE_LENGTH:
-        raise ValueError(
-            "Could not decode ERC20 Proxy Data. Expected length of encoded"
-            + f" data to be at least {str(ERC20_ASSET_DATA_BYTE_LENGTH)}."
-            + f" Got {str(len(asset_data))}."
-        )
-
-    asset_proxy_id: str = asset_data[0:SELECTOR_LENGTH]
-    if asset_proxy_id != abi_utils.method_id("ERC20Token", ["address"]):
+    if view[0:SELECTOR_BYTE_LENGTH] != _ERC20_SELECTOR:
         raise ValueError(
             "Could not decode ERC20 Proxy Data. Expected Asset Proxy Id to be"
-            + f" ERC20 ({abi_utils.method_id('ERC20Token', ['address'])})"
-            + f" but got {asset_proxy_id}."
+            + f" ERC20 ({ERC20_ASSET_PROXY_ID})"
+            + f" but got 0x{view[0:SELECTOR_BYTE_LENGTH].hex()}."
         )
 
-    # workaround for https://github.com/PyCQA/pylint/issues/1498
-    # pylint: disable=unsubscriptable-object
-    token_address = eth_abi.decode_abi(
-        ["address"], bytes.fromhex(asset_data[SELECTOR_LENGTH:])
-    )[0]
-
-    return ERC20AssetData(
-        asset_proxy_id=asset_proxy_id, token_address=token_address
-    )
+    return _decode_erc20(view)
 
 
 @deprecated(reason='use `"0x"+encode_erc721().hex()` instead')
@@ -149,38 +258,346 @@ def encode_erc721(token_address: str, token_id: int) -> bytes:
     )
 
 
-def decode_erc721_asset_data(asset_data: str) -> ERC721AssetData:
-    """Decode an ERC721 asset data hex string.
+def decode_erc721_asset_data(
+    asset_data: Union[str, bytes, bytearray, memoryview]
+) -> ERC721AssetData:
+    """Decode ERC721 asset data.
+
+    :param asset_data: Asset data, as a hex string such as that produced by
+        `encode_erc721_asset_data()`:code:, or as raw bytes or a view of them,
+        which are decoded without copying.
 
     >>> decode_erc721_asset_data('0x025717920000000000000000000000001dc4c1cefef38a777b15aa20260a54e584b16c480000000000000000000000000000000000000000000000000000000000000001')
     ERC721AssetData(asset_proxy_id='0x02571792', token_address='0x1dc4c1cefef38a777b15aa20260a54e584b16c48', token_id=1)
     """  # noqa: E501 (line too long)
-    assert_is_string(asset_data, "asset_data")
+    view = _asset_data_view(asset_data)
 
-    if len(asset_data) < ERC721_ASSET_DATA_MINIMUM_BYTE_LENGTH:
+    if view[0:SELECTOR_BYTE_LENGTH] != _ERC721_SELECTOR:
         raise ValueError(
-            "Could not decode ERC721 Asset Data. Expected length of encoded"
-            + f"data to be at least {ERC721_ASSET_DATA_MINIMUM_BYTE_LENGTH}. "
-            + f"Got {len(asset_data)}."
+            "Could not decode ERC721 Asset Data. Expected Asset Proxy Id to be"
+            + f" ERC721 ({ERC721_ASSET_PROXY_ID}), but got"
+            + f" 0x{view[0:SELECTOR_BYTE_LENGTH].hex()}"
         )
 
-    asset_proxy_id: str = asset_data[0:SELECTOR_LENGTH]
-    if asset_proxy_id != abi_utils.method_id(
-        "ERC721Token", ["address", "uint256"]
-    ):
+    return _decode_erc721(view)
+
+
+def encode_erc1155(
+    token_address: str,
+    token_ids: Sequence[int],
+    token_values: Sequence[int],
+    callback_data: bytes = b"",
+) -> bytes:
+    """Encode ERC1155 asset data bytes.
+
+    :param token_address: the ERC1155 token's contract address.
+    :param token_ids: identifiers of the tokens to be traded.
+    :param token_values: amount of each token to be traded per unit of the
+        asset.
+    :param callback_data: data to be passed to the receiver's callback.
+
+    >>> encode_erc1155(
+    ...     '0x1dc4c1cefef38a777b15aa20260a54e584b16c48', [1], [10]
+    ... ).hex()[0:8]
+    'a7cb5fb7'
+    """
+    assert_is_string(token_address, "token_address")
+
+    return abi_utils.simple_encode(
+        "ERC1155Assets(address,uint256[],uint256[],bytes)",
+        token_address,
+        list(token_ids),
+        list(token_values),
+        callback_data,
+    )
+
+
+def encode_multi_asset(
+    amounts: Sequence[int], nested_asset_data: Sequence[bytes]
+) -> bytes:
+    """Encode multi-asset asset data bytes.
+
+    :param amounts: amount of each nested asset to be traded per unit of the
+        asset.
+    :param nested_asset_data: the encoded asset data of each nested asset.
+
+    >>> encode_multi_asset(
+    ...     [1], [encode_erc20('0x1dc4c1cefef38a777b15aa20260a54e584b16c48')]
+    ... ).hex()[0:8]
+    '94cfcdd7'
+    """
+    return abi_utils.simple_encode(
+        "MultiAsset(uint256[],bytes[])",
+        list(amounts),
+        [bytes(asset_data) for asset_data in nested_asset_data],
+    )
+
+
+def encode_static_call(
+    callee_address: str,
+    static_call_data: bytes,
+    expected_return_data_hash: bytes,
+) -> bytes:
+    """Encode static call asset data bytes.
+
+    :param callee_address: address of the contract to call.
+    :param static_call_data: call data for the static call.
+    :param expected_return_data_hash: keccak hash of the data that the call
+        must return.
+    """
+    assert_is_string(callee_address, "callee_address")
+
+    return abi_utils.simple_encode(
+        "StaticCall(address,bytes,bytes32)",
+        callee_address,
+        static_call_data,
+        expected_return_data_hash,
+    )
+
+
+def encode_erc20_bridge(
+    token_address: str, bridge_address: str, bridge_data: bytes
+) -> bytes:
+    """Encode ERC20 bridge asset data bytes.
+
+    :param token_address: address of the token delivered by the bridge.
+    :param bridge_address: address of the bridge contract.
+    :param bridge_data: data to be passed to the bridge contract.
+    """
+    assert_is_string(token_address, "token_address")
+    assert_is_string(bridge_address, "bridge_address")
+
+    return abi_utils.simple_encode(
+        "ERC20Bridge(address,address,bytes)",
+        token_address,
+        bridge_address,
+        bridge_data,
+    )
+
+
+def _asset_data_view(
+    asset_data: Union[bytes, bytearray, memoryview, str]
+) -> memoryview:
+    """View the bytes of asset data, decoding it first if it's hex."""
+    if isinstance(asset_data, str):
+        asset_data = bytes.fromhex(
+            asset_data[2:] if asset_data[0:2] == "0x" else asset_data
+        )
+    elif not isinstance(asset_data, (bytes, bytearray, memoryview)):
+        assert_is_string(asset_data, "asset_data")
+    return memoryview(asset_data)
+
+
+def _decode_address(asset_data: memoryview, offset: int, kind: str) -> str:
+    """Decode the address in the ABI word at `offset`:code:, as `decode_abi`.
+
+    Like `eth_abi.decode_abi()`:code:, refuse words whose 12 bytes of padding
+    aren't zero, rather than silently dropping them.
+    """
+    address_start, word_end = offset + 12, offset + 32
+    if asset_data[offset:address_start] != _ADDRESS_PADDING:
         raise ValueError(
-            "Could not decode ERC721 Asset Data. Expected Asset Proxy Id to be"
-            + f" ERC721 ("
-            + f"{abi_utils.method_id('ERC721Token', ['address', 'uint256'])}"
-            + f"), but got {asset_proxy_id}"
+            f"Could not decode {kind} asset data. Expected an address, padded"
+            + f" with zeros, but got 0x{asset_data[offset:word_end].hex()}."
         )
+    return "0x" + asset_data[address_start:word_end].hex()
+
 
-    (token_address, token_id) = eth_abi.decode_abi(
-        ["address", "uint256"], bytes.fromhex(asset_data[SELECTOR_LENGTH:])
+def _decode_erc20(asset_data: memoryview) -> ERC20AssetData:
+    if len(asset_data) < ERC20_ASSET_DATA_BYTE_LENGTH:
+        raise ValueError(
+            "Could not decode ERC20 asset data. Expected at least"
+            + f" {ERC20_ASSET_DATA_BYTE_LENGTH} bytes, but got"
+            + f" {len(asset_data)}."
+        )
+    return ERC20AssetData(
+        asset_proxy_id=ERC20_ASSET_PROXY_ID,
+        token_address=_decode_address(
+            asset_data, SELECTOR_BYTE_LENGTH, "ERC20"
+        ),
     )
 
+
+def _decode_erc721(asset_data: memoryview) -> ERC721AssetData:
+    if len(asset_data) < ERC721_ASSET_DATA_BYTE_LENGTH:
+        raise ValueError(
+            "Could not decode ERC721 asset data. Expected at least"
+            + f" {ERC721_ASSET_DATA_BYTE_LENGTH} bytes, but got"
+            + f" {len(asset_data)}."
+        )
     return ERC721AssetData(
-        asset_proxy_id=asset_proxy_id,
+        asset_proxy_id=ERC721_ASSET_PROXY_ID,
+        token_address=_decode_address(
+            asset_data, SELECTOR_BYTE_LENGTH, "ERC721"
+        ),
+        token_id=int.from_bytes(asset_data[36:68], byteorder="big"),
+    )
+
+
+def _decode_erc1155(asset_data: memoryview) -> ERC1155AssetData:
+    (
+        token_address,
+        token_ids,
+        token_values,
+        callback_data,
+    ) = eth_abi.decode_abi(
+        ["address", "uint256[]", "uint256[]", "bytes"],
+        bytes(asset_data[SELECTOR_BYTE_LENGTH:]),
+    )
+    return ERC1155AssetData(
+        asset_proxy_id=ERC1155_ASSET_PROXY_ID,
         token_address=token_address,
-        token_id=token_id,
+        token_ids=tuple(token_ids),
+        token_values=tuple(token_values),
+        callback_data=callback_data,
+    )
+
+
+def _decode_multi_asset(asset_data: memoryview) -> MultiAssetData:
+    amounts, nested_asset_data = eth_abi.decode_abi(
+        ["uint256[]", "bytes[]"], bytes(asset_data[SELECTOR_BYTE_LENGTH:])
     )
+    if len(amounts) != len(nested_asset_data):
+        raise ValueError(
+            "Could not decode multi-asset asset data. Got"
+            + f" {len(amounts)} amounts for {len(nested_asset_data)} assets."
+        )
+    return MultiAssetData(
+        asset_proxy_id=MULTI_ASSET_PROXY_ID,
+        amounts=tuple(amounts),
+        nested_asset_data=tuple(
+            decode_asset_data(nested) for nested in nested_asset_data
+        ),
+    )
+
+
+def _decode_static_call(asset_data: memoryview) -> StaticCallAssetData:
+    (
+        callee_address,
+        static_call_data,
+        expected_return_data_hash,
+    ) = eth_abi.decode_abi(
+        ["address", "bytes", "bytes32"],
+        bytes(asset_data[SELECTOR_BYTE_LENGTH:]),
+    )
+    return StaticCallAssetData(
+        asset_proxy_id=STATIC_CALL_ASSET_PROXY_ID,
+        callee_address=callee_address,
+        static_call_data=static_call_data,
+        expected_return_data_hash=expected_return_data_hash,
+    )
+
+
+def _decode_erc20_bridge(asset_data: memoryview) -> ERC20BridgeAssetData:
+    token_address, bridge_address, bridge_data = eth_abi.decode_abi(
+        ["address", "address", "bytes"],
+        bytes(asset_data[SELECTOR_BYTE_LENGTH:]),
+    )
+    return ERC20BridgeAssetData(
+        asset_proxy_id=ERC20_BRIDGE_ASSET_PROXY_ID,
+        token_address=token_address,
+        bridge_address=bridge_address,
+        bridge_data=bridge_data,
+    )
+
+
+_ASSET_DATA_DECODERS: Dict[bytes, Callable[[memoryview], Any]] = {
+    bytes.fromhex(asset_proxy_id[2:]): decoder
+    for asset_proxy_id, decoder in (
+        (ERC20_ASSET_PROXY_ID, _decode_erc20),
+        (ERC721_ASSET_PROXY_ID, _decode_erc721),
+        (ERC1155_ASSET_PROXY_ID, _decode_erc1155),
+        (MULTI_ASSET_PROXY_ID, _decode_multi_asset),
+        (STATIC_CALL_ASSET_PROXY_ID, _decode_static_call),
+        (ERC20_BRIDGE_ASSET_PROXY_ID, _decode_erc20_bridge),
+    )
+}
+
+
+def decode_asset_data(
+    asset_data: Union[bytes, bytearray, memoryview, str]
+) -> DecodedAssetData:
+    """Decode asset data of any of the types supported by the 0x protocol.
+
+    The type of the asset data is identified by its leading 4-byte selector,
+    and the result is the corresponding one of `ERC20AssetData`:py:class:,
+    `ERC721AssetData`:py:class:, `ERC1155AssetData`:py:class:,
+    `MultiAssetData`:py:class: (whose nested asset data are themselves
+    decoded), `StaticCallAssetData`:py:class: or
+    `ERC20BridgeAssetData`:py:class:.
+
+    :param asset_data: Raw asset data, as in an `Order`:code:, or a view of
+        it.  A hex string is also accepted, though decoding it costs more.
+    :raises ValueError: If the selector is unknown, or the data is malformed.
+
+    >>> decode_asset_data(bytes.fromhex(
+    ...     "f47261b00000000000000000000000001dc4c1cefef38a777b15aa20260a54e584b16c48"
+    ... ))
+    ERC20AssetData(asset_proxy_id='0xf47261b0', token_address='0x1dc4c1cefef38a777b15aa20260a54e584b16c48')
+    >>> decode_asset_data(
+    ...     encode_multi_asset(
+    ...         [1, 2],
+    ...         [
+    ...             encode_erc20("0x1dc4c1cefef38a777b15aa20260a54e584b16c48"),
+    ...             encode_erc721("0x1dc4c1cefef38a777b15aa20260a54e584b16c48", 3),
+    ...         ],
+    ...     )
+    ... ).nested_asset_data[1]
+    ERC721AssetData(asset_proxy_id='0x02571792', token_address='0x1dc4c1cefef38a777b15aa20260a54e584b16c48', token_id=3)
+    """  # noqa: E501 (line too long)
+    asset_data = _asset_data_view(asset_data)
+
+    decoder = _ASSET_DATA_DECODERS.get(
+        bytes(asset_data[0:SELECTOR_BYTE_LENGTH])
+    )
+    if decoder is None:
+        raise ValueError(
+            "Could not decode asset data. Unknown asset proxy ID"
+            + f" 0x{asset_data[0:SELECTOR_BYTE_LENGTH].hex()}."
+        )
+    try:
+        return decoder(asset_data)
+    except DecodingError as error:
+        raise ValueError(f"Could not decode asset data. {error}") from error
+
+
+ASSET_DATA_POOL = BoundedMemo(decode_asset_data, maxsize=4096)
+"""Decoded asset data, shared by `intern_asset_data()`:code:.
+
+Its `hits`:code:, `misses`:code: and `currsize`:code: attributes report its
+effectiveness, and its capacity can be changed with its `resize()`:code:
+method.  When full, the least recently used asset data is evicted.
+
+>>> ASSET_DATA_POOL.maxsize
+4096
+"""
+
+
+def intern_asset_data(
+    asset_data: Union[bytes, bytearray, memoryview, str]
+) -> DecodedAssetData:
+    """Decode asset data, sharing one decoded object per distinct value.
+
+    The same few hundred asset data values recur across millions of orders,
+    so rather than decoding each occurrence into new objects, this returns
+    the very object it returned for the previous occurrence of the same
+    value, as long as that is still in `ASSET_DATA_POOL`:code:.  A repeat
+    decode then costs a dictionary lookup.  Decoded asset data is immutable,
+    so sharing it is safe.
+
+    Takes the same parameter, and raises the same errors, as
+    `decode_asset_data()`:code:.
+
+    >>> asset_data = encode_erc20('0x1dc4c1cefef38a777b15aa20260a54e584b16c48')
+    >>> intern_asset_data(asset_data) is intern_asset_data(
+    ...     '0x' + asset_data.hex()
+    ... )
+    True
+    """
+    if isinstance(asset_data, str):
+        asset_data = bytes.fromhex(
+            asset_data[2:] if asset_data[0:2] == "0x" else asset_data
+        )
+    elif not isinstance(asset_data, bytes):
+        asset_data = bytes(asset_data)
+    return ASSET_DATA_POOL(asset_data)
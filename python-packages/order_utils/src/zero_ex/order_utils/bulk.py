@@ -0,0 +1,452 @@
+"""Hash orders and verify signatures using every available CPU core.
+
+Order hashing and signer recovery are pure computation, so a single Python
+process can only perform them as fast as one core allows.  The functions in
+this module spread that work across a pool of processes, which pays off for
+books of many thousands of orders, such as when re-hashing a full relayer
+snapshot on restart.
+
+Orders are packed into flat tuples of raw bytes and integers before being
+shipped to worker processes, and they're shipped in chunks, so that pickling
+and inter-process communication don't swamp the savings.  Only a few chunks
+are in flight at a time, so orders may be streamed in from a generator
+without holding them all in memory.  Input fitting into a single chunk is
+handled in this process, since starting a pool would cost more than it saves.
+
+>>> order = {
+...     "makerAddress": "0x0000000000000000000000000000000000000000",
+...     "takerAddress": "0x0000000000000000000000000000000000000000",
+...     "feeRecipientAddress": "0x0000000000000000000000000000000000000000",
+...     "senderAddress": "0x0000000000000000000000000000000000000000",
+...     "makerAssetAmount": 0,
+...     "takerAssetAmount": 0,
+...     "makerFee": 0,
+...     "takerFee": 0,
+...     "expirationTimeSeconds": 0,
+...     "salt": 0,
+...     "makerAssetData": bytes(20),
+...     "takerAssetData": bytes(20),
+...     "makerFeeAssetData": bytes(20),
+...     "takerFeeAssetData": bytes(20),
+... }
+>>> order_hashes = generate_order_hashes(
+...     [order] * 3,
+...     exchange_address="0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+...     chain_id=1337,
+...     max_workers=2,
+... )
+>>> for order_hash in order_hashes:
+...     print(order_hash.hex())
+cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714
+cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714
+cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714
+"""
+
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+)
+from functools import partial
+from itertools import chain, islice
+import json
+from os import cpu_count
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from eth_utils import to_checksum_address
+
+from zero_ex.dev_utils.abi_utils import compile_signature
+from zero_ex.dev_utils.type_assertions import (
+    assert_is_address,
+    assert_is_hex_string,
+)
+from zero_ex.order_utils import (
+    _address_to_bytes,
+    _assert_is_provider_or_session,
+    _Constants,
+    _eip712_domain_struct_hash,
+    _exchange_deployment,
+    _hash_packed_order,
+    _hex_to_bytes,
+    _pack_order,
+    _recover_signature_validity,
+    ASSET_DATA_DIGEST_CACHE,
+)
+
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports
+    from web3 import Web3
+    from web3.providers.base import BaseProvider
+    from zero_ex.contract_wrappers.exchange.types import Order
+    from zero_ex.contract_wrappers.session import ProviderSession
+
+
+DEFAULT_CHUNK_SIZE = 2048
+"""Number of orders shipped to a worker process at a time."""
+
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+"""Number of chunks per worker to submit ahead of the results taken.
+
+This bounds how far a streamed input is read ahead of the work done on it.
+"""
+
+MAX_CALLS_PER_BATCH = 1000
+"""Number of contract calls to send in each JSON-RPC batch when verifying.
+
+Nodes cap the size of the batches they accept; Geth's default cap is 1000.
+"""
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _map_bounded(
+    executor: Executor,
+    function: Callable[[list], Any],
+    chunks: Iterable[list],
+    window: int,
+) -> Iterator:
+    """Like `executor.map()`:code:, but with only `window`:code: chunks out.
+
+    `Executor.map()`:code: submits every chunk before yielding any result,
+    which would read a streamed input in full, so chunks are submitted here
+    only as results are taken.
+    """
+    pending: Deque[Future] = deque()
+    for chunk in chunks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, chunk))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _map_in_processes(
+    function: Callable[[list], Any],
+    chunks: Iterable[list],
+    max_workers: Optional[int],
+    executor: Optional[Executor],
+) -> Iterator:
+    """Apply `function`:code: to each chunk, in a pool of processes.
+
+    If there's only one chunk, and no `executor`:code:, it's applied in this
+    process instead.
+    """
+    chunks = iter(chunks)
+    leading_chunks = list(islice(chunks, 2))
+    if len(leading_chunks) <= 1 and executor is None:
+        yield from map(function, leading_chunks)
+        return
+    window = CHUNKS_IN_FLIGHT_PER_WORKER * (max_workers or cpu_count() or 1)
+    if executor is not None:
+        yield from _map_bounded(
+            executor, function, chain(leading_chunks, chunks), window
+        )
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        yield from _map_bounded(
+            pool, function, chain(leading_chunks, chunks), window
+        )
+
+
+def _hash_packed_orders(eip712_prefix: bytes, packed_orders: list) -> bytes:
+    """Hash a chunk of packed orders, in a worker process.
+
+    :returns: the concatenation of the 32-byte hashes of the given orders, in
+        the same order, to keep the reply to the parent process compact.
+    """
+    return b"".join(
+        _hash_packed_order(
+            eip712_prefix, packed_order, ASSET_DATA_DIGEST_CACHE
+        )
+        for packed_order in packed_orders
+    )
+
+
+def generate_order_hashes(  # pylint: disable=too-many-arguments
+    orders: Iterable["Order"],
+    exchange_address: str,
+    chain_id: int,
+    max_workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor = None,
+) -> List[bytes]:
+    """Hash many orders in parallel, returning hashes in input order.
+
+    Unlike `OrderHasher`:py:class:, this function does not validate orders
+    against the JSON schema; orders are only checked for being packable (eg
+    addresses must decode to 20 bytes, and amounts must fit in 256 bits).
+    Validate untrusted orders before calling this function.
+
+    :param orders: The orders to be hashed.  May be any iterable, including a
+        generator streaming orders from disk, which is read only
+        `CHUNKS_IN_FLIGHT_PER_WORKER`:code: chunks per worker ahead of the
+        hashing.  Orders fitting into a single chunk are hashed in this
+        process.
+    :param exchange_address: The address to which the 0x Exchange smart
+        contract has been deployed.
+    :param chain_id: The ID of the chain on which that contract lives.
+    :param max_workers: Number of worker processes to start.  Defaults to the
+        number of CPUs.  When `executor`:code: is given, no processes are
+        started, but the number of chunks in flight is still bounded by it.
+    :param chunk_size: Number of orders to ship to a worker at a time.
+    :param executor: An existing executor to submit work to, so that callers
+        hashing repeatedly can avoid the cost of starting new processes.
+    :returns: A list of 32-byte order hashes, one per order.
+    """
+    assert_is_address(exchange_address, "exchange_address")
+
+    eip712_prefix = _Constants.eip191_header + _eip712_domain_struct_hash(
+        int(chain_id), exchange_address
+    )
+
+    chunks = (
+        [_pack_order(order) for order in chunk]
+        for chunk in _chunks(orders, chunk_size)
+    )
+
+    order_hashes: List[bytes] = []
+    for concatenated_hashes in _map_in_processes(
+        partial(_hash_packed_orders, eip712_prefix),
+        chunks,
+        max_workers,
+        executor,
+    ):
+        for start in range(0, len(concatenated_hashes), 32):
+            end = start + 32
+            order_hashes.append(concatenated_hashes[start:end])
+    return order_hashes
+
+
+def generate_order_hashes_hex(  # pylint: disable=too-many-arguments
+    orders: Iterable["Order"],
+    exchange_address: str,
+    chain_id: int,
+    max_workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor = None,
+) -> List[str]:
+    """Hash many orders in parallel, returning hex strings in input order.
+
+    Takes the same parameters as `generate_order_hashes()`:code:, and returns
+    strings like those returned by `generate_order_hash_hex()`:code:.
+    """
+    return [
+        order_hash.hex()
+        for order_hash in generate_order_hashes(
+            orders,
+            exchange_address,
+            chain_id,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            executor=executor,
+        )
+    ]
+
+
+def _recover_signature_validities(
+    triples: List[Tuple[bytes, bytes, bytes]]
+) -> List[Optional[bool]]:
+    """Check a chunk of signatures locally, in a worker process."""
+    return [_recover_signature_validity(*triple) for triple in triples]
+
+
+_IS_VALID_HASH_SIGNATURE = compile_signature(
+    "isValidHashSignature(bytes32,address,bytes)"
+)
+
+
+def _eth_call_result_to_bool(response: dict) -> bool:
+    """Decode the `bool`:code: returned by an `eth_call`:code: response."""
+    if "error" in response:
+        raise ValueError(response["error"])
+    word = _hex_to_bytes(response["result"])
+    if len(word) != 32 or int.from_bytes(word, "big") > 1:
+        raise ValueError(
+            f"Expected an ABI encoded bool, but got {response['result']}."
+        )
+    return word[-1] == 1
+
+
+def _post_batch(
+    provider: "Web3.HTTPProvider", requests: List[dict]
+) -> List[dict]:
+    """Send JSON-RPC requests in one batch, and return responses in order."""
+    # pylint: disable=import-outside-toplevel
+    from web3._utils.request import make_post_request
+
+    responses = json.loads(
+        make_post_request(
+            provider.endpoint_uri,
+            json.dumps(requests).encode(),
+            **provider.get_request_kwargs(),
+        )
+    )
+    if not isinstance(responses, list):
+        # a node that doesn't support batches answers with a single error:
+        raise ValueError(responses.get("error", responses))
+    responses_by_id = {response["id"]: response for response in responses}
+    return [responses_by_id[request["id"]] for request in requests]
+
+
+def _call_exchange_in_batches(
+    provider: Union["BaseProvider", "ProviderSession"],
+    triples: List[Tuple[bytes, bytes, bytes]],
+) -> Dict[Tuple[bytes, bytes, bytes], bool]:
+    """Check signatures with the Exchange contract, in JSON-RPC batches.
+
+    Each batch of up to `MAX_CALLS_PER_BATCH`:code: calls is a single HTTP
+    request.  Web3 offers no way to batch requests over other transports, so
+    other providers get one request per call.
+    """
+    # pylint: disable=import-outside-toplevel
+    from web3 import Web3
+    from zero_ex.contract_wrappers.session import ProviderSession
+
+    _, exchange_address = _exchange_deployment(provider)
+    if isinstance(provider, ProviderSession):
+        provider = provider.provider
+    requests: List[dict] = [
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "eth_call",
+            "params": [
+                {
+                    "to": to_checksum_address(exchange_address),
+                    "data": "0x"
+                    + _IS_VALID_HASH_SIGNATURE(
+                        data, to_checksum_address(signer_address), signature
+                    ).hex(),
+                },
+                "latest",
+            ],
+        }
+        for request_id, (data, signature, signer_address) in enumerate(triples)
+    ]
+
+    if isinstance(provider, Web3.HTTPProvider):
+        responses = [
+            response
+            for batch in _chunks(requests, MAX_CALLS_PER_BATCH)
+            for response in _post_batch(provider, batch)
+        ]
+    else:
+        responses = [
+            provider.make_request(request["method"], request["params"])
+            for request in requests
+        ]
+    return {
+        triple: _eth_call_result_to_bool(response)
+        for triple, response in zip(triples, responses)
+    }
+
+
+def is_valid_signature_batch(  # pylint: disable=too-many-arguments
+    provider: Union["BaseProvider", "ProviderSession"],
+    hashes_signatures_signers: Iterable[Tuple[str, str, str]],
+    max_workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor = None,
+) -> List[bool]:
+    """Check the validity of many signatures, returning results in order.
+
+    Equivalent to calling `is_valid_signature()`:code: on each item, but
+    faster.  Signers of EIP712 and ETH_SIGN signatures are recovered across a
+    pool of processes (or in this process, if the input fits into a single
+    chunk and no `executor`:code: is given).  Signatures that only the
+    Exchange contract can judge, such as those of type WALLET, VALIDATOR or
+    PRE_SIGNED, are de-duplicated, and the contract calls for them are sent
+    to an HTTP provider in JSON-RPC batches of up to
+    `MAX_CALLS_PER_BATCH`:code: calls, after looking up the Exchange address
+    just once.
+
+    :param provider: A Web3 provider able to access the 0x Exchange contract,
+        or a `zero_ex.contract_wrappers.session.ProviderSession`:code:.
+    :param hashes_signatures_signers: Triples of the hex encoded data signed,
+        the hex encoded signature, and the hex encoded signer address.
+    :param max_workers: Number of worker processes to start.  Defaults to the
+        number of CPUs.  When `executor`:code: is given, no processes are
+        started, but the number of chunks in flight is still bounded by it.
+    :param chunk_size: Number of signatures to ship to a worker at a time.
+    :param executor: An existing executor to submit work to.
+    :returns: A list of booleans, one per input triple, true if valid.
+
+    >>> from web3 import Web3
+    >>> is_valid_signature_batch(
+    ...     Web3.HTTPProvider("http://127.0.0.1:8545"),
+    ...     [
+    ...         (
+    ...             '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...             '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ...             signer_address,
+    ...         )
+    ...         for signer_address in (
+    ...             '0x5409ed021d9299bf6814279a6a1411a7e866a631',
+    ...             '0x6ecbe1db9ef729cbe972c83fb886247691fb6beb',
+    ...         )
+    ...     ],
+    ... )
+    [True, False]
+    """  # noqa: E501 (line too long)
+    _assert_is_provider_or_session(provider, "provider")
+
+    triples = []
+    for data, signature, signer_address in hashes_signatures_signers:
+        assert_is_hex_string(data, "data")
+        assert_is_hex_string(signature, "signature")
+        assert_is_address(signer_address, "signer_address")
+        triples.append(
+            (
+                _hex_to_bytes(data),
+                _hex_to_bytes(signature),
+                _address_to_bytes(signer_address),
+            )
+        )
+
+    validities = [
+        validity
+        for chunk_validities in _map_in_processes(
+            _recover_signature_validities,
+            _chunks(triples, chunk_size),
+            max_workers,
+            executor,
+        )
+        for validity in chunk_validities
+    ]
+
+    on_chain_triples = list(
+        {
+            triple: None
+            for triple, validity in zip(triples, validities)
+            if validity is None
+        }
+    )
+    if not on_chain_triples:
+        return cast(List[bool], validities)
+
+    on_chain_validities = _call_exchange_in_batches(provider, on_chain_triples)
+
+    return [
+        on_chain_validities[triple] if validity is None else validity
+        for triple, validity in zip(triples, validities)
+    ]
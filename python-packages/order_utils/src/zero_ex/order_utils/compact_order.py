@@ -0,0 +1,222 @@
+"""A compact, immutable representation of 0x orders.
+
+An `Order`:code: dict carries a hash table per order, plus hex strings for
+addresses and asset data, and sometimes decimal strings for amounts.  A
+`CompactOrder`:py:class: is a tuple of raw values instead: addresses are 20
+raw bytes, amounts are integers, and asset data is `bytes`:code:, in the order
+the fields appear in the EIP-712 `Order`:code: type.  That makes it several
+times smaller in memory, cheap to pickle, and directly hashable by
+`zero_ex.order_utils.OrderHasher`:code: with no intermediate conversions.
+
+Conversions to and from `Order`:code: and JSON dicts are lossless:
+
+>>> order = {
+...     "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+...     "takerAddress": "0x0000000000000000000000000000000000000000",
+...     "feeRecipientAddress": "0x0000000000000000000000000000000000000000",
+...     "senderAddress": "0x0000000000000000000000000000000000000000",
+...     "makerAssetAmount": 1000000000000000000,
+...     "takerAssetAmount": 500000000000000000,
+...     "makerFee": 0,
+...     "takerFee": 0,
+...     "expirationTimeSeconds": 1577836800,
+...     "salt": 1,
+...     "makerAssetData": bytes(36),
+...     "takerAssetData": bytes(36),
+...     "makerFeeAssetData": b"",
+...     "takerFeeAssetData": b"",
+... }
+>>> compact_order = CompactOrder.from_order(order)
+>>> compact_order.maker_address.hex()
+'5409ed021d9299bf6814279a6a1411a7e866a631'
+>>> compact_order.taker_asset_amount
+500000000000000000
+>>> compact_order.to_order() == order
+True
+>>> CompactOrder.from_jsdict(compact_order.to_jsdict(1337)) == compact_order
+True
+
+There is no conversion from the `zero_ex.sra_client.OrderSchema`:code: model:
+it's generated from version 2 of the Standard Relayer API spec, and has no fee
+asset data, so it can't hold a version 3 order.  Pack the JSON of a relayer's
+response with `from_jsdict()`:code: instead.
+
+Since the fields are in ABI order, with addresses as 20-byte values, a
+`CompactOrder`:code: may also be passed to the contract wrappers wherever an
+`Order`:code: struct is expected.
+"""
+
+from typing import cast, NamedTuple, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    # the generated Exchange wrapper, and web3 with it, are slow to import:
+    from zero_ex.contract_wrappers.exchange.types import Order
+
+
+_NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+_MAX_UINT256 = 2 ** 256 - 1
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+"""Raw bytes, or a buffer exposing them, as accepted for `bytes` fields."""
+
+
+def _hex_to_bytes(hex_str: str) -> bytes:
+    """Decode a hex string, with or without a "0x" prefix, into bytes."""
+    if hex_str[0:2] in ("0x", "0X"):
+        hex_str = hex_str[2:]
+    return bytes.fromhex(hex_str)
+
+
+def _ensure_bytes(value: Union[str, BytesLike]) -> bytes:
+    """Get the bytes of a hex string or of a buffer.
+
+    `bytes`:code: are passed through as they are.  A `bytearray`:code: or
+    `memoryview`:code: is copied, once, since the result must be immutable.
+    """
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        if len(value) % 2:
+            # tolerate odd-length hex, as eth_utils.to_bytes() does:
+            return _hex_to_bytes(
+                "0" + (value[2:] if value[0:2] in ("0x", "0X") else value)
+            )
+        return _hex_to_bytes(value)
+    return bytes(value)
+
+
+def _address_to_bytes(address: Union[str, BytesLike]) -> bytes:
+    address_bytes = _ensure_bytes(address)
+    if len(address_bytes) != 20:
+        raise ValueError(f"Expected a 20-byte address, but got {address!r}.")
+    return address_bytes
+
+
+def _to_uint256(value: Union[int, str]) -> int:
+    integer = int(value)
+    if not 0 <= integer <= _MAX_UINT256:
+        raise ValueError(f"Expected a uint256, but got {value}.")
+    return integer
+
+
+class CompactOrder(NamedTuple):
+    """An order, as a tuple of raw field values in EIP-712 order.
+
+    Construct one with `from_order()`:code: or `from_jsdict()`:code:, which
+    validate that addresses are 20 bytes long and that amounts fit in 256
+    bits.
+    """
+
+    maker_address: bytes
+    taker_address: bytes
+    fee_recipient_address: bytes
+    sender_address: bytes
+    maker_asset_amount: int
+    taker_asset_amount: int
+    maker_fee: int
+    taker_fee: int
+    expiration_time_seconds: int
+    salt: int
+    maker_asset_data: bytes
+    taker_asset_data: bytes
+    maker_fee_asset_data: bytes
+    taker_fee_asset_data: bytes
+
+    @classmethod
+    def from_order(
+        cls, order: Union["Order", "CompactOrder"]
+    ) -> "CompactOrder":
+        """Pack an `Order`:code:.
+
+        Hex strings, `bytearray`:code: and `memoryview`:code: are accepted in
+        place of bytes, and decimal strings in place of integers.  Fields
+        given as `bytes`:code: are kept without copying.  A
+        `CompactOrder`:code: is returned as is.
+        """
+        if isinstance(order, CompactOrder):
+            return order
+        return cls(
+            _address_to_bytes(order["makerAddress"]),
+            _address_to_bytes(order["takerAddress"]),
+            _address_to_bytes(order["feeRecipientAddress"]),
+            _address_to_bytes(order["senderAddress"]),
+            _to_uint256(order["makerAssetAmount"]),
+            _to_uint256(order["takerAssetAmount"]),
+            _to_uint256(order["makerFee"]),
+            _to_uint256(order["takerFee"]),
+            _to_uint256(order["expirationTimeSeconds"]),
+            _to_uint256(order["salt"]),
+            _ensure_bytes(order["makerAssetData"]),
+            _ensure_bytes(order["takerAssetData"]),
+            _ensure_bytes(order["makerFeeAssetData"]),
+            _ensure_bytes(order["takerFeeAssetData"]),
+        )
+
+    @classmethod
+    def from_jsdict(cls, jsdict: dict) -> "CompactOrder":
+        """Pack an order in the JSON form of `the 0x order JSON schema`__.
+
+        Fields that aren't part of the order struct, such as
+        `exchangeAddress`:code:, `chainId`:code: and `signature`:code:, are
+        ignored.
+
+        __ https://github.com/0xProject/0x-monorepo/blob/development/packages/json-schemas/schemas/order_schema.json
+        """  # noqa: E501 (line too long)
+        return cls.from_order(cast("Order", jsdict))
+
+    def to_order(self) -> "Order":
+        """Unpack into an `Order`:code:, with lowercase hex addresses."""
+        order = dict(
+            makerAddress="0x" + self.maker_address.hex(),
+            takerAddress="0x" + self.taker_address.hex(),
+            feeRecipientAddress="0x" + self.fee_recipient_address.hex(),
+            senderAddress="0x" + self.sender_address.hex(),
+            makerAssetAmount=self.maker_asset_amount,
+            takerAssetAmount=self.taker_asset_amount,
+            makerFee=self.maker_fee,
+            takerFee=self.taker_fee,
+            expirationTimeSeconds=self.expiration_time_seconds,
+            salt=self.salt,
+            makerAssetData=self.maker_asset_data,
+            takerAssetData=self.taker_asset_data,
+            makerFeeAssetData=self.maker_fee_asset_data,
+            takerFeeAssetData=self.taker_fee_asset_data,
+        )
+        return cast("Order", order)
+
+    def to_jsdict(
+        self,
+        chain_id: int,
+        exchange_address: str = _NULL_ADDRESS,
+        signature: str = None,
+    ) -> dict:
+        """Unpack into the JSON form of the 0x order JSON schema.
+
+        The result is the same as that of
+        `zero_ex.contract_wrappers.order_conversions.order_to_jsdict()`:code:
+        applied to `to_order()`:code:, but built without intermediate copies
+        and without validating it against the schema.
+        """
+        jsdict = {
+            "makerAddress": "0x" + self.maker_address.hex(),
+            "takerAddress": "0x" + self.taker_address.hex(),
+            "feeRecipientAddress": "0x" + self.fee_recipient_address.hex(),
+            "senderAddress": "0x" + self.sender_address.hex(),
+            "makerAssetAmount": str(self.maker_asset_amount),
+            "takerAssetAmount": str(self.taker_asset_amount),
+            "makerFee": str(self.maker_fee),
+            "takerFee": str(self.taker_fee),
+            "expirationTimeSeconds": str(self.expiration_time_seconds),
+            "salt": str(self.salt),
+            "makerAssetData": "0x" + self.maker_asset_data.hex(),
+            "takerAssetData": "0x" + self.taker_asset_data.hex(),
+            "makerFeeAssetData": "0x" + self.maker_fee_asset_data.hex(),
+            "takerFeeAssetData": "0x" + self.taker_fee_asset_data.hex(),
+            "exchangeAddress": exchange_address,
+            "chainId": chain_id,
+        }
+        if signature is not None:
+            jsdict["signature"] = signature
+        return jsdict
@@ -0,0 +1,280 @@
+"""Hash EIP-712 structs, such as orders and 0x transactions.
+
+`EIP-712 <https://eips.ethereum.org/EIPS/eip-712>`_ hashes a struct by
+encoding each of its fields into a 32-byte word, according to the field's
+type, and hashing the type's signature along with those words.  An
+`EIP712Struct`:py:class: does the per-type work just once: it computes the
+type hash and selects an encoder for each field when it is constructed, and
+then hashes any number of instances of the type with nothing left to do but
+encode their values.
+
+Compiled types are provided for the EIP-712 domain and for the two structs
+signed in the 0x protocol, `Order`:code: and `ZeroExTransaction`:code:.
+Hashing many 0x transactions, as a coordinator does, looks like this:
+
+>>> domain_separator = exchange_domain_separator(
+...     chain_id=1337,
+...     exchange_address="0x48bacb9266a570d521063ef5dd96e61686dbe788",
+... )
+>>> transaction = {
+...     "salt": 1,
+...     "expirationTimeSeconds": 1577836800,
+...     "gasPrice": 10 ** 9,
+...     "signerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+...     "data": bytes.fromhex("b4be83d5"),
+... }
+>>> ZERO_EX_TRANSACTION.hash(transaction, domain_separator).hex()
+'bd6526701b84a2e8fbe9a473a63be918128e02c19b81063dfe57964cd5e76777'
+
+Instances may be given either as mappings from field names to values, like
+the `TypedDict`:code: types in `zero_ex.contract_wrappers.exchange.types`:code:,
+or as tuples of values in field order, like
+`zero_ex.order_utils.compact_order.CompactOrder`:code:.
+"""  # noqa: E501 (line too long)
+
+from functools import lru_cache
+import re
+from typing import Any, Callable, cast, Mapping, Sequence, Tuple, Union
+
+from eth_utils import keccak
+
+from zero_ex.order_utils.compact_order import (
+    _address_to_bytes,
+    _ensure_bytes,
+    BytesLike,
+)
+
+
+Digest = Callable[[Union[str, bytes]], bytes]
+"""A function producing the keccak digest of (possibly hex encoded) bytes."""
+
+
+def _keccak_bytes(value: Union[str, BytesLike]) -> bytes:
+    return keccak(_ensure_bytes(value))
+
+
+_ADDRESS_PADDING = bytes(12)
+
+
+def _encode_address(value: Union[str, BytesLike], _digest: Digest) -> bytes:
+    return _ADDRESS_PADDING + _address_to_bytes(value)
+
+
+def _integer_encoder(
+    field_name: str, field_type: str, bits: int
+) -> Callable[[Union[int, str], Digest], bytes]:
+    """Make an encoder of a `uintN` or `intN` field, checking its range."""
+    signed = field_type.startswith("int")
+    low, high = (
+        (-(2 ** (bits - 1)), 2 ** (bits - 1)) if signed else (0, 2 ** bits)
+    )
+
+    def _encode_integer(value: Union[int, str], _digest: Digest) -> bytes:
+        number = int(value)
+        if not low <= number < high:
+            raise ValueError(
+                f"Field {field_name} has value {number}, which is out of"
+                + f" range for type {field_type}."
+            )
+        return number.to_bytes(32, byteorder="big", signed=signed)
+
+    return _encode_integer
+
+
+def _encode_bool(value: bool, _digest: Digest) -> bytes:
+    return int(bool(value)).to_bytes(32, byteorder="big")
+
+
+def _encode_fixed_bytes(
+    value: Union[str, BytesLike], _digest: Digest
+) -> bytes:
+    return _ensure_bytes(value).ljust(32, b"\x00")
+
+
+def _encode_bytes(value: Union[str, BytesLike], digest: Digest) -> bytes:
+    # a digest may be memoized, and so need a hashable argument:
+    return digest(value if isinstance(value, (bytes, str)) else bytes(value))
+
+
+def _encode_string(value: str, _digest: Digest) -> bytes:
+    return keccak(text=value)
+
+
+def _field_encoder(
+    field_name: str, field_type: str
+) -> Callable[[Any, Digest], bytes]:
+    """Select the encoder for values of the given atomic or dynamic type."""
+    if field_type == "address":
+        return _encode_address
+    if field_type == "bool":
+        return _encode_bool
+    if field_type == "bytes":
+        return _encode_bytes
+    if field_type == "string":
+        return _encode_string
+    match = re.fullmatch(r"(uint|int|bytes)([0-9]+)", field_type)
+    if match:
+        prefix, size = match.group(1), int(match.group(2))
+        if prefix == "bytes" and 1 <= size <= 32:
+            return _encode_fixed_bytes
+        if prefix != "bytes" and size % 8 == 0 and 8 <= size <= 256:
+            return _integer_encoder(field_name, field_type, size)
+    raise ValueError(
+        f"Unsupported EIP-712 field type {field_type}; only atomic types,"
+        + " bytes and string are supported."
+    )
+
+
+class EIP712Struct:
+    """A compiled EIP-712 struct type.
+
+    :param name: The name of the struct type, eg `"Order"`:code:.
+    :param fields: Pairs of field name and Solidity type, in the order in
+        which they're declared in the struct.  Nested structs and arrays are
+        not supported.
+
+    >>> mail = EIP712Struct("Mail", [("from", "address"), ("contents", "string")])
+    >>> mail.type_string
+    'Mail(address from,string contents)'
+    >>> mail.struct_hash(
+    ...     ["0xcd2a3d9f938e13cd947ec05abc7fe734df8dd826", "Hello, Bob!"]
+    ... ).hex()
+    '70b0c89344a9c5c71ea5566261d20b22e93c12b5e5cb7c75528f1e4c39774fde'
+    """  # noqa: E501 (line too long)
+
+    def __init__(self, name: str, fields: Sequence[Tuple[str, str]]):
+        """Compute the type hash, and select an encoder for each field."""
+        self.name = name
+        self.field_names = tuple(field_name for field_name, _ in fields)
+        self.type_string = (
+            name
+            + "("
+            + ",".join(
+                f"{field_type} {field_name}"
+                for field_name, field_type in fields
+            )
+            + ")"
+        )
+        self.type_hash = keccak(text=self.type_string)
+        self._encoders = tuple(
+            _field_encoder(field_name, field_type)
+            for field_name, field_type in fields
+        )
+
+    def _field_values(
+        self, instance: Union[Mapping[str, Any], Sequence[Any]]
+    ) -> Sequence[Any]:
+        if isinstance(instance, (tuple, list)):
+            return instance
+        return [
+            cast(Mapping[str, Any], instance)[field_name]
+            for field_name in self.field_names
+        ]
+
+    def encode_data(
+        self,
+        instance: Union[Mapping[str, Any], Sequence[Any]],
+        digest: Digest = _keccak_bytes,
+    ) -> bytes:
+        """Encode an instance's field values, as EIP-712's `encodeData`.
+
+        :param instance: Either a mapping from field names to values, or a
+            tuple or list of values in field order.
+        :param digest: The function with which to hash `bytes`:code: fields,
+            eg a `zero_ex.dev_utils.memoize.BoundedMemo`:code: of keccak.
+        """
+        return b"".join(
+            [
+                encoder(value, digest)
+                for encoder, value in zip(
+                    self._encoders, self._field_values(instance)
+                )
+            ]
+        )
+
+    def struct_hash(
+        self,
+        instance: Union[Mapping[str, Any], Sequence[Any]],
+        digest: Digest = _keccak_bytes,
+    ) -> bytes:
+        """Hash an instance of the struct, as EIP-712's `hashStruct`.
+
+        Takes the same parameters as `encode_data()`:code:.
+        """
+        return keccak(self.type_hash + self.encode_data(instance, digest))
+
+    def hash(
+        self,
+        instance: Union[Mapping[str, Any], Sequence[Any]],
+        domain_separator: bytes,
+        digest: Digest = _keccak_bytes,
+    ) -> bytes:
+        """Hash an instance of the struct for signing, within a domain.
+
+        :param domain_separator: The struct hash of the EIP-712 domain, eg as
+            returned by `exchange_domain_separator()`:code:.
+        :returns: The 32-byte EIP-191 "typed data" hash of the instance.
+        """
+        return keccak(
+            b"\x19\x01" + domain_separator + self.struct_hash(instance, digest)
+        )
+
+
+EIP712_DOMAIN = EIP712Struct(
+    "EIP712Domain",
+    [
+        ("name", "string"),
+        ("version", "string"),
+        ("chainId", "uint256"),
+        ("verifyingContract", "address"),
+    ],
+)
+"""The EIP-712 domain type, as used by the 0x protocol."""
+
+ORDER = EIP712Struct(
+    "Order",
+    [
+        ("makerAddress", "address"),
+        ("takerAddress", "address"),
+        ("feeRecipientAddress", "address"),
+        ("senderAddress", "address"),
+        ("makerAssetAmount", "uint256"),
+        ("takerAssetAmount", "uint256"),
+        ("makerFee", "uint256"),
+        ("takerFee", "uint256"),
+        ("expirationTimeSeconds", "uint256"),
+        ("salt", "uint256"),
+        ("makerAssetData", "bytes"),
+        ("takerAssetData", "bytes"),
+        ("makerFeeAssetData", "bytes"),
+        ("takerFeeAssetData", "bytes"),
+    ],
+)
+"""The `zero_ex.contract_wrappers.exchange.types.Order`:code: struct."""
+
+ZERO_EX_TRANSACTION = EIP712Struct(
+    "ZeroExTransaction",
+    [
+        ("salt", "uint256"),
+        ("expirationTimeSeconds", "uint256"),
+        ("gasPrice", "uint256"),
+        ("signerAddress", "address"),
+        ("data", "bytes"),
+    ],
+)
+"""The `zero_ex.contract_wrappers.exchange.types.ZeroExTransaction`:code:
+struct."""
+
+
+@lru_cache(maxsize=32)
+def exchange_domain_separator(chain_id: int, exchange_address: str) -> bytes:
+    """Get the EIP-712 domain separator of an Exchange deployment.
+
+    Memoized, since every order and transaction for a deployment shares it.
+
+    :param chain_id: The ID of the chain on which the Exchange lives.
+    :param exchange_address: The address of the Exchange contract.
+    """
+    return EIP712_DOMAIN.struct_hash(
+        ("0x Protocol", "3.0.0", int(chain_id), exchange_address)
+    )
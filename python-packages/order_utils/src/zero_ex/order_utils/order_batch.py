@@ -0,0 +1,384 @@
+"""Columnar storage of many orders, for vectorized order book math.
+
+An `OrderBatch`:py:class: holds each order field in a NumPy array: addresses
+in columns of 20-byte strings, amounts in columns of 32-byte big-endian
+unsigned integers, and asset data as integer IDs into a table of the distinct
+asset data values in the batch.  Filtering a book of a million orders by
+expiry, maker or fees, or computing all of their prices, then takes a handful
+of array operations rather than a Python loop over a million dicts.
+
+This module needs NumPy, which is an optional dependency of this package::
+
+    pip install 0x-order-utils[batch]
+
+>>> def make_order(salt, maker_asset_amount, taker_fee):
+...     return {
+...         "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+...         "takerAddress": "0x0000000000000000000000000000000000000000",
+...         "feeRecipientAddress": "0x0000000000000000000000000000000000000000",
+...         "senderAddress": "0x0000000000000000000000000000000000000000",
+...         "makerAssetAmount": maker_asset_amount,
+...         "takerAssetAmount": 100,
+...         "makerFee": 0,
+...         "takerFee": taker_fee,
+...         "expirationTimeSeconds": 1577836800 + salt,
+...         "salt": salt,
+...         "makerAssetData": "0xf47261b0" + "00" * 32,
+...         "takerAssetData": "0xf47261b0" + "11" * 32,
+...         "makerFeeAssetData": "0x",
+...         "takerFeeAssetData": "0x",
+...     }
+>>> batch = OrderBatch.from_orders(
+...     [make_order(1, 200, 0), make_order(2, 400, 5), make_order(3, 50, 0)]
+... )
+>>> len(batch)
+3
+>>> batch.prices()
+array([0.5 , 0.25, 2.  ])
+>>> len(batch.asset_data)
+3
+>>> fee_free = batch.with_fees_at_most(taker_fee=0)
+>>> [order.salt for order in fee_free]
+[1, 3]
+>>> [order.salt for order in batch.unexpired(timestamp=1577836802)]
+[3]
+"""  # noqa: E501 (line too long)
+
+from time import time
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError(
+        "zero_ex.order_utils.order_batch requires NumPy; install it with"
+        + " `pip install 0x-order-utils[batch]`."
+    ) from error
+
+from zero_ex.order_utils.compact_order import (
+    _address_to_bytes,
+    _ensure_bytes,
+    CompactOrder,
+)
+
+if TYPE_CHECKING:
+    from zero_ex.contract_wrappers.exchange.types import Order
+
+
+ADDRESS_COLUMNS = (
+    "maker_address",
+    "taker_address",
+    "fee_recipient_address",
+    "sender_address",
+)
+"""Names of the columns holding addresses, as 20-byte strings."""
+
+AMOUNT_COLUMNS = (
+    "maker_asset_amount",
+    "taker_asset_amount",
+    "maker_fee",
+    "taker_fee",
+    "expiration_time_seconds",
+    "salt",
+)
+"""Names of the columns holding uint256 values, as 32-byte strings."""
+
+ASSET_DATA_COLUMNS = (
+    "maker_asset_data",
+    "taker_asset_data",
+    "maker_fee_asset_data",
+    "taker_fee_asset_data",
+)
+"""Names of the columns holding IDs of asset data values."""
+
+_LIMB_WEIGHTS = np.array([2.0 ** 192, 2.0 ** 128, 2.0 ** 64, 1.0])
+
+
+def _uint256_to_bytes(value: int) -> bytes:
+    return int(value).to_bytes(32, byteorder="big")
+
+
+def _split(raw: bytes, width: int) -> List[bytes]:
+    """Split the contents of a fixed-width byte string column."""
+    return [
+        raw[start:end]
+        for start, end in zip(
+            range(0, len(raw), width), range(width, len(raw) + 1, width)
+        )
+    ]
+
+
+def _uint256_column_to_float(column: np.ndarray) -> np.ndarray:
+    """Convert a column of 32-byte big-endian integers to float64s."""
+    limbs = np.frombuffer(column.tobytes(), dtype=">u8").reshape(-1, 4)
+    return limbs.astype(np.float64) @ _LIMB_WEIGHTS
+
+
+class OrderBatch:
+    """A set of orders, stored column-wise.
+
+    Build one with `from_orders()`:code: or `from_sra_response()`:code:,
+    rather than calling this constructor directly.
+
+    Columns are read by indexing the batch with a column name, eg
+    `batch["maker_address"]`:code:; names are those of the fields of
+    `zero_ex.order_utils.compact_order.CompactOrder`:code:.  Indexing with an
+    integer gives the order at that position as a `CompactOrder`:code:, and
+    indexing with a slice, an array of positions or a boolean mask gives a new
+    batch of the selected orders.
+
+    Fixed-width byte strings in NumPy drop their trailing zero bytes when read
+    one at a time, so prefer indexing the batch over reading individual
+    address and amount elements out of its columns.
+
+    :param columns: A mapping from each column name to a one-dimensional
+        array of equal length.  Address columns have dtype `S20`:code:,
+        amount columns have dtype `S32`:code: and asset data columns have an
+        integer dtype.
+    :param asset_data: The distinct asset data values referred to by the
+        asset data columns, indexed by ID.
+    """
+
+    def __init__(
+        self, columns: Dict[str, np.ndarray], asset_data: Sequence[bytes]
+    ):
+        """Wrap existing columns, checking their names and lengths."""
+        expected_names = set(CompactOrder._fields)
+        if set(columns) != expected_names:
+            raise ValueError(
+                f"Expected columns {sorted(expected_names)}, but got"
+                + f" {sorted(columns)}."
+            )
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("Expected all columns to be of equal length.")
+
+        self.columns = columns
+        self.asset_data = tuple(asset_data)
+
+    @classmethod
+    def from_orders(
+        cls, orders: Iterable[Union["Order", CompactOrder, dict]]
+    ) -> "OrderBatch":
+        """Build a batch from `Order`:code:, JSON or compact orders.
+
+        JSON dicts, such as those returned by
+        `zero_ex.contract_wrappers.order_conversions.order_to_jsdict()`:code:,
+        may carry extra fields, which are ignored.
+
+        :raises ValueError: If any address isn't 20 bytes long, or any amount
+            doesn't fit in 256 bits.
+        """
+        return cls._from_compact_orders(
+            CompactOrder.from_order(cast("Order", order)) for order in orders
+        )
+
+    @classmethod
+    def from_sra_response(cls, response: dict) -> "OrderBatch":
+        """Build a batch from the JSON of a Standard Relayer API response.
+
+        :param response: A JSON dict with a `records`:code: list, each record
+            a dict with the JSON form of a signed order as its
+            `order`:code:, such as a page of orders, or the `bids`:code: or
+            `asks`:code: of an order book.  With a
+            `zero_ex.sra_client.RelayerApi`:code:, get it by passing
+            `_preload_content=False`:code: to `get_orders()`:code: and taking
+            `json.loads()`:code: of the response's `data`:code:.  The models
+            that the client deserializes responses into by default are
+            generated from version 2 of the Standard Relayer API spec, and
+            drop the fee asset data of a version 3 order, so they are
+            refused.
+        :raises TypeError: If the response, a record or its order isn't a
+            dict.
+        :raises ValueError: If any address isn't 20 bytes long, or any amount
+            doesn't fit in 256 bits.
+        """
+        if not isinstance(response, dict):
+            raise TypeError(
+                "Expected the JSON of a Standard Relayer API response, but"
+                + f" got a {type(response).__name__}; the zero_ex.sra_client"
+                + " models have no fee asset data."
+            )
+
+        def _compact_orders() -> Iterator[CompactOrder]:
+            for record in response["records"]:
+                order = (
+                    record.get("order") if isinstance(record, dict) else None
+                )
+                if not isinstance(order, dict):
+                    raise TypeError(
+                        "Expected a JSON record, with the JSON form of a"
+                        + " signed order, but got a"
+                        + f" {type(record).__name__}."
+                    )
+                yield CompactOrder.from_jsdict(order)
+
+        return cls._from_compact_orders(_compact_orders())
+
+    @classmethod
+    def _from_compact_orders(
+        cls, compact_orders: Iterable[CompactOrder]
+    ) -> "OrderBatch":
+        fields = list(zip(*compact_orders)) or [()] * len(CompactOrder._fields)
+        field_values = dict(zip(CompactOrder._fields, fields))
+
+        columns = {
+            name: np.array(field_values[name], dtype="S20")
+            for name in ADDRESS_COLUMNS
+        }
+        for name in AMOUNT_COLUMNS:
+            columns[name] = np.array(
+                [_uint256_to_bytes(value) for value in field_values[name]],
+                dtype="S32",
+            )
+        asset_data_ids: Dict[bytes, int] = {}
+        for name in ASSET_DATA_COLUMNS:
+            columns[name] = np.array(
+                [
+                    asset_data_ids.setdefault(
+                        bytes(asset_data), len(asset_data_ids)
+                    )
+                    for asset_data in field_values[name]
+                ],
+                dtype=np.int64,
+            )
+        return cls(columns, list(asset_data_ids))
+
+    def __len__(self) -> int:
+        """Get the number of orders in the batch."""
+        return len(self.columns["salt"])
+
+    def __iter__(self) -> Iterator[CompactOrder]:
+        """Iterate over the orders in the batch, as compact orders."""
+        fields: List[List[Any]] = []
+        for name in ADDRESS_COLUMNS:
+            fields.append(_split(self.columns[name].tobytes(), 20))
+        for name in AMOUNT_COLUMNS:
+            fields.append(
+                [
+                    int.from_bytes(value, "big")
+                    for value in _split(self.columns[name].tobytes(), 32)
+                ]
+            )
+        for name in ASSET_DATA_COLUMNS:
+            fields.append(
+                [self.asset_data[id_] for id_ in self.columns[name].tolist()]
+            )
+        for values in zip(*fields):
+            yield CompactOrder(*values)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get a column by name, an order by position, or a selection."""
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, (int, np.integer)):
+            position = range(len(self))[key]
+            return next(iter(self[[position]]))
+        return OrderBatch(
+            {name: column[key] for name, column in self.columns.items()},
+            self.asset_data,
+        )
+
+    def to_orders(self) -> List["Order"]:
+        """Convert the batch into a list of `Order`:code: dicts."""
+        return [compact_order.to_order() for compact_order in self]
+
+    def as_float(self, column_name: str) -> np.ndarray:
+        """Get an amount column as an array of (possibly rounded) floats."""
+        if column_name not in AMOUNT_COLUMNS:
+            raise ValueError(f"{column_name} is not an amount column.")
+        return _uint256_column_to_float(self.columns[column_name])
+
+    def prices(self) -> np.ndarray:
+        """Get the price of each order, in taker asset per maker asset.
+
+        Prices are ratios of the orders' raw asset amounts, without regard to
+        the assets' decimals, computed in floating point.  Orders offering no
+        maker asset get a price of NaN.
+        """
+        maker_asset_amounts = self.as_float("maker_asset_amount")
+        taker_asset_amounts = self.as_float("taker_asset_amount")
+        prices = np.full(len(self), np.nan)
+        np.divide(
+            taker_asset_amounts,
+            maker_asset_amounts,
+            out=prices,
+            where=maker_asset_amounts != 0,
+        )
+        return prices
+
+    def unexpired(self, timestamp: Optional[int] = None) -> "OrderBatch":
+        """Select the orders that have not expired as of the given time.
+
+        An order expires once the block timestamp reaches its expiration time,
+        so only orders expiring strictly after `timestamp`:code: are selected.
+
+        :param timestamp: A Unix time, in seconds.  Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = int(time())
+        return self[
+            self.columns["expiration_time_seconds"]
+            > np.bytes_(_uint256_to_bytes(timestamp))
+        ]
+
+    def made_by(self, *maker_addresses: str) -> "OrderBatch":
+        """Select the orders made by any of the given addresses."""
+        return self[
+            np.isin(
+                self.columns["maker_address"],
+                np.array(
+                    [
+                        _address_to_bytes(address)
+                        for address in maker_addresses
+                    ],
+                    dtype="S20",
+                ),
+            )
+        ]
+
+    def with_fees_at_most(
+        self, maker_fee: Optional[int] = None, taker_fee: Optional[int] = None
+    ) -> "OrderBatch":
+        """Select the orders whose fees are no more than those given.
+
+        :param maker_fee: The greatest maker fee allowed, or `None`:code: to
+            allow any.
+        :param taker_fee: The greatest taker fee allowed, or `None`:code: to
+            allow any.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column_name, limit in (
+            ("maker_fee", maker_fee),
+            ("taker_fee", taker_fee),
+        ):
+            if limit is not None:
+                mask &= self.columns[column_name] <= np.bytes_(
+                    _uint256_to_bytes(limit)
+                )
+        return self[mask]
+
+    def asset_data_id(self, asset_data: Union[str, bytes]) -> Optional[int]:
+        """Get the ID of the given asset data, if it occurs in the batch."""
+        try:
+            return self.asset_data.index(_ensure_bytes(asset_data))
+        except ValueError:
+            return None
+
+    def __repr__(self) -> str:
+        """Summarize the batch."""
+        return (
+            f"<OrderBatch of {len(self)} orders and"
+            + f" {len(self.asset_data)} asset data values>"
+        )
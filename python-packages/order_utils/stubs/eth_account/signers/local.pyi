@@ -0,0 +1,2 @@
+class LocalAccount:
+    key: bytes
@@ -0,0 +1,23 @@
+from typing import Tuple
+
+
+class PublicKey:
+    def to_canonical_address(self) -> bytes: ...
+
+
+class Signature:
+    v: int
+    r: int
+    s: int
+
+    def __init__(self, vrs: Tuple[int, int, int]) -> None: ...
+
+    def recover_public_key_from_msg_hash(
+        self, message_hash: bytes
+    ) -> PublicKey: ...
+
+
+class PrivateKey:
+    def __init__(self, private_key_bytes: bytes) -> None: ...
+
+    def sign_msg_hash(self, message_hash: bytes) -> Signature: ...
@@ -0,0 +1 @@
+class BadSignature(Exception): ...
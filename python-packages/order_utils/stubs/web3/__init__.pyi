@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from web3.contract import Contract
 from web3.providers.base import BaseProvider
@@ -6,7 +6,9 @@ from web3.providers.base import BaseProvider
 
 class Web3:
     class HTTPProvider(BaseProvider):
-        ...
+        endpoint_uri: str
+
+        def get_request_kwargs(self) -> Dict[str, Any]: ...
 
     def __init__(self, provider: BaseProvider) -> None: ...
 
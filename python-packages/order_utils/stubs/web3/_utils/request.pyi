@@ -0,0 +1,4 @@
+from typing import Any
+
+
+def make_post_request(endpoint_uri: str, data: bytes, **kwargs: Any) -> bytes: ...
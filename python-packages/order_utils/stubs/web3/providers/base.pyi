@@ -1,2 +1,5 @@
+from typing import Any, Dict
+
+
 class BaseProvider:
-    ...
+    def make_request(self, method: str, params: Any) -> Dict[str, Any]: ...
@@ -1,8 +1,11 @@
 """Tests of 0x.abi_utils."""
 
+from eth_abi import encode_abi
 import pytest
 
 from zero_ex.dev_utils.abi_utils import (
+    compile_signature,
+    COMPILED_SIGNATURES,
     elementary_name,
     event_id,
     method_id,
@@ -51,3 +54,38 @@ def test_simple_encode_type_error():
     """Test that passing in wrong types raises TypeError."""
     with pytest.raises(TypeError):
         simple_encode(123)
+
+
+def test_compile_signature_matches_eth_abi():
+    """Test that compiled signatures encode like eth-abi plus a selector."""
+    erc1155 = compile_signature(
+        "ERC1155Assets(address,uint256[],uint256[],bytes)"
+    )
+    args = ("0x1dc4c1cefef38a777b15aa20260a54e584b16c48", [1], [2], b"\x03")
+
+    assert erc1155.selector == bytes.fromhex("a7cb5fb7")
+    assert erc1155(*args) == erc1155.selector + encode_abi(
+        ["address", "uint256[]", "uint256[]", "bytes"], args
+    )
+
+
+def test_compile_signature_bad_input():
+    """Test that passing a non-signature raises as `parse_signature` does."""
+    with pytest.raises(TypeError):
+        compile_signature(123)
+    with pytest.raises(ValueError):
+        compile_signature("not a signature")
+
+
+def test_simple_encode_memoizes_signatures():
+    """Test that `simple_encode` compiles each signature only once."""
+    COMPILED_SIGNATURES.cache_clear()
+
+    for token_id in range(3):
+        simple_encode(
+            "ERC721Token(address,uint256)",
+            "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+            token_id,
+        )
+
+    assert (COMPILED_SIGNATURES.misses, COMPILED_SIGNATURES.hits) == (1, 2)
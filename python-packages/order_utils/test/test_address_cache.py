@@ -0,0 +1,52 @@
+"""Tests of zero_ex.dev_utils.address_cache."""
+
+from eth_utils import to_checksum_address
+import pytest
+
+from zero_ex.dev_utils import address_cache
+from zero_ex.dev_utils.address_cache import (
+    is_valid_address,
+    normalize_address,
+)
+from zero_ex.dev_utils.memoize import BoundedMemo
+from zero_ex.dev_utils.type_assertions import assert_is_address
+
+
+ADDRESS = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(monkeypatch):
+    """Install a small, empty address cache."""
+    cache = BoundedMemo(
+        address_cache._normalize_address,  # pylint: disable=protected-access
+        maxsize=2,
+    )
+    monkeypatch.setattr(address_cache, "ADDRESS_CACHE", cache)
+    return cache
+
+
+def test_normalize_address(cache):
+    """Test that strings are memoized, and other values converted as is."""
+    assert normalize_address(ADDRESS) == to_checksum_address(ADDRESS)
+    assert normalize_address(ADDRESS) == to_checksum_address(ADDRESS)
+    assert normalize_address(ADDRESS[:-1]) is None
+    assert normalize_address(
+        bytes.fromhex(ADDRESS[2:])
+    ) == to_checksum_address(ADDRESS)
+    assert (cache.hits, cache.misses, cache.currsize) == (1, 2, 2)
+
+
+def test_assert_is_address_shares_the_cache(cache):
+    """Test that address assertions are answered from the cache."""
+    assert is_valid_address(ADDRESS)
+    assert_is_address(ADDRESS, "address")
+    assert_is_address(ADDRESS.upper().replace("0X", "0x"), "address")
+    with pytest.raises(ValueError):
+        assert_is_address(ADDRESS[:-1], "address")
+    with pytest.raises(ValueError):
+        assert_is_address(ADDRESS[:-1], "address")
+    with pytest.raises(TypeError):
+        assert_is_address(123, "address")
+
+    assert (cache.hits, cache.misses) == (2, 3)
@@ -2,16 +2,40 @@
 
 import pytest
 
+from zero_ex.dev_utils.memoize import BoundedMemo
+from zero_ex.order_utils import asset_data_utils
 from zero_ex.order_utils.asset_data_utils import (
+    ASSET_DATA_POOL,
+    decode_asset_data,
     decode_erc20_asset_data,
     decode_erc721_asset_data,
+    encode_erc20,
     encode_erc20_asset_data,
+    encode_erc20_bridge,
+    encode_erc721,
     encode_erc721_asset_data,
+    encode_erc1155,
+    encode_multi_asset,
+    encode_static_call,
+    intern_asset_data,
     ERC20_ASSET_DATA_BYTE_LENGTH,
+    ERC20AssetData,
+    ERC20BridgeAssetData,
+    ERC721_ASSET_DATA_BYTE_LENGTH,
     ERC721_ASSET_DATA_MINIMUM_BYTE_LENGTH,
+    ERC721AssetData,
+    ERC1155AssetData,
+    MultiAssetData,
+    SELECTOR_BYTE_LENGTH,
+    SELECTOR_LENGTH,
+    StaticCallAssetData,
 )
 
 
+TOKEN_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+BRIDGE_ADDRESS = "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb"
+
+
 def test_encode_erc20_asset_data_type_error():
     """Test that passing in a non-string raises a TypeError."""
     with pytest.raises(TypeError):
@@ -70,3 +94,173 @@ def test_decode_erc721_asset_data_invalid_proxy_id():
         decode_erc721_asset_data(
             "0xffffffff" + " " * (ERC721_ASSET_DATA_MINIMUM_BYTE_LENGTH - 1)
         )
+
+
+def test_asset_data_lengths():
+    """Test that the hex string lengths keep their values beside the bytes."""
+    asset_data = encode_erc721(TOKEN_ADDRESS, 1)
+    assert SELECTOR_LENGTH == len("0x" + asset_data[:4].hex()) == 10
+    assert ERC721_ASSET_DATA_MINIMUM_BYTE_LENGTH == 53
+    assert SELECTOR_BYTE_LENGTH == 4
+    assert ERC721_ASSET_DATA_BYTE_LENGTH == len(asset_data) == 68
+
+
+def test_decode_asset_data_nonzero_address_padding():
+    """Test that an address word with nonzero padding raises a ValueError."""
+    erc20_asset_data = bytearray(encode_erc20(TOKEN_ADDRESS))
+    erc20_asset_data[4] = 1
+    erc721_asset_data = bytearray(encode_erc721(TOKEN_ADDRESS, 1))
+    erc721_asset_data[15] = 1
+
+    with pytest.raises(ValueError):
+        decode_erc20_asset_data(erc20_asset_data)
+    with pytest.raises(ValueError):
+        decode_erc721_asset_data("0x" + erc721_asset_data.hex())
+    with pytest.raises(ValueError):
+        decode_asset_data(bytes(erc721_asset_data))
+    with pytest.raises(ValueError):
+        decode_asset_data(encode_multi_asset([1], [bytes(erc20_asset_data)]))
+
+
+def test_decode_asset_data_each_type():
+    """Test that every kind of asset data decodes as it was encoded."""
+    assert decode_asset_data(encode_erc20(TOKEN_ADDRESS)) == ERC20AssetData(
+        asset_proxy_id="0xf47261b0", token_address=TOKEN_ADDRESS
+    )
+    assert decode_asset_data(
+        encode_erc721(TOKEN_ADDRESS, 2 ** 255)
+    ) == ERC721AssetData(
+        asset_proxy_id="0x02571792",
+        token_address=TOKEN_ADDRESS,
+        token_id=2 ** 255,
+    )
+    assert decode_asset_data(
+        encode_erc1155(TOKEN_ADDRESS, [1, 2], [10, 20], b"\x01")
+    ) == ERC1155AssetData(
+        asset_proxy_id="0xa7cb5fb7",
+        token_address=TOKEN_ADDRESS,
+        token_ids=(1, 2),
+        token_values=(10, 20),
+        callback_data=b"\x01",
+    )
+    assert decode_asset_data(
+        encode_static_call(TOKEN_ADDRESS, b"\x12\x34", bytes(range(32)))
+    ) == StaticCallAssetData(
+        asset_proxy_id="0xc339d10a",
+        callee_address=TOKEN_ADDRESS,
+        static_call_data=b"\x12\x34",
+        expected_return_data_hash=bytes(range(32)),
+    )
+    assert decode_asset_data(
+        encode_erc20_bridge(TOKEN_ADDRESS, BRIDGE_ADDRESS, b"\xff" * 40)
+    ) == ERC20BridgeAssetData(
+        asset_proxy_id="0xdc1600f3",
+        token_address=TOKEN_ADDRESS,
+        bridge_address=BRIDGE_ADDRESS,
+        bridge_data=b"\xff" * 40,
+    )
+
+
+def test_decode_asset_data_nested_multi_asset():
+    """Test that multi-asset data is decoded recursively."""
+    inner = encode_multi_asset([3], [encode_erc721(TOKEN_ADDRESS, 7)])
+
+    decoded = decode_asset_data(
+        encode_multi_asset([1, 2], [encode_erc20(TOKEN_ADDRESS), inner])
+    )
+
+    assert decoded == MultiAssetData(
+        asset_proxy_id="0x94cfcdd7",
+        amounts=(1, 2),
+        nested_asset_data=(
+            decode_asset_data(encode_erc20(TOKEN_ADDRESS)),
+            MultiAssetData(
+                asset_proxy_id="0x94cfcdd7",
+                amounts=(3,),
+                nested_asset_data=(
+                    decode_asset_data(encode_erc721(TOKEN_ADDRESS, 7)),
+                ),
+            ),
+        ),
+    )
+
+
+def test_decode_asset_data_input_types():
+    """Test that bytes, views of bytes and hex strings decode alike."""
+    asset_data = encode_erc721(TOKEN_ADDRESS, 1)
+    buffer = bytearray(b"prefix" + asset_data)
+
+    expected = decode_erc721_asset_data("0x" + asset_data.hex())
+
+    assert decode_asset_data(memoryview(buffer)[6:]) == expected
+    assert decode_asset_data(bytearray(asset_data)) == expected
+    assert decode_asset_data("0x" + asset_data.hex()) == expected
+    assert decode_asset_data(asset_data.hex()) == expected
+
+
+def test_decode_asset_data_malformed():
+    """Test that unknown or truncated asset data raises a ValueError."""
+    for asset_data in (
+        b"",
+        bytes.fromhex("ffffffff") + bytes(32),
+        encode_erc20(TOKEN_ADDRESS)[:-1],
+        encode_erc721(TOKEN_ADDRESS, 1)[:-1],
+        encode_erc1155(TOKEN_ADDRESS, [1], [1])[:100],
+        encode_multi_asset([1, 2], [encode_erc20(TOKEN_ADDRESS)] * 2)[:100],
+    ):
+        with pytest.raises(ValueError):
+            decode_asset_data(asset_data)
+
+
+def test_intern_asset_data(monkeypatch):
+    """Test that identical asset data decodes to one shared object."""
+    pool = BoundedMemo(decode_asset_data, maxsize=2)
+    monkeypatch.setattr(asset_data_utils, "ASSET_DATA_POOL", pool)
+    erc20 = encode_erc20(TOKEN_ADDRESS)
+    erc721 = encode_erc721(TOKEN_ADDRESS, 1)
+    bridge = encode_erc20_bridge(TOKEN_ADDRESS, BRIDGE_ADDRESS, b"")
+
+    decoded = intern_asset_data(erc20)
+
+    assert decoded == decode_asset_data(erc20)
+    assert intern_asset_data(bytearray(erc20)) is decoded
+    assert intern_asset_data(memoryview(erc20)) is decoded
+    assert intern_asset_data("0x" + erc20.hex()) is decoded
+    assert (pool.hits, pool.misses) == (3, 1)
+
+    intern_asset_data(erc721)
+    intern_asset_data(bridge)
+    assert pool.currsize == 2
+    assert intern_asset_data(erc20) is not decoded
+    assert pool.misses == 4
+
+
+def test_intern_asset_data_errors():
+    """Test that malformed asset data raises, and isn't retained."""
+    currsize = ASSET_DATA_POOL.currsize
+    with pytest.raises(ValueError):
+        intern_asset_data(b"\xff" * 36)
+    assert ASSET_DATA_POOL.currsize == currsize
+
+
+def test_decode_erc20_and_erc721_asset_data_bytes():
+    """Test that the type-specific decoders accept bytes and views too."""
+    erc20 = encode_erc20(TOKEN_ADDRESS)
+    erc721 = encode_erc721(TOKEN_ADDRESS, 2 ** 255)
+
+    assert (
+        decode_erc20_asset_data(erc20)
+        == decode_erc20_asset_data(memoryview(bytearray(erc20)))
+        == decode_erc20_asset_data("0x" + erc20.hex())
+        == decode_asset_data(erc20)
+    )
+    assert (
+        decode_erc721_asset_data(erc721)
+        == decode_erc721_asset_data(memoryview(erc721))
+        == decode_erc721_asset_data("0x" + erc721.hex())
+        == decode_asset_data(erc721)
+    )
+    with pytest.raises(ValueError):
+        decode_erc20_asset_data(erc721)
+    with pytest.raises(ValueError):
+        decode_erc721_asset_data(erc20)
@@ -0,0 +1,310 @@
+"""Tests of zero_ex.order_utils.bulk."""
+
+from concurrent.futures import Executor, Future
+import json
+import random
+
+from eth_abi import decode_abi
+from eth_keys.datatypes import PrivateKey
+from eth_utils import keccak, to_checksum_address
+import pytest
+import web3._utils.request
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from zero_ex.order_utils import (
+    is_valid_signature,
+    is_valid_signature_batch,
+    OrderHasher,
+)
+import zero_ex.order_utils.bulk
+from zero_ex.order_utils.bulk import (
+    generate_order_hashes,
+    generate_order_hashes_hex,
+)
+
+
+EXCHANGE_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+
+
+def _random_address(rng: random.Random) -> str:
+    return "0x" + bytes(rng.getrandbits(8) for _ in range(20)).hex()
+
+
+ORDER = {
+    "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "takerAddress": "0x0000000000000000000000000000000000000000",
+    "senderAddress": "0x0000000000000000000000000000000000000000",
+    "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+    "makerAssetData": bytes.fromhex("f47261b0" + "00" * 32),
+    "takerAssetData": "0xf47261b0" + "00" * 32,
+    "makerFeeAssetData": b"",
+    "takerFeeAssetData": "0x",
+    "salt": 0,
+    "makerFee": 0,
+    "takerFee": 0,
+    "makerAssetAmount": 0,
+    "takerAssetAmount": "0",
+    "expirationTimeSeconds": 0,
+}
+
+
+def _random_order(rng: random.Random) -> dict:
+    return dict(
+        ORDER,
+        makerAddress=_random_address(rng),
+        feeRecipientAddress=_random_address(rng),
+        makerAssetData=bytes.fromhex("f47261b0000000000000000000000000")
+        + bytes(rng.choice([1, 2, 3]) for _ in range(20)),
+        salt=rng.getrandbits(256),
+        takerFee=rng.getrandbits(64),
+        makerAssetAmount=rng.getrandbits(128),
+        takerAssetAmount=str(rng.getrandbits(128)),
+        expirationTimeSeconds=rng.getrandbits(32),
+    )
+
+
+def test_generate_order_hashes__matches_order_hasher():
+    """Test that parallel hashes match serial ones, in input order."""
+    rng = random.Random(0)
+    orders = [_random_order(rng) for _ in range(50)]
+
+    expected = list(
+        OrderHasher(EXCHANGE_ADDRESS, 1337, validate=False).order_hashes(
+            orders
+        )
+    )
+
+    assert (
+        generate_order_hashes(
+            iter(orders), EXCHANGE_ADDRESS, 1337, max_workers=2, chunk_size=7
+        )
+        == expected
+    )
+    assert generate_order_hashes_hex(
+        orders, EXCHANGE_ADDRESS, 1337, max_workers=2
+    ) == [order_hash.hex() for order_hash in expected]
+
+
+def test_generate_order_hashes__single_chunk_in_process(monkeypatch):
+    """Test that orders fitting into one chunk don't start a pool."""
+    rng = random.Random(2)
+    orders = [_random_order(rng) for _ in range(3)]
+    monkeypatch.setattr(
+        zero_ex.order_utils.bulk, "ProcessPoolExecutor", pytest.fail
+    )
+
+    assert generate_order_hashes(orders, EXCHANGE_ADDRESS, 1337) == list(
+        OrderHasher(EXCHANGE_ADDRESS, 1337, validate=False).order_hashes(
+            orders
+        )
+    )
+
+
+def test_generate_order_hashes__streams_orders():
+    """Test that a streamed input is read only a few chunks ahead."""
+    rng = random.Random(3)
+    orders = [_random_order(rng) for _ in range(40)]
+    orders_read = 0
+    orders_read_per_result = []
+
+    def _stream_orders():
+        nonlocal orders_read
+        for order in orders:
+            orders_read += 1
+            yield order
+
+    class _RecordingFuture(Future):
+        def result(self, timeout=None):
+            orders_read_per_result.append(orders_read)
+            return super().result(timeout)
+
+    class _InlineExecutor(Executor):
+        # pylint: disable=arguments-differ
+        def submit(self, fn, *args, **kwargs):
+            future = _RecordingFuture()
+            future.set_result(fn(*args, **kwargs))
+            return future
+
+    order_hashes = generate_order_hashes(
+        _stream_orders(),
+        EXCHANGE_ADDRESS,
+        1337,
+        max_workers=2,
+        chunk_size=2,
+        executor=_InlineExecutor(),
+    )
+
+    assert order_hashes == list(
+        OrderHasher(EXCHANGE_ADDRESS, 1337, validate=False).order_hashes(
+            orders
+        )
+    )
+    # two chunks in flight per worker, and the one that's being submitted:
+    assert orders_read_per_result[:3] == [10, 12, 14]
+
+
+def test_generate_order_hashes__empty():
+    """Test that hashing no orders yields no hashes."""
+    assert not generate_order_hashes([], EXCHANGE_ADDRESS, 1337)
+
+
+def test_generate_order_hashes__bad_address():
+    """Test that an unpackable order raises a ValueError."""
+    order = _random_order(random.Random(1))
+    order["makerAddress"] = "0xff"
+
+    with pytest.raises(ValueError):
+        generate_order_hashes([order], EXCHANGE_ADDRESS, 1337, max_workers=1)
+
+
+# nothing listens here, so any attempt to use it will raise:
+UNREACHABLE_PROVIDER = Web3.HTTPProvider("http://127.0.0.1:1")
+
+PRIVATE_KEY = PrivateKey(
+    bytes.fromhex(
+        "f2f48ee19680706196e2e339e5da3491186e0c4c5030670656b0e0164837257d"
+    )
+)
+
+SIGNER_ADDRESS = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+
+
+def _sign(data: bytes, signature_type: int) -> str:
+    if signature_type == 3:
+        message_hash = keccak(b"\x19Ethereum Signed Message:\n32" + data)
+    else:
+        message_hash = data
+    signature = PRIVATE_KEY.sign_msg_hash(message_hash)
+    return (
+        "0x"
+        + (
+            bytes([signature.v + 27])
+            + signature.r.to_bytes(32, "big")
+            + signature.s.to_bytes(32, "big")
+            + bytes([signature_type])
+        ).hex()
+    )
+
+
+def test_is_valid_signature_batch__in_processes():
+    """Test that parallel results match serial ones, in input order."""
+    rng = random.Random(6)
+    triples = []
+    for _ in range(10):
+        data = bytes(rng.getrandbits(8) for _ in range(32))
+        triples.append(
+            (
+                "0x" + data.hex(),
+                _sign(data, rng.choice([2, 3])),
+                rng.choice([SIGNER_ADDRESS, _random_address(rng)]),
+            )
+        )
+
+    assert is_valid_signature_batch(
+        UNREACHABLE_PROVIDER, triples, max_workers=2, chunk_size=3
+    ) == [is_valid_signature(UNREACHABLE_PROVIDER, *args) for args in triples]
+
+
+class _Node(BaseProvider):  # pylint: disable=abstract-method
+    """A node whose Exchange deems signatures with an even first byte valid."""
+
+    def __init__(self):
+        """Start with no calls made."""
+        self.calls = []
+
+    def make_request(self, method, params):
+        """Answer an `eth_call` to `isValidHashSignature`."""
+        assert method == "eth_call"
+        assert params[0]["to"] == to_checksum_address(EXCHANGE_ADDRESS)
+        calldata = bytes.fromhex(params[0]["data"][2:])
+        assert (
+            calldata[:4]
+            == keccak(b"isValidHashSignature(bytes32,address,bytes)")[:4]
+        )
+        data, signer_address, signature = decode_abi(
+            ["bytes32", "address", "bytes"], calldata[4:]
+        )
+        self.calls.append((data, signer_address, signature))
+        return {
+            "jsonrpc": "2.0",
+            "result": "0x" + (signature[0] % 2 == 0).to_bytes(32, "big").hex(),
+        }
+
+    def post_batch(self, _endpoint_uri, request_data, **_kwargs):
+        """Answer a JSON-RPC batch, out of order, as nodes may."""
+        return json.dumps(
+            [
+                dict(
+                    self.make_request(request["method"], request["params"]),
+                    id=request["id"],
+                )
+                for request in reversed(json.loads(request_data))
+            ]
+        ).encode()
+
+
+ON_CHAIN_TRIPLES = [
+    ("0x" + "ab" * 32, "0x0004", SIGNER_ADDRESS),
+    ("0x" + "ab" * 32, _sign(bytes([0xAB] * 32), 2), SIGNER_ADDRESS),
+    ("0x" + "ab" * 32, "0x0104", SIGNER_ADDRESS),
+    ("0x" + "ab" * 32, "0x0004", SIGNER_ADDRESS),
+]
+
+
+def test_is_valid_signature_batch__on_chain_types(monkeypatch):
+    """Test that on-chain signature types are de-duplicated and batched."""
+    node = _Node()
+    posts = []
+
+    def _make_post_request(endpoint_uri, request_data, **kwargs):
+        posts.append(len(json.loads(request_data)))
+        return node.post_batch(endpoint_uri, request_data, **kwargs)
+
+    monkeypatch.setattr(
+        zero_ex.order_utils.bulk,
+        "_exchange_deployment",
+        lambda provider: (1337, EXCHANGE_ADDRESS),
+    )
+    monkeypatch.setattr(
+        web3._utils.request,  # pylint: disable=protected-access
+        "make_post_request",
+        _make_post_request,
+    )
+    monkeypatch.setattr(zero_ex.order_utils.bulk, "MAX_CALLS_PER_BATCH", 2)
+
+    assert is_valid_signature_batch(
+        UNREACHABLE_PROVIDER, ON_CHAIN_TRIPLES + [ON_CHAIN_TRIPLES[2]] * 2
+    ) == [True, True, False, True, False, False]
+    assert posts == [2]
+    assert len(node.calls) == 2
+
+    # a third distinct signature takes a second batch:
+    assert is_valid_signature_batch(
+        UNREACHABLE_PROVIDER,
+        ON_CHAIN_TRIPLES + [("0x" + "cd" * 32, "0x0004", SIGNER_ADDRESS)],
+    ) == [True, True, False, True, True]
+    assert posts == [2, 2, 1]
+
+
+def test_is_valid_signature_batch__on_chain_types_without_http(monkeypatch):
+    """Test that providers other than HTTP get one request per call."""
+    node = _Node()
+    monkeypatch.setattr(
+        zero_ex.order_utils.bulk,
+        "_exchange_deployment",
+        lambda provider: (1337, EXCHANGE_ADDRESS),
+    )
+
+    assert is_valid_signature_batch(node, ON_CHAIN_TRIPLES) == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert len(node.calls) == 2
+
+
+def test_is_valid_signature_batch__empty():
+    """Test that no signatures need no provider."""
+    assert not is_valid_signature_batch(UNREACHABLE_PROVIDER, [])
@@ -0,0 +1,141 @@
+"""Test zero_ex.order_utils.compact_order."""
+
+import pickle
+
+import pytest
+
+from zero_ex.contract_wrappers.order_conversions import (
+    jsdict_to_order,
+    order_to_jsdict,
+)
+from zero_ex.order_utils import generate_order_hash_hex, OrderHasher
+from zero_ex.order_utils.bulk import generate_order_hashes
+from zero_ex.order_utils.compact_order import CompactOrder
+
+
+EXCHANGE_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+
+
+ORDER = {
+    "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "takerAddress": "0x0000000000000000000000000000000000000000",
+    "senderAddress": "0x0000000000000000000000000000000000000000",
+    "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+    "makerAssetData": bytes.fromhex(
+        "f47261b0000000000000000000000000"
+        + "871dd7c2b4b25e1aa18728e9d5f2af4c4e431f5c"
+    ),
+    "takerAssetData": bytes.fromhex(
+        "f47261b0000000000000000000000000"
+        + "0b1ba0af832d7c05fd64161e0db78e85978e8082"
+    ),
+    "makerFeeAssetData": b"",
+    "takerFeeAssetData": bytes.fromhex(
+        "f47261b0000000000000000000000000"
+        + "0b1ba0af832d7c05fd64161e0db78e85978e8082"
+    ),
+    "salt": 0,
+    "makerFee": 0,
+    "takerFee": 10 ** 16,
+    "makerAssetAmount": 10 ** 18,
+    "takerAssetAmount": 5 * 10 ** 17,
+    "expirationTimeSeconds": 1577836800,
+}
+
+
+def test_compact_order__order_round_trip():
+    """Test that converting to and from an `Order` is lossless."""
+    order = dict(ORDER, salt=1)
+
+    compact_order = CompactOrder.from_order(order)
+
+    assert compact_order.to_order() == order
+    assert CompactOrder.from_order(compact_order) is compact_order
+    assert pickle.loads(pickle.dumps(compact_order)) == compact_order
+
+
+def test_compact_order__jsdict_round_trip():
+    """Test that jsdicts match those made by `order_to_jsdict`."""
+    order = dict(ORDER, salt=2)
+    compact_order = CompactOrder.from_order(order)
+
+    jsdict = compact_order.to_jsdict(1337, EXCHANGE_ADDRESS, signature="0x01")
+
+    assert jsdict == order_to_jsdict(
+        order, 1337, EXCHANGE_ADDRESS, signature="0x01"
+    )
+    assert order_to_jsdict(compact_order, 1337, EXCHANGE_ADDRESS) == (
+        order_to_jsdict(order, 1337, EXCHANGE_ADDRESS)
+    )
+    assert CompactOrder.from_jsdict(jsdict) == compact_order
+    assert CompactOrder.from_order(jsdict_to_order(jsdict)) == compact_order
+
+
+def test_compact_order__hashes_match():
+    """Test that a compact order hashes the same as its `Order`."""
+    orders = [dict(ORDER, salt=salt) for salt in range(4)]
+    compact_orders = [CompactOrder.from_order(order) for order in orders]
+    expected = [
+        generate_order_hash_hex(order, EXCHANGE_ADDRESS, 1337)
+        for order in orders
+    ]
+
+    assert [
+        OrderHasher(EXCHANGE_ADDRESS, 1337).order_hash_hex(compact_order)
+        for compact_order in compact_orders
+    ] == expected
+    assert [
+        generate_order_hash_hex(compact_order, EXCHANGE_ADDRESS, 1337)
+        for compact_order in compact_orders
+    ] == expected
+    assert [
+        order_hash.hex()
+        for order_hash in generate_order_hashes(
+            compact_orders, EXCHANGE_ADDRESS, 1337, max_workers=2
+        )
+    ] == expected
+
+
+def test_compact_order__rejects_unpackable_fields():
+    """Test that bad addresses and out-of-range amounts raise ValueError."""
+    order = dict(ORDER, makerAddress="0xff")
+    with pytest.raises(ValueError):
+        CompactOrder.from_order(order)
+
+    order = dict(ORDER, takerAssetAmount=2 ** 256)
+    with pytest.raises(ValueError):
+        CompactOrder.from_order(order)
+
+    order = dict(ORDER, salt=-1)
+    with pytest.raises(ValueError):
+        CompactOrder.from_order(order)
+
+
+def test_compact_order__bytes_like_fields():
+    """Test that buffers pack like bytes, and that bytes aren't copied."""
+    order = dict(ORDER, salt=1)
+    book = bytearray(order["makerAssetData"] + order["takerAssetData"])
+    view = memoryview(book)
+    split = len(order["makerAssetData"])
+    buffered_order = dict(
+        order,
+        makerAssetData=view[:split],
+        takerAssetData=bytearray(view[split:]),
+    )
+
+    compact_order = CompactOrder.from_order(buffered_order)
+
+    assert compact_order == CompactOrder.from_order(order)
+    assert (
+        CompactOrder.from_order(
+            dict(order, makerAddress=memoryview(compact_order.maker_address))
+        )
+        == compact_order
+    )
+    assert compact_order.taker_fee_asset_data is order["takerFeeAssetData"]
+    assert generate_order_hash_hex(
+        buffered_order, EXCHANGE_ADDRESS, 1337
+    ) == generate_order_hash_hex(order, EXCHANGE_ADDRESS, 1337)
+    assert order_to_jsdict(buffered_order, 1337) == order_to_jsdict(
+        order, 1337
+    )
@@ -0,0 +1,134 @@
+"""Test zero_ex.order_utils.eip712."""
+
+from eth_utils import keccak
+import pytest
+
+from zero_ex.order_utils import generate_order_hash_hex
+from zero_ex.order_utils.compact_order import CompactOrder
+from zero_ex.order_utils.eip712 import (
+    EIP712Struct,
+    exchange_domain_separator,
+    ORDER,
+    ZERO_EX_TRANSACTION,
+)
+
+
+EXCHANGE_ADDRESS = "0x48bacb9266a570d521063ef5dd96e61686dbe788"
+
+TRANSACTION = {
+    "salt": 1,
+    "expirationTimeSeconds": 1577836800,
+    "gasPrice": 10 ** 9,
+    "signerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "data": bytes.fromhex("b4be83d5"),
+}
+
+# computed independently, with eth_account's EIP-712 implementation:
+TRANSACTION_HASH_HEX = (
+    "bd6526701b84a2e8fbe9a473a63be918128e02c19b81063dfe57964cd5e76777"
+)
+
+
+def test_eip712__zero_ex_transaction_hash():
+    """Test hashing a 0x transaction, in each of the accepted forms."""
+    domain_separator = exchange_domain_separator(1337, EXCHANGE_ADDRESS)
+
+    assert ZERO_EX_TRANSACTION.type_string == (
+        "ZeroExTransaction(uint256 salt,uint256 expirationTimeSeconds,"
+        + "uint256 gasPrice,address signerAddress,bytes data)"
+    )
+    assert (
+        ZERO_EX_TRANSACTION.hash(TRANSACTION, domain_separator).hex()
+        == TRANSACTION_HASH_HEX
+    )
+    assert (
+        ZERO_EX_TRANSACTION.hash(
+            (
+                "1",
+                "1577836800",
+                str(10 ** 9),
+                bytes.fromhex("5409ed021d9299bf6814279a6a1411a7e866a631"),
+                "0xb4be83d5",
+            ),
+            domain_separator,
+        ).hex()
+        == TRANSACTION_HASH_HEX
+    )
+
+
+def test_eip712__order_hash():
+    """Test that the compiled `Order` type agrees with order hashing."""
+    order = {
+        "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        "takerAddress": "0x0000000000000000000000000000000000000000",
+        "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+        "senderAddress": "0x0000000000000000000000000000000000000000",
+        "makerAssetAmount": 10 ** 18,
+        "takerAssetAmount": 5 * 10 ** 17,
+        "makerFee": 0,
+        "takerFee": 0,
+        "expirationTimeSeconds": 1577836800,
+        "salt": 1,
+        "makerAssetData": bytes(36),
+        "takerAssetData": bytes(36),
+        "makerFeeAssetData": b"",
+        "takerFeeAssetData": b"",
+    }
+    domain_separator = exchange_domain_separator(1337, EXCHANGE_ADDRESS)
+    expected = generate_order_hash_hex(order, EXCHANGE_ADDRESS, 1337)
+
+    assert ORDER.hash(order, domain_separator).hex() == expected
+    assert (
+        ORDER.hash(CompactOrder.from_order(order), domain_separator).hex()
+        == expected
+    )
+
+
+def test_eip712__atomic_types():
+    """Test the encoding of each supported kind of field."""
+    struct = EIP712Struct(
+        "Everything",
+        [
+            ("a", "int8"),
+            ("b", "bool"),
+            ("c", "bytes4"),
+            ("d", "string"),
+            ("e", "uint64"),
+        ],
+    )
+
+    assert struct.encode_data([-1, True, "0x01020304", "hi", 7]) == (
+        b"\xff" * 32
+        + (1).to_bytes(32, "big")
+        + bytes.fromhex("01020304").ljust(32, b"\x00")
+        + keccak(text="hi")
+        + (7).to_bytes(32, "big")
+    )
+    assert struct.type_hash == keccak(
+        text="Everything(int8 a,bool b,bytes4 c,string d,uint64 e)"
+    )
+
+
+def test_eip712__unsupported_types():
+    """Test that nested structs, arrays and bad types are rejected."""
+    for field_type in ("Person", "uint256[]", "uint7", "bytes33"):
+        with pytest.raises(ValueError):
+            EIP712Struct("Unsupported", [("field", field_type)])
+
+
+def test_eip712__integers_out_of_range():
+    """Test that integers which don't fit their type raise a ValueError."""
+    struct = EIP712Struct("Integers", [("small", "int8"), ("amount", "uint8")])
+    assert struct.encode_data([-128, 255]) == (
+        b"\xff" * 31 + b"\x80" + (255).to_bytes(32, "big")
+    )
+    for instance, field_name in (
+        ([-129, 0], "small"),
+        ([128, 0], "small"),
+        ([0, -1], "amount"),
+        ([0, 256], "amount"),
+    ):
+        with pytest.raises(ValueError, match=field_name):
+            struct.encode_data(instance)
+    with pytest.raises(ValueError, match="salt"):
+        ZERO_EX_TRANSACTION.encode_data(dict(TRANSACTION, salt=2 ** 256))
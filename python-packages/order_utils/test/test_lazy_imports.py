@@ -0,0 +1,49 @@
+"""Tests that importing zero_ex.order_utils leaves slow imports for later."""
+
+import subprocess  # nosec
+import sys
+
+import pytest
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7),
+    reason="Order is imported eagerly before PEP 562 module __getattr__",
+)
+def test_hashing_orders_imports_nothing_slow():
+    """Test that hashing an order needs no web3, wrappers or addresses."""
+    script = """
+import sys
+from zero_ex.order_utils import OrderHasher
+OrderHasher("0x48bacb9266a570d521063ef5dd96e61686dbe788", 1337).order_hash_hex(
+    {
+        "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        "takerAddress": "0x0000000000000000000000000000000000000000",
+        "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+        "senderAddress": "0x0000000000000000000000000000000000000000",
+        "makerAssetAmount": 1,
+        "takerAssetAmount": 1,
+        "makerFee": 0,
+        "takerFee": 0,
+        "expirationTimeSeconds": 1,
+        "salt": 1,
+        "makerAssetData": b"",
+        "takerAssetData": b"",
+        "makerFeeAssetData": b"",
+        "takerFeeAssetData": b"",
+    }
+)
+print(*sorted(sys.modules))
+"""
+    modules = subprocess.check_output(  # nosec
+        [sys.executable, "-c", script], universal_newlines=True
+    ).split()
+
+    for module in (
+        "web3",
+        "eth_account",
+        "jsonschema",
+        "zero_ex.contract_addresses",
+        "zero_ex.contract_wrappers.exchange",
+    ):
+        assert module not in modules
@@ -0,0 +1,59 @@
+"""Tests of zero_ex.dev_utils.memoize."""
+
+from zero_ex.dev_utils.memoize import BoundedMemo, ExpiringCache
+
+
+def test_bounded_memo__evicts_least_recently_used():
+    """Test that a full cache evicts its least recently used entry."""
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    memo = BoundedMemo(double, maxsize=2)
+    memo(1)
+    memo(2)
+    memo(1)
+    memo(3)  # evicts 2
+    memo(2)
+
+    assert calls == [1, 2, 3, 2]
+    assert (memo.hits, memo.misses) == (1, 4)
+
+
+def test_bounded_memo__resize():
+    """Test that resizing empties the cache and applies the new bound."""
+    memo = BoundedMemo(str, maxsize=1)
+    memo(1)
+    memo.resize(8)
+
+    assert memo.maxsize == 8
+    assert memo.currsize == 0
+
+
+def test_expiring_cache__evicts_least_recently_used():
+    """Test that a full cache evicts its least recently used entry."""
+    cache = ExpiringCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)  # evicts b
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.currsize == 2
+
+
+def test_expiring_cache__per_entry_ttl():
+    """Test that each entry expires according to its own lifetime."""
+    now = [100.0]
+    cache = ExpiringCache(clock=lambda: now[0])
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2, ttl=500)
+    cache.set("never", 3, ttl=0)
+
+    now[0] += 6
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert cache.get("never", "missing") == "missing"
@@ -0,0 +1,192 @@
+"""Test zero_ex.order_utils.order_batch."""
+
+import random
+
+import numpy as np
+import pytest
+
+from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
+from zero_ex.order_utils.compact_order import CompactOrder
+from zero_ex.order_utils.order_batch import OrderBatch
+
+
+MAKERS = [
+    "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+    # trailing zero bytes, which NumPy strips from fixed-width strings:
+    "0xe36ea790bc9d7ab70c55260c66d52b1eca985f00",
+]
+
+ERC20_ASSET_DATA = [
+    bytes.fromhex("f47261b0" + "00" * 12 + token)
+    for token in (
+        "871dd7c2b4b25e1aa18728e9d5f2af4c4e431f5c",
+        "0b1ba0af832d7c05fd64161e0db78e85978e8082",
+    )
+]
+
+
+ORDER = {
+    "makerAddress": MAKERS[0],
+    "takerAddress": "0x0000000000000000000000000000000000000000",
+    "feeRecipientAddress": "0x0000000000000000000000000000000000000000",
+    "senderAddress": "0x0000000000000000000000000000000000000000",
+    "makerAssetAmount": 1,
+    "takerAssetAmount": 1,
+    "makerFee": 0,
+    "takerFee": 0,
+    "expirationTimeSeconds": 1577836800,
+    "salt": 0,
+    "makerAssetData": ERC20_ASSET_DATA[0],
+    "takerAssetData": ERC20_ASSET_DATA[1],
+    "makerFeeAssetData": b"",
+    "takerFeeAssetData": ERC20_ASSET_DATA[0],
+}
+
+
+def _random_order(salt: int) -> dict:
+    rng = random.Random(salt)
+    return dict(
+        ORDER,
+        makerAddress=MAKERS[salt % len(MAKERS)],
+        makerAssetAmount=rng.randrange(1, 2 ** 256),
+        takerAssetAmount=rng.randrange(1, 10 ** 30),
+        takerFee=rng.choice([0, 10 ** 16]),
+        expirationTimeSeconds=1577836800 + salt,
+        salt=salt,
+        makerAssetData=ERC20_ASSET_DATA[salt % 2],
+        takerAssetData=ERC20_ASSET_DATA[1 - salt % 2],
+    )
+
+
+def test_order_batch__round_trip():
+    """Test that orders come out of a batch as they went in."""
+    orders = [_random_order(salt) for salt in range(30)]
+
+    batch = OrderBatch.from_orders(orders)
+
+    assert len(batch) == 30
+    assert len(batch.asset_data) == 3
+    assert batch["maker_address"].dtype == np.dtype("S20")
+    assert batch["maker_asset_amount"].dtype == np.dtype("S32")
+    assert batch.to_orders() == orders
+    assert batch[2] == CompactOrder.from_order(orders[2])
+    assert batch[-1] == CompactOrder.from_order(orders[-1])
+    assert batch[5:8].to_orders() == orders[5:8]
+
+
+def test_order_batch__from_jsdicts():
+    """Test that JSON dicts give the same batch as `Order` dicts."""
+    orders = [_random_order(salt) for salt in range(5)]
+
+    batch = OrderBatch.from_orders(
+        order_to_jsdict(order, chain_id=1337) for order in orders
+    )
+
+    assert batch.to_orders() == orders
+
+
+def test_order_batch__from_sra_response():
+    """Test building a batch from the JSON of an SRA response."""
+    orders = [_random_order(salt) for salt in range(5)]
+    response = {
+        "total": 5,
+        "page": 1,
+        "perPage": 100,
+        "records": [
+            {
+                "order": order_to_jsdict(
+                    order, 1337, signature="0x1b" + "00" * 64 + "02"
+                ),
+                "metaData": {},
+            }
+            for order in orders
+        ],
+    }
+
+    assert OrderBatch.from_sra_response(response).to_orders() == orders
+
+
+def test_order_batch__from_sra_response__sra_client_models():
+    """Test that the version 2 SRA client models are refused."""
+    sra_client = pytest.importorskip("zero_ex.sra_client")
+    jsdict = order_to_jsdict(ORDER, 1337)
+    record = sra_client.RelayerApiOrderSchema(
+        order=sra_client.OrderSchema(
+            **{
+                attribute: jsdict[key]
+                for attribute, key in (
+                    sra_client.OrderSchema.attribute_map.items()
+                )
+            }
+        ),
+        meta_data={},
+    )
+
+    with pytest.raises(TypeError):
+        OrderBatch.from_sra_response(
+            sra_client.RelayerApiOrdersResponseSchema(records=[record])
+        )
+    with pytest.raises(TypeError):
+        OrderBatch.from_sra_response({"records": [record]})
+    with pytest.raises(TypeError):
+        OrderBatch.from_sra_response({"records": [{"order": record.order}]})
+
+
+def test_order_batch__prices():
+    """Test that prices match those computed one order at a time."""
+    orders = [_random_order(salt) for salt in range(200)]
+    orders[7]["makerAssetAmount"] = 0
+
+    prices = OrderBatch.from_orders(orders).prices()
+
+    assert np.isnan(prices[7])
+    expected = [
+        order["takerAssetAmount"] / order["makerAssetAmount"]
+        for order in orders
+        if order["makerAssetAmount"]
+    ]
+    np.testing.assert_allclose(np.delete(prices, 7), expected, rtol=1e-12)
+
+
+def test_order_batch__filters():
+    """Test selecting orders by expiry, maker and fees."""
+    orders = [_random_order(salt) for salt in range(30)]
+    batch = OrderBatch.from_orders(orders)
+
+    assert [
+        order.salt for order in batch.unexpired(timestamp=1577836800 + 26)
+    ] == [27, 28, 29]
+    assert len(batch.unexpired()) == 0
+    assert batch.made_by(MAKERS[2]).to_orders() == orders[2::3]
+    assert batch.made_by(MAKERS[0], MAKERS[2]).to_orders() == [
+        order for order in orders if order["makerAddress"] != MAKERS[1]
+    ]
+    assert batch.with_fees_at_most(taker_fee=0).to_orders() == [
+        order for order in orders if order["takerFee"] == 0
+    ]
+    assert len(batch.with_fees_at_most(maker_fee=0)) == 30
+
+
+def test_order_batch__asset_data_id():
+    """Test looking up the ID of interned asset data."""
+    batch = OrderBatch.from_orders([_random_order(salt) for salt in range(4)])
+
+    maker_asset_data_id = batch.asset_data_id("0x" + ERC20_ASSET_DATA[1].hex())
+
+    assert batch.asset_data[maker_asset_data_id] == ERC20_ASSET_DATA[1]
+    assert [
+        order.salt
+        for order in batch[batch["maker_asset_data"] == maker_asset_data_id]
+    ] == [1, 3]
+    assert batch.asset_data_id(b"\x01") is None
+
+
+def test_order_batch__empty():
+    """Test that an empty batch behaves."""
+    batch = OrderBatch.from_orders([])
+
+    assert len(batch) == 0
+    assert batch.to_orders() == []
+    assert len(batch.prices()) == 0
+    assert len(batch.unexpired(timestamp=0)) == 0
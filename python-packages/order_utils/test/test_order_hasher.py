@@ -0,0 +1,116 @@
+"""Test zero_ex.order_utils.OrderHasher."""
+
+import pytest
+
+from zero_ex import json_schemas
+from zero_ex.dev_utils.memoize import BoundedMemo
+from zero_ex.json_schemas import ValidationMode, ValidationPolicy
+from zero_ex.order_utils import (
+    _keccak_asset_data,
+    generate_order_hash_hex,
+    OrderHasher,
+)
+
+
+EXCHANGE_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+
+
+ORDER = {
+    "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "takerAddress": "0x0000000000000000000000000000000000000000",
+    "senderAddress": "0x0000000000000000000000000000000000000000",
+    "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+    "makerAssetData": bytes.fromhex(
+        "f47261b0000000000000000000000000"
+        + "871dd7c2b4b25e1aa18728e9d5f2af4c4e431f5c"
+    ),
+    "takerAssetData": (
+        "0xf47261b0000000000000000000000000"
+        + "0b1ba0af832d7c05fd64161e0db78e85978e8082"
+    ),
+    "makerFeeAssetData": b"",
+    "takerFeeAssetData": "0x",
+    "salt": 0,
+    "makerFee": 0,
+    "takerFee": 10 ** 16,
+    "makerAssetAmount": 10 ** 18,
+    "takerAssetAmount": 5 * 10 ** 17,
+    "expirationTimeSeconds": 1577836800,
+}
+
+
+def test_order_hasher__matches_generate_order_hash_hex():
+    """Test that batch hashes are identical to one-off hashes."""
+    orders = [dict(ORDER, salt=salt) for salt in range(5)]
+
+    hasher = OrderHasher(EXCHANGE_ADDRESS, 1337)
+
+    assert list(hasher.order_hashes_hex(orders)) == [
+        generate_order_hash_hex(order, EXCHANGE_ADDRESS, 1337)
+        for order in orders
+    ]
+    assert [
+        order_hash.hex() for order_hash in hasher.order_hashes(orders)
+    ] == list(hasher.order_hashes_hex(orders))
+
+
+def test_order_hasher__without_validation():
+    """Test that disabling validation doesn't change the hash."""
+    order = dict(ORDER, salt=1)
+
+    assert OrderHasher(EXCHANGE_ADDRESS, 50, validate=False).order_hash_hex(
+        order
+    ) == generate_order_hash_hex(order, EXCHANGE_ADDRESS, 50)
+
+
+def test_order_hasher__validates_by_default():
+    """Test that an invalid order is rejected when validating."""
+    order = dict(ORDER, makerAddress="0xff")
+
+    with pytest.raises(Exception):
+        OrderHasher(EXCHANGE_ADDRESS, 1337).order_hash(order)
+
+
+def test_order_hasher__bad_exchange_address():
+    """Test that a non-address `exchange_address` raises a ValueError."""
+    with pytest.raises(ValueError):
+        OrderHasher("0xff", 1337)
+
+
+def test_order_hasher__digest_cache():
+    """Test that repeated asset data is answered from the digest cache."""
+    digest_cache = BoundedMemo(_keccak_asset_data, maxsize=16)
+    hasher = OrderHasher(EXCHANGE_ADDRESS, 1337, digest_cache=digest_cache)
+
+    hashes = list(
+        hasher.order_hashes([dict(ORDER, salt=salt) for salt in range(3)])
+    )
+
+    # four distinct asset data values, each looked up once per order:
+    assert digest_cache.misses == 4
+    assert digest_cache.hits == 3 * 4 - 4
+    assert hashes[0] == OrderHasher(EXCHANGE_ADDRESS, 1337).order_hash(
+        dict(ORDER, salt=0)
+    )
+
+
+def test_order_hasher__validation_policy(monkeypatch):
+    """Test that each order is validated once, as the policy directs."""
+    policy = ValidationPolicy(ValidationMode.ONCE_PER_OBJECT)
+    monkeypatch.setattr(json_schemas, "_VALIDATION_POLICY", policy)
+    orders = [dict(ORDER, salt=salt) for salt in range(3)]
+
+    hasher = OrderHasher(EXCHANGE_ADDRESS, 1337)
+    list(hasher.order_hashes(orders))
+    assert (policy.validations, policy.skips) == (3, 0)
+
+    generate_order_hash_hex(orders[0], EXCHANGE_ADDRESS, 1337)
+    list(hasher.order_hashes(orders))
+    assert (policy.validations, policy.skips) == (3, 4)
+
+    policy.mode = ValidationMode.TRUSTED
+    bad_order = dict(orders[0], makerAddress="0x1234")
+    with pytest.raises(ValueError):
+        # still not hashable, but no longer rejected by validation:
+        hasher.order_hash(bad_order)
+    assert policy.validations == 3
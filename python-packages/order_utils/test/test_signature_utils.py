@@ -1,13 +1,46 @@
 """Tests of zero_ex.order_utils.signature_utils."""
 
+from eth_account import Account
+from eth_keys.datatypes import PrivateKey
+from eth_utils import to_checksum_address
 import pytest
 from web3 import Web3
+from web3.providers.base import BaseProvider
 
+from zero_ex.contract_wrappers.session import ProviderSession
 from zero_ex.contract_wrappers.exchange.exceptions import (
     SignatureError,
     SignatureErrorCodes,
 )
-from zero_ex.order_utils import is_valid_signature, sign_hash_to_bytes
+from zero_ex.dev_utils.memoize import ExpiringCache
+import zero_ex.order_utils
+from zero_ex.order_utils import (
+    is_valid_signature,
+    is_valid_signature_locally,
+    sign_hash,
+    sign_hash_locally,
+    sign_hash_to_bytes,
+    sign_hashes_locally,
+    SignatureValidityCache,
+)
+
+
+# nothing listens here, so any attempt to use it will raise:
+UNREACHABLE_PROVIDER = Web3.HTTPProvider("http://127.0.0.1:1")
+
+SIGNER_ADDRESS = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+
+DATA = "0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0"
+
+EIP712_SIGNATURE = (
+    "0x1c6e5acdddb9acb1e37e3db999f3c96a0ff9042a96e0beb0c33b5ea6ee61d4820f"
+    + "468b7faf591d141697424da30071703f563359fe3346ba90674e9d59672e97b502"
+)
+
+ETH_SIGN_SIGNATURE = (
+    "0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc33"
+    + "40349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403"
+)
 
 
 def test_is_valid_signature__provider_wrong_type():
@@ -167,3 +200,350 @@ def test_sign_hash_to_bytes_and_validate__golden_path():
     )
 
     assert is_valid is True
+
+
+def test_is_valid_signature__eip712_and_eth_sign_checked_locally():
+    """Test that EIP712 and ETH_SIGN signatures need no provider access."""
+    for signature in (EIP712_SIGNATURE, ETH_SIGN_SIGNATURE):
+        assert is_valid_signature(
+            UNREACHABLE_PROVIDER, DATA, signature, SIGNER_ADDRESS
+        )
+        assert not is_valid_signature(
+            UNREACHABLE_PROVIDER,
+            DATA,
+            signature,
+            "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+        )
+
+
+def test_is_valid_signature_locally__wrong_data():
+    """Test that a signature over other data is rejected."""
+    assert not is_valid_signature_locally(
+        "0x" + "00" * 32, EIP712_SIGNATURE, SIGNER_ADDRESS
+    )
+
+
+def test_is_valid_signature_locally__bad_v():
+    """Test that a signature with a v other than 27 or 28 is rejected."""
+    assert not is_valid_signature_locally(
+        DATA, "0x00" + EIP712_SIGNATURE[4:], SIGNER_ADDRESS
+    )
+
+
+def test_is_valid_signature_locally__eip712_vs_eth_sign():
+    """Test that the type byte determines how the hash is recovered."""
+    assert not is_valid_signature_locally(
+        DATA, EIP712_SIGNATURE[:-2] + "03", SIGNER_ADDRESS
+    )
+
+
+def test_is_valid_signature_locally__on_chain_types():
+    """Test that signature types needing the Exchange raise a ValueError."""
+    for type_byte in ("04", "05", "06"):
+        with pytest.raises(ValueError):
+            is_valid_signature_locally(
+                DATA, EIP712_SIGNATURE[:-2] + type_byte, SIGNER_ADDRESS
+            )
+
+
+def test_is_valid_signature__falls_back_to_exchange():
+    """Test that other signature types are passed on to the provider."""
+    with pytest.raises(Exception):
+        is_valid_signature(
+            UNREACHABLE_PROVIDER,
+            DATA,
+            EIP712_SIGNATURE[:-2] + "04",
+            SIGNER_ADDRESS,
+        )
+
+
+def test_signature_validity_cache__hits():
+    """Test that repeated verifications are answered from the cache."""
+    cache = SignatureValidityCache()
+    for _ in range(3):
+        assert cache.is_valid_signature(
+            UNREACHABLE_PROVIDER, DATA, EIP712_SIGNATURE, SIGNER_ADDRESS
+        )
+    # differently-cased hex is the same signature:
+    assert cache.is_valid_signature(
+        UNREACHABLE_PROVIDER,
+        DATA.upper().replace("0X", "0x"),
+        EIP712_SIGNATURE,
+        SIGNER_ADDRESS,
+    )
+    assert (cache.hits, cache.misses, cache.currsize) == (3, 1, 1)
+
+
+def test_signature_validity_cache__on_chain_ttl(monkeypatch):
+    """Test that on-chain signature types expire sooner."""
+    calls = []
+
+    def _is_valid_signature(*args):
+        calls.append(args)
+        return True
+
+    monkeypatch.setattr(
+        zero_ex.order_utils, "is_valid_signature", _is_valid_signature
+    )
+    monkeypatch.setattr(
+        zero_ex.order_utils,
+        "_exchange_deployment",
+        lambda provider: (1337, "0x" + "00" * 20),
+    )
+    now = [0.0]
+    cache = SignatureValidityCache(
+        ttl=100, on_chain_ttl=10, clock=lambda: now[0]
+    )
+    wallet_signature = EIP712_SIGNATURE[:-2] + "04"
+
+    for signature in (EIP712_SIGNATURE, wallet_signature):
+        cache.is_valid_signature(
+            UNREACHABLE_PROVIDER, DATA, signature, SIGNER_ADDRESS
+        )
+    now[0] = 50.0
+    for signature in (EIP712_SIGNATURE, wallet_signature):
+        cache.is_valid_signature(
+            UNREACHABLE_PROVIDER, DATA, signature, SIGNER_ADDRESS
+        )
+
+    assert [args[2] for args in calls] == [
+        EIP712_SIGNATURE,
+        wallet_signature,
+        wallet_signature,
+    ]
+
+
+def test_signature_validity_cache__on_chain_types_per_deployment(monkeypatch,):
+    """Test that on-chain outcomes aren't shared across deployments."""
+    providers = [
+        Web3.HTTPProvider(f"http://127.0.0.1:{port}") for port in (1, 2)
+    ]
+    deployments = {
+        providers[0]: (1, "0x" + "11" * 20),
+        providers[1]: (1337, "0x" + "22" * 20),
+    }
+    monkeypatch.setattr(
+        zero_ex.order_utils, "_exchange_deployment", deployments.get
+    )
+    monkeypatch.setattr(
+        zero_ex.order_utils,
+        "is_valid_signature",
+        lambda provider, *args: provider is providers[0],
+    )
+    cache = SignatureValidityCache()
+    wallet_signature = EIP712_SIGNATURE[:-2] + "04"
+
+    for _ in range(2):
+        assert [
+            cache.is_valid_signature(
+                provider, DATA, wallet_signature, SIGNER_ADDRESS
+            )
+            for provider in providers
+        ] == [True, False]
+    assert (cache.hits, cache.misses, cache.currsize) == (2, 2, 2)
+
+
+def test_signature_validity_cache__deployment_looked_up_once(monkeypatch):
+    """Test that cached on-chain outcomes cost no calls to the provider."""
+    lookups = []
+
+    def _exchange_deployment(provider):
+        lookups.append(provider)
+        return (1337, "0x" + "00" * 20)
+
+    monkeypatch.setattr(
+        zero_ex.order_utils, "_exchange_deployment", _exchange_deployment
+    )
+    monkeypatch.setattr(
+        zero_ex.order_utils, "is_valid_signature", lambda *args: True
+    )
+    cache = SignatureValidityCache()
+
+    for _ in range(3):
+        assert cache.is_valid_signature(
+            UNREACHABLE_PROVIDER,
+            DATA,
+            EIP712_SIGNATURE[:-2] + "04",
+            SIGNER_ADDRESS,
+        )
+    assert lookups == [UNREACHABLE_PROVIDER]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    cache.cache_clear()
+    cache.is_valid_signature(
+        UNREACHABLE_PROVIDER,
+        DATA,
+        EIP712_SIGNATURE[:-2] + "04",
+        SIGNER_ADDRESS,
+    )
+    assert len(lookups) == 2
+
+
+def test_signature_validity_cache__errors_not_cached():
+    """Test that failed verifications are retried."""
+    cache = SignatureValidityCache()
+    for _ in range(2):
+        with pytest.raises(Exception):
+            cache.is_valid_signature(
+                UNREACHABLE_PROVIDER,
+                DATA,
+                EIP712_SIGNATURE[:-2] + "04",
+                SIGNER_ADDRESS,
+            )
+    assert cache.currsize == 0
+
+
+PRIVATE_KEY_HEX = (
+    "f2f48ee19680706196e2e339e5da3491186e0c4c5030670656b0e0164837257d"
+)
+
+ORDER_HASH_HEX = (
+    "0x34decbedc118904df65f379a175bb39ca18209d6ce41d5ed549d54e6e0a95004"
+)
+
+
+def test_sign_hash_locally__matches_eth_sign():
+    """Test that local signing reproduces the node's ETH_SIGN signature."""
+    for private_key_or_account in (
+        PRIVATE_KEY_HEX,
+        "0x" + PRIVATE_KEY_HEX,
+        bytes.fromhex(PRIVATE_KEY_HEX),
+        PrivateKey(bytes.fromhex(PRIVATE_KEY_HEX)),
+        Account().from_key(PRIVATE_KEY_HEX),
+    ):
+        assert (
+            sign_hash_locally(private_key_or_account, ORDER_HASH_HEX)
+            == "0x1b117902c86dfb95fe0d1badd983ee166ad259b27acb220174cbb4460d872871137feabdfe76e05924b484789f79af4ee7fa29ec006cedce1bbf369320d034e10b03"  # noqa: E501 (line too long)
+        )
+
+
+def test_sign_hash_locally__eip712():
+    """Test that EIP712 signatures sign the hash itself, and validate."""
+    signature = sign_hash_locally(PRIVATE_KEY_HEX, DATA, "EIP712")
+
+    assert signature == EIP712_SIGNATURE
+    assert is_valid_signature_locally(DATA, signature, SIGNER_ADDRESS)
+
+
+def test_sign_hash_locally__bad_arguments():
+    """Test that unusable keys, types and hashes are rejected."""
+    with pytest.raises(TypeError):
+        sign_hash_locally(123, DATA)
+    with pytest.raises(ValueError):
+        sign_hash_locally(PRIVATE_KEY_HEX, DATA, "WALLET")
+    with pytest.raises(ValueError):
+        sign_hash_locally(PRIVATE_KEY_HEX, "0xabcd")
+
+
+def test_sign_hashes_locally():
+    """Test that batch signatures match one-off signatures, in order."""
+    hash_hexes = ["0x" + bytes([i]).hex() * 32 for i in range(5)]
+
+    signatures = sign_hashes_locally(PRIVATE_KEY_HEX, hash_hexes, "EIP712")
+
+    assert signatures == [
+        sign_hash_locally(PRIVATE_KEY_HEX, hash_hex, "EIP712")
+        for hash_hex in hash_hexes
+    ]
+    assert all(
+        is_valid_signature_locally(hash_hex, signature, SIGNER_ADDRESS)
+        for hash_hex, signature in zip(hash_hexes, signatures)
+    )
+
+
+class _VrsSigningProvider(BaseProvider):  # pylint: disable=abstract-method
+    """A node whose eth_sign returns signatures laid out as v, r, s."""
+
+    def __init__(self, endpoint_uri):
+        """Pretend to be a node at `endpoint_uri`."""
+        self.endpoint_uri = endpoint_uri
+
+    def make_request(self, method, params):
+        """Answer eth_sign with the test key."""
+        assert method == "eth_sign"
+        signature = sign_hash_locally(
+            PRIVATE_KEY_HEX, "0x" + params[1][2:].rjust(64, "0")
+        )
+        return {"jsonrpc": "2.0", "id": 1, "result": signature[:-2]}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Always be connected."""
+        return True
+
+
+def test_sign_hash__remembers_layout(monkeypatch):
+    """Test that the signature layout is only guessed at once per node."""
+    verifications = []
+
+    def _is_valid_signature(*args):
+        verifications.append(args)
+        return is_valid_signature(*args)
+
+    monkeypatch.setattr(
+        zero_ex.order_utils, "is_valid_signature", _is_valid_signature
+    )
+    monkeypatch.setattr(
+        zero_ex.order_utils, "_ETH_SIGN_LAYOUTS", ExpiringCache(maxsize=1)
+    )
+    hash_hexes = ["0x" + bytes([i]).hex() * 32 for i in range(1, 6)]
+
+    signatures = [
+        sign_hash(
+            _VrsSigningProvider("http://vrs.example"),
+            to_checksum_address(SIGNER_ADDRESS),
+            hash_hex,
+        )
+        for hash_hex in hash_hexes
+    ]
+
+    assert signatures == sign_hashes_locally(PRIVATE_KEY_HEX, hash_hexes)
+    # the layout was guessed for the first signature only:
+    assert {args[1] for args in verifications} == {hash_hexes[0]}
+    layouts = zero_ex.order_utils._ETH_SIGN_LAYOUTS  # pylint: disable=W0212
+    assert (
+        layouts.get("http://vrs.example").__name__
+        == "_parse_signature_hex_as_vrs"
+    )
+
+    # layouts are remembered for a bounded number of nodes:
+    sign_hash(
+        _VrsSigningProvider("http://other.example"),
+        to_checksum_address(SIGNER_ADDRESS),
+        hash_hexes[0],
+    )
+    assert layouts.currsize == 1
+    assert layouts.get("http://vrs.example") is None
+
+
+class _ChainIdProvider(BaseProvider):  # pylint: disable=abstract-method
+    """A node on the Ganache chain, counting requests for its chain ID."""
+
+    def __init__(self):
+        """Start with no requests counted."""
+        self.chain_id_requests = 0
+
+    def make_request(self, method, params):
+        """Answer eth_chainId."""
+        assert method == "eth_chainId"
+        self.chain_id_requests += 1
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(1337)}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Always be connected."""
+        return True
+
+
+def test_is_valid_signature__session():
+    """Test that a session is accepted, and its Exchange wrapper reused."""
+    provider = _ChainIdProvider()
+    session = ProviderSession(provider)
+
+    assert is_valid_signature(session, DATA, EIP712_SIGNATURE, SIGNER_ADDRESS)
+    exchange = zero_ex.order_utils._exchange_for(  # pylint: disable=W0212
+        session
+    )
+    assert (
+        zero_ex.order_utils._exchange_for(session)  # pylint: disable=W0212
+        is exchange
+    )
+    assert provider.chain_id_requests == 1
@@ -0,0 +1,181 @@
+"""Tests of zero_ex.order_utils.SignedOrder."""
+
+import pickle
+from typing import Any, cast, Optional, Union
+
+import pytest
+
+from zero_ex.json_schemas import ValidationResults
+from zero_ex.order_utils import (
+    ASSET_DATA_DIGEST_CACHE,
+    generate_order_hash_hex,
+    OrderHasher,
+    SignedOrder,
+)
+from zero_ex.order_utils.asset_data_utils import (
+    decode_asset_data,
+    encode_erc20,
+    encode_erc721,
+)
+from zero_ex.order_utils.compact_order import CompactOrder
+
+
+EXCHANGE_ADDRESS = "0x48bacb9266a570d521063ef5dd96e61686dbe788"
+TOKEN_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+SIGNATURE = "0x1B" + "00" * 64 + "02"
+
+ORDER = {
+    "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+    "takerAddress": "0x0000000000000000000000000000000000000000",
+    "feeRecipientAddress": "0x6ecbe1db9ef729cbe972c83fb886247691fb6beb",
+    "senderAddress": "0x0000000000000000000000000000000000000000",
+    "makerAssetAmount": 10 ** 18,
+    "takerAssetAmount": 5 * 10 ** 17,
+    "makerFee": 0,
+    "takerFee": 10 ** 16,
+    "expirationTimeSeconds": 1577836800,
+    "salt": 1,
+    "makerAssetData": encode_erc20(TOKEN_ADDRESS),
+    "takerAssetData": encode_erc721(TOKEN_ADDRESS, 7),
+    "makerFeeAssetData": b"",
+    "takerFeeAssetData": encode_erc20(TOKEN_ADDRESS),
+}
+
+
+def _signed_order(
+    order: Optional[Union[dict, CompactOrder]] = None,
+    signature: Union[str, bytes] = SIGNATURE,
+    exchange_address: str = EXCHANGE_ADDRESS,
+    chain_id: int = 1337,
+) -> SignedOrder:
+    return SignedOrder(
+        cast(Any, ORDER if order is None else order),
+        signature,
+        exchange_address,
+        chain_id,
+    )
+
+
+def test_signed_order_facts():
+    """Test that each fact is what the standalone functions compute."""
+    signed_order = _signed_order()
+
+    assert signed_order.hash_hex == generate_order_hash_hex(
+        ORDER, EXCHANGE_ADDRESS, 1337
+    )
+    assert signed_order.is_valid
+    assert signed_order.validation_error is None
+    signed_order.assert_valid()
+    assert signed_order.maker_asset == decode_asset_data(
+        ORDER["makerAssetData"]
+    )
+    assert signed_order.taker_asset.token_id == 7
+    assert signed_order.jsdict == CompactOrder.from_order(ORDER).to_jsdict(
+        1337, EXCHANGE_ADDRESS, SIGNATURE.lower()
+    )
+    assert SignedOrder.from_jsdict(signed_order.jsdict) == signed_order
+
+
+def test_signed_order_computes_each_fact_once(monkeypatch):
+    """Test that the hash, validation and JSON are computed only once."""
+    signed_order = _signed_order()
+    digests = ASSET_DATA_DIGEST_CACHE.hits + ASSET_DATA_DIGEST_CACHE.misses
+
+    order_hash = signed_order.hash
+    assert signed_order.hash is order_hash
+    assert signed_order.json is signed_order.json
+    assert signed_order.maker_asset is signed_order.maker_asset
+    assert (
+        ASSET_DATA_DIGEST_CACHE.hits + ASSET_DATA_DIGEST_CACHE.misses
+        == digests + 4
+    )
+
+    assert signed_order.is_valid
+    monkeypatch.setattr("zero_ex.json_schemas.validate_many", pytest.fail)
+    assert signed_order.is_valid
+    # the remembered JSON form can't be changed through a copy:
+    signed_order.jsdict["salt"] = "2"
+    assert signed_order.jsdict["salt"] == "1"
+
+
+def test_signed_order_invalid(monkeypatch):
+    """Test that a schema violation is remembered, and raised."""
+    # a stand-in for a jsonschema.ValidationError:
+    violation = ValueError("not a signed order")
+    validations = []
+
+    def _validate_many(_items, schema_id):
+        validations.append(schema_id)
+        return ValidationResults([], {0: violation})
+
+    monkeypatch.setattr("zero_ex.json_schemas.validate_many", _validate_many)
+    signed_order = _signed_order()
+
+    with pytest.raises(ValueError):
+        signed_order.assert_valid()
+    assert not signed_order.is_valid
+    assert signed_order.validation_error is violation
+    assert validations == ["/signedOrderSchema"]
+
+
+def test_signed_order_construction_errors():
+    """Test that unpackable orders and malformed signatures are refused."""
+    with pytest.raises(ValueError):
+        _signed_order(signature="not hex")
+    with pytest.raises(TypeError):
+        _signed_order(signature=None)
+    with pytest.raises(ValueError):
+        _signed_order(exchange_address="0x00")
+    with pytest.raises(ValueError):
+        _signed_order(order=dict(ORDER, makerFee=-1))
+
+
+def test_signed_order_is_immutable_mapping():
+    """Test that it reads as an `Order` with checksummed addresses."""
+    signed_order = _signed_order()
+
+    assert len(signed_order) == len(ORDER)
+    assert list(signed_order) == list(ORDER)
+    assert signed_order["makerAddress"] == (
+        "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+    )
+    assert signed_order["makerAssetData"] == ORDER["makerAssetData"]
+    assert CompactOrder.from_order(signed_order.to_order()) == (
+        signed_order.compact_order
+    )
+    assert signed_order.signature == SIGNATURE.lower()
+    with pytest.raises(AttributeError):
+        signed_order.chain_id = 1
+    with pytest.raises(AttributeError):
+        del signed_order.signature
+
+
+def test_signed_order_equality_and_pickling():
+    """Test equality by definition, and that pickling keeps it."""
+    signed_order = _signed_order()
+    assert signed_order.is_valid
+
+    copy = pickle.loads(pickle.dumps(signed_order))
+
+    assert copy == signed_order
+    assert hash(copy) == hash(signed_order)
+    assert copy == _signed_order(
+        order=CompactOrder.from_order(ORDER),
+        signature=bytes.fromhex(SIGNATURE[2:]),
+        exchange_address=EXCHANGE_ADDRESS.upper().replace("0X", "0x"),
+    )
+    assert copy != _signed_order(chain_id=1)
+    assert copy != ORDER
+    assert len({copy, signed_order}) == 1
+
+
+def test_order_hasher_accepts_signed_orders():
+    """Test that a hasher reuses the hash of an order for its deployment."""
+    signed_order = _signed_order()
+    hasher = OrderHasher(EXCHANGE_ADDRESS.upper().replace("0X", "0x"), 1337)
+    other_hasher = OrderHasher(EXCHANGE_ADDRESS, 1)
+
+    assert hasher.order_hash(signed_order) is signed_order.hash
+    assert other_hasher.order_hash(signed_order) == other_hasher.order_hash(
+        ORDER
+    )
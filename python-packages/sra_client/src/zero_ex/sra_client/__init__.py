@@ -164,6 +164,12 @@ Now we'll apply that configuration to our order before proceeding:
 ... )[1]
 200
 
+A `zero_ex.order_utils.SignedOrder`:code: remembers its hash, its validity
+and its JSON form, so that none of them is recomputed as the order is posted
+and later filled.  To post one, pass its remembered JSON form::
+
+    relayer.post_order_with_http_info(signed_order_schema=signed_order.jsdict)
+
 Get Order
 ---------
 